@@ -0,0 +1,42 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+"""
+gunicorn settings of the training manager, each can be overridden by its environment variable.
+"""
+
+import os
+from os import getenv
+
+bind = f"0.0.0.0:{getenv('TRAINING_MANAGER_PORT', '32002').rstrip()}"
+# Each worker is a process with its own background handlers and database pool, see trainingmgr.wsgi
+workers = int(getenv('GUNICORN_WORKERS', '4').rstrip())
+# Each open status stream or event feed holds a thread, stream_threads threads are added for them so
+# that they never take the threads of the other requests
+stream_threads = int(getenv('GUNICORN_STREAM_THREADS', '16').rstrip())
+# The workers, forked after this file is read, accept as many streams as they have threads for them
+os.environ.setdefault('STATUS_STREAM_MAX_WATCHERS', str(stream_threads))
+threads = int(getenv('GUNICORN_THREADS', '8').rstrip()) + stream_threads
+worker_class = "gthread"
+keepalive = int(getenv('GUNICORN_KEEPALIVE', '5').rstrip())
+timeout = int(getenv('GUNICORN_TIMEOUT', '120').rstrip())
+graceful_timeout = int(getenv('GUNICORN_GRACEFUL_TIMEOUT', '30').rstrip())
+# Workers are restarted after this many requests, 0 never restarts them
+max_requests = int(getenv('GUNICORN_MAX_REQUESTS', '0').rstrip())
+max_requests_jitter = max_requests // 10
+accesslog = "-"
@@ -0,0 +1,95 @@
+# ==================================================================================
+#
+#      Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# ==================================================================================
+
+"""
+Microbenchmark of the list responses, run from the repository root with trainingmgr installed, or
+with PYTHONPATH=. and the requirements installed:
+
+    python tests/perf/bench_serializer.py [--jobs N] [--repeat R]
+
+or through tox:
+
+    tox -e bench
+
+It builds N training jobs and N feature groups, serializes them with the marshmallow schemas and
+jsonify, then with the compiled serializers, and fails if the response bodies are not byte-identical.
+"""
+
+import argparse
+import json
+import sys
+import time
+from flask import Flask, jsonify
+from dotenv import load_dotenv
+load_dotenv('tests/test.env')
+from trainingmgr.models import TrainingJob, FeatureGroup, ModelID
+from trainingmgr.schemas import TrainingJobSchema, FeatureGroupSchema
+from trainingmgr.schemas.fast_serializer import TRAININGJOB_SERIALIZER, FEATUREGROUP_SERIALIZER, \
+    json_response, orjson
+
+
+def build_trainingjobs(count):
+    return [TrainingJob(id=index, training_config=json.dumps({"description": f"job {index}", "epochs": index}),
+                        modelId=ModelID(id=index, modelname=f"qoe{index % 50}", modelversion=str(index)),
+                        model_location="s3://models/qoe", consumer_rapp_id="rapp-1",
+                        notification_url=None if index % 2 else "http://rapp/notify")
+            for index in range(count)]
+
+
+def build_featuregroups(count):
+    return [FeatureGroup(id=index, featuregroup_name=f"fg{index}", feature_list="pdcpBytesDl,pdcpBytesUl",
+                         enable_dme=bool(index % 2), host="influxdb", port="8086",
+                         dme_port=None if index % 2 else "31823")
+            for index in range(count)]
+
+
+def best_of(repeat, function):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = function()
+        timings.append(time.perf_counter() - start)
+    return body, min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=10000, help="rows of each list (default 10000)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs of each serializer, the best is kept (default 5)")
+    args = parser.parse_args()
+
+    cases = [
+        ("training jobs", build_trainingjobs(args.jobs), TrainingJobSchema, TRAININGJOB_SERIALIZER),
+        ("feature groups", build_featuregroups(args.jobs), FeatureGroupSchema, FEATUREGROUP_SERIALIZER),
+    ]
+    print(f"{args.jobs} rows, best of {args.repeat} runs, orjson {'installed' if orjson else 'not installed'}")
+    identical = True
+    with Flask(__name__).app_context():
+        for name, rows, schema, serializer in cases:
+            expected, schema_time = best_of(args.repeat, lambda: jsonify(schema(many=True).dump(rows)).get_data())
+            body, compiled_time = best_of(args.repeat, lambda: json_response(serializer.dump_many(rows)).get_data())
+            print(f"{name:15} marshmallow + jsonify {schema_time * 1000:8.1f} ms   compiled {compiled_time * 1000:8.1f} ms"
+                  f"   x{schema_time / compiled_time:.1f}   {len(body)} bytes")
+            if body != expected:
+                print(f"{name}: the compiled serializer body differs from the schema body", file=sys.stderr)
+                identical = False
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
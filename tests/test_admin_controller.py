@@ -0,0 +1,120 @@
+# ==================================================================================
+#
+#      Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# ==================================================================================
+import sys
+import pytest
+from flask import Flask
+from unittest.mock import patch, MagicMock
+from dotenv import load_dotenv
+load_dotenv('tests/test.env')
+
+#mock ModelMetricsSdk before importing
+mock_modelmetrics_sdk = MagicMock()
+sys.modules["trainingmgr.handler.async_handler"] = MagicMock(ModelMetricsSdk=mock_modelmetrics_sdk)
+from trainingmgr.controller.admin_controller import admin_controller
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.register_blueprint(admin_controller)
+    app.config["TESTING"] = True
+    return app
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+class TestWorkQueue:
+    @patch("trainingmgr.controller.admin_controller.get_work_schedule")
+    def test_success(self, mock_work_queue, client):
+        work = [{"trainingjob_id": 1, "action": "POLL_DATA_EXTRACTION", "next_run_in": 4.2, "attempts": 3, "queued_for": 80.1, "locked_by": None}]
+        mock_work_queue.return_value = work
+        response = client.get("/admin/work-queue")
+
+        assert response.status_code == 200
+        assert response.get_json() == {"work": work}
+
+    @patch("trainingmgr.controller.admin_controller.get_work_schedule", side_effect=Exception("boom"))
+    def test_unexpected_error(self, mock_work_queue, client):
+        response = client.get("/admin/work-queue")
+
+        assert response.status_code == 500
+
+
+class TestReplica:
+    @patch("trainingmgr.controller.admin_controller.get_replica_info", return_value={"replica_id": "tm-0-42", "leader": True})
+    def test_success(self, mock_replica_info, client):
+        response = client.get("/admin/replica")
+
+        assert response.status_code == 200
+        assert response.get_json() == {"replica_id": "tm-0-42", "leader": True}
+
+
+class TestNotifications:
+    @patch("trainingmgr.controller.admin_controller.get_notification_stats")
+    def test_success(self, mock_notification_stats, client):
+        stats = {"queue_depth": 2, "delivered": 10, "failed": 1, "dropped": 0, "coalesced": 3,
+                 "latency_avg": 0.05, "latency_max": 0.4}
+        mock_notification_stats.return_value = stats
+        response = client.get("/admin/notifications")
+
+        assert response.status_code == 200
+        assert response.get_json() == stats
+
+
+class TestHttpClients:
+    @patch("trainingmgr.controller.admin_controller.get_http_client_stats")
+    def test_success(self, mock_http_client_stats, client):
+        stats = {"kf_adapter": {"count": 1, "sum": 0.02, "errors": 0, "buckets": {"0.025": 1, "+Inf": 1}}}
+        mock_http_client_stats.return_value = stats
+        response = client.get("/admin/http-clients")
+
+        assert response.status_code == 200
+        assert response.get_json() == stats
+
+
+class TestCircuitBreakers:
+    @patch("trainingmgr.controller.admin_controller.get_circuit_breaker_states")
+    def test_success(self, mock_circuit_breaker_states, client):
+        states = {"mme": {"state": "open", "failures": 5, "retry_in": 12.5, "in_flight": 0, "max_concurrent": 20}}
+        mock_circuit_breaker_states.return_value = states
+        response = client.get("/admin/circuit-breakers")
+
+        assert response.status_code == 200
+        assert response.get_json() == states
+
+
+class TestCaches:
+    @patch("trainingmgr.controller.admin_controller.get_modelinfo_cache_stats",
+           return_value={"size": 3, "hits": 40, "misses": 5, "coalesced": 2})
+    def test_success(self, mock_modelinfo_cache_stats, client):
+        response = client.get("/admin/caches")
+
+        assert response.status_code == 200
+        assert response.get_json() == {"mme": {"size": 3, "hits": 40, "misses": 5, "coalesced": 2}}
+
+
+class TestDbPool:
+    @patch("trainingmgr.controller.admin_controller.get_db_pool_stats",
+           return_value={"size": 5, "max_overflow": 10, "checked_out": 3, "checked_in": 2, "overflow": 0,
+                         "saturation": 0.2, "connects": 5, "checkouts": 420, "invalidations": 0})
+    def test_success(self, mock_db_pool_stats, client):
+        response = client.get("/admin/db-pool")
+
+        assert response.status_code == 200
+        assert response.get_json()["saturation"] == 0.2
@@ -0,0 +1,66 @@
+# ==================================================================================
+#
+#      Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# ==================================================================================
+
+from unittest.mock import MagicMock
+from trainingmgr.db.advisory_lock_db import LeaderElection
+
+
+def make_engine(*acquired):
+    engine = MagicMock()
+    connections = []
+    for result in acquired:
+        conn = MagicMock()
+        conn.execute.return_value.scalar.return_value = result
+        connections.append(conn)
+    engine.connect.side_effect = connections
+    return engine, connections
+
+
+class TestLeaderElection:
+    def test_lock_held_by_other_replica(self):
+        engine, connections = make_engine(False)
+        leader = LeaderElection(engine, 1, "replica-1", MagicMock())
+        assert leader.try_acquire() is False
+        assert leader.is_leader is False
+        connections[0].close.assert_called_once()
+
+    def test_leader_keeps_its_connection(self):
+        engine, connections = make_engine(True)
+        leader = LeaderElection(engine, 1, "replica-1", MagicMock())
+        assert leader.try_acquire() is True
+        assert leader.try_acquire() is True
+        assert engine.connect.call_count == 1
+        connections[0].close.assert_not_called()
+
+    def test_lost_connection_is_elected_again(self):
+        engine, connections = make_engine(True, False)
+        leader = LeaderElection(engine, 1, "replica-1", MagicMock())
+        assert leader.try_acquire() is True
+        connections[0].execute.side_effect = Exception("connection lost")
+        # Another replica has taken over in the meantime
+        assert leader.try_acquire() is False
+        assert leader.is_leader is False
+        connections[0].close.assert_called_once()
+
+    def test_release(self):
+        engine, connections = make_engine(True)
+        leader = LeaderElection(engine, 1, "replica-1", MagicMock())
+        leader.try_acquire()
+        leader.release()
+        assert leader.is_leader is False
+        connections[0].close.assert_called_once()
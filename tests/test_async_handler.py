@@ -0,0 +1,386 @@
+# ==================================================================================
+#
+#      Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# ==================================================================================
+import sys
+import importlib
+import threading
+import pytest
+from unittest.mock import patch, MagicMock
+from dotenv import load_dotenv
+from trainingmgr.common.exceptions_utls import TMException, DownstreamUnavailableException
+load_dotenv('tests/test.env')
+
+# Other test modules replace the async handler by a MagicMock, load the real one with a mocked ModelMetricsSdk
+sys.modules.pop("trainingmgr.handler.async_handler", None)
+with patch('modelmetricsdk.model_metrics_sdk.ModelMetricsSdk'):
+    async_handler = importlib.import_module("trainingmgr.handler.async_handler")
+
+
+@pytest.fixture
+def trainingjob():
+    trainingjob = MagicMock()
+    trainingjob.id = 1
+    trainingjob.training_config = {"dataPipeline": {"feature_group_name": "fg"}}
+    trainingjob.deletion_in_progress = False
+    return trainingjob
+
+
+class TestPollBackoff:
+    def test_interval_backs_off_up_to_maximum(self):
+        backoff = async_handler.PollBackoff(10, 300, 2, 0)
+        assert backoff.interval(0) == 10
+        assert backoff.interval(2) == 40
+        assert backoff.interval(10) == 300
+
+    def test_jitter_stays_in_bounds(self):
+        backoff = async_handler.PollBackoff(10, 300, 2, 0.2)
+        intervals = [backoff.interval(0) for _ in range(100)]
+        assert all(8 <= interval <= 12 for interval in intervals)
+
+
+class TestDataExtractionJobs:
+    @patch.object(async_handler, 'enqueue_work')
+    def test_add_job_queues_status_checks(self, mock_enqueue_work):
+        with patch.object(async_handler, 'POLL_BACKOFF', async_handler.PollBackoff(10, 300, 2, 0)):
+            async_handler.add_data_extraction_job(1)
+        mock_enqueue_work.assert_called_once_with(1, "POLL_DATA_EXTRACTION", 10)
+
+    @patch.object(async_handler, 'remove_work', side_effect=[1, 0])
+    def test_job_is_claimed_once(self, mock_remove_work):
+        assert async_handler.claim_data_extraction_job(MagicMock(), 1) is True
+        assert async_handler.claim_data_extraction_job(MagicMock(), 1) is False
+        mock_remove_work.assert_called_with(1, "POLL_DATA_EXTRACTION")
+
+    @patch.object(async_handler, 'defer_work')
+    def test_defer_moves_next_check(self, mock_defer_work):
+        async_handler.defer_data_extraction_job(1)
+        mock_defer_work.assert_called_once_with(1, "POLL_DATA_EXTRACTION",
+                                                async_handler.TRAININGMGR_CONFIG_OBJ.data_extraction_reconcile_interval)
+
+
+class TestCheckDataExtractionStatus:
+    @patch.object(async_handler, 'remove_work')
+    @patch.object(async_handler, 'get_trainingjob', return_value=None)
+    def test_deleted_trainingjob_is_removed(self, mock_get_trainingjob, mock_remove_work):
+        async_handler.check_data_extraction_status(MagicMock(), 1)
+        mock_remove_work.assert_called_once_with(1, "POLL_DATA_EXTRACTION")
+
+    @patch.object(async_handler, 'notification_rapp')
+    @patch.object(async_handler, 'change_state_to_failed')
+    @patch.object(async_handler, 'remove_work', return_value=1)
+    @patch.object(async_handler, 'data_extraction_status')
+    @patch.object(async_handler, 'get_trainingjob')
+    def test_extraction_error_fails_trainingjob(self, mock_get_trainingjob, mock_status, mock_remove_work,
+                                                mock_failed, mock_notify, trainingjob):
+        mock_get_trainingjob.return_value = trainingjob
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {'content-type': "application/json"}
+        response.json.return_value = {"task_status": "Error"}
+        mock_status.return_value = response
+
+        async_handler.check_data_extraction_status(MagicMock(), 1)
+
+        mock_remove_work.assert_called_with(1, "POLL_DATA_EXTRACTION")
+        mock_failed.assert_called_once_with(1)
+        mock_notify.assert_called_once_with(1)
+
+    @patch.object(async_handler, 'complete_work')
+    @patch.object(async_handler, 'retry_work')
+    @patch.object(async_handler, 'change_state_to_failed')
+    @patch.object(async_handler, 'remove_work')
+    @patch.object(async_handler, 'data_extraction_status',
+                  side_effect=DownstreamUnavailableException("Data extraction is unavailable"))
+    @patch.object(async_handler, 'get_trainingjob')
+    def test_unavailable_data_extraction_is_polled_again(self, mock_get_trainingjob, mock_status, mock_remove_work,
+                                                         mock_failed, mock_retry_work, mock_complete_work, trainingjob):
+        mock_get_trainingjob.return_value = trainingjob
+        work = {"id": 7, "trainingjob_id": 1, "action": "POLL_DATA_EXTRACTION", "attempts": 2}
+        with patch.object(async_handler, 'POLL_BACKOFF', async_handler.PollBackoff(10, 300, 2, 0)):
+            async_handler.run_lifecycle_work(MagicMock(), work)
+        mock_failed.assert_not_called()
+        mock_remove_work.assert_not_called()
+        mock_retry_work.assert_called_once_with(7, async_handler.WORKER_ID, 80, True)
+        mock_complete_work.assert_not_called()
+
+
+class TestHandleDataExtractionTaskStatus:
+    @patch.object(async_handler, 'handover_work')
+    def test_in_progress_status_is_not_final(self, mock_handover_work, trainingjob):
+        assert async_handler.handle_data_extraction_task_status(MagicMock(), trainingjob, "In-Progress") is False
+        mock_handover_work.assert_not_called()
+
+    @patch.object(async_handler, 'handover_work', side_effect=[True, False])
+    def test_completed_status_queues_pipeline_start_once(self, mock_handover_work, trainingjob):
+        async_handler.WORK_AVAILABLE.clear()
+        assert async_handler.handle_data_extraction_task_status(MagicMock(), trainingjob, "Completed") is True
+        mock_handover_work.assert_called_with(1, "POLL_DATA_EXTRACTION", "START_PIPELINE")
+        assert async_handler.WORK_AVAILABLE.is_set()
+
+        # A second notification of the same final status, e.g. by the poller, is ignored
+        async_handler.WORK_AVAILABLE.clear()
+        assert async_handler.handle_data_extraction_task_status(MagicMock(), trainingjob, "Completed") is True
+        assert not async_handler.WORK_AVAILABLE.is_set()
+
+
+class TestRetryTrainingPipelineStart:
+    @patch.object(async_handler, 'enqueue_work')
+    @patch.object(async_handler, 'transition_steps')
+    def test_start_is_queued_after_backoff(self, mock_transition_steps, mock_enqueue_work):
+        with patch.object(async_handler, 'POLL_BACKOFF', async_handler.PollBackoff(10, 300, 2, 0)):
+            async_handler.retry_training_pipeline_start(1)
+        mock_transition_steps.assert_called_once_with(1,
+            {"DATA_EXTRACTION": "IN_PROGRESS", "DATA_EXTRACTION_AND_TRAINING": "NOT_STARTED"},
+            expected={"DATA_EXTRACTION_AND_TRAINING": "IN_PROGRESS"})
+        mock_enqueue_work.assert_called_once_with(1, "START_PIPELINE", 10)
+
+
+class TestRunLifecycleWork:
+    @patch.object(async_handler, 'complete_work')
+    @patch.object(async_handler, 'retry_work')
+    @patch.object(async_handler, 'check_data_extraction_status')
+    def test_poll_is_retried_with_backoff(self, mock_check, mock_retry_work, mock_complete_work):
+        work = {"id": 7, "trainingjob_id": 1, "action": "POLL_DATA_EXTRACTION", "attempts": 2}
+        with patch.object(async_handler, 'POLL_BACKOFF', async_handler.PollBackoff(10, 300, 2, 0)):
+            async_handler.run_lifecycle_work(MagicMock(), work)
+        mock_check.assert_called_once()
+        mock_retry_work.assert_called_once_with(7, async_handler.WORKER_ID, 80, True)
+        mock_complete_work.assert_not_called()
+
+    @patch.object(async_handler, 'complete_work')
+    @patch.object(async_handler, 'transition_steps', return_value=True)
+    @patch.object(async_handler, 'get_trainingjob')
+    @patch('trainingmgr.service.training_job_service.start_training_pipeline', return_value="run-1")
+    def test_start_pipeline(self, mock_start_pipeline, mock_get_trainingjob, mock_transition_steps,
+                            mock_complete_work, trainingjob):
+        mock_get_trainingjob.return_value = trainingjob
+        work = {"id": 7, "trainingjob_id": 1, "action": "START_PIPELINE", "attempts": 0}
+        async_handler.run_lifecycle_work(MagicMock(), work)
+        mock_transition_steps.assert_called_once_with(1,
+            {"DATA_EXTRACTION": "FINISHED", "DATA_EXTRACTION_AND_TRAINING": "IN_PROGRESS"},
+            expected={"DATA_EXTRACTION": "IN_PROGRESS"})
+        mock_start_pipeline.assert_called_once_with(trainingjob)
+        mock_complete_work.assert_called_once_with(7, async_handler.WORKER_ID)
+
+    @patch.object(async_handler, 'complete_work')
+    @patch.object(async_handler, 'transition_steps')
+    @patch.object(async_handler, 'get_trainingjob')
+    @patch('trainingmgr.service.training_job_service.start_training_pipeline')
+    def test_start_pipeline_of_trainingjob_being_deleted(self, mock_start_pipeline, mock_get_trainingjob,
+                                                         mock_transition_steps, mock_complete_work, trainingjob):
+        trainingjob.deletion_in_progress = True
+        mock_get_trainingjob.return_value = trainingjob
+        work = {"id": 7, "trainingjob_id": 1, "action": "START_PIPELINE", "attempts": 0}
+        async_handler.run_lifecycle_work(MagicMock(), work)
+        mock_transition_steps.assert_not_called()
+        mock_start_pipeline.assert_not_called()
+        mock_complete_work.assert_called_once_with(7, async_handler.WORKER_ID)
+
+    @patch.object(async_handler, 'complete_work')
+    @patch.object(async_handler, 'change_state_to_failed')
+    @patch.object(async_handler, 'transition_steps', return_value=False)
+    @patch.object(async_handler, 'get_trainingjob')
+    @patch('trainingmgr.service.training_job_service.start_training_pipeline')
+    def test_start_pipeline_data_extraction_not_in_progress(self, mock_start_pipeline, mock_get_trainingjob,
+                                                            mock_transition_steps, mock_failed, mock_complete_work, trainingjob):
+        mock_get_trainingjob.return_value = trainingjob
+        work = {"id": 7, "trainingjob_id": 1, "action": "START_PIPELINE", "attempts": 0}
+        async_handler.run_lifecycle_work(MagicMock(), work)
+        mock_start_pipeline.assert_not_called()
+        mock_failed.assert_not_called()
+        mock_complete_work.assert_called_once_with(7, async_handler.WORKER_ID)
+
+    @patch.object(async_handler, 'complete_work')
+    @patch.object(async_handler, 'notification_rapp')
+    @patch.object(async_handler, 'change_state_to_failed')
+    @patch.object(async_handler, 'remove_work')
+    @patch.object(async_handler, 'transition_steps', return_value=True)
+    @patch.object(async_handler, 'get_trainingjob')
+    @patch('trainingmgr.service.training_job_service.start_training_pipeline',
+           side_effect=TMException("KF Adapter- run_status in not scheduled"))
+    def test_start_pipeline_failure_fails_trainingjob(self, mock_start_pipeline, mock_get_trainingjob, mock_transition_steps,
+                                                      mock_remove_work, mock_failed, mock_notify, mock_complete_work, trainingjob):
+        mock_get_trainingjob.return_value = trainingjob
+        work = {"id": 7, "trainingjob_id": 1, "action": "START_PIPELINE", "attempts": 0}
+        async_handler.run_lifecycle_work(MagicMock(), work)
+        mock_failed.assert_called_once_with(1)
+        mock_notify.assert_called_once_with(1)
+        mock_complete_work.assert_called_once_with(7, async_handler.WORKER_ID)
+
+    @patch.object(async_handler, 'complete_work')
+    @patch.object(async_handler, 'retry_work')
+    @patch.object(async_handler, 'change_state_to_failed')
+    @patch.object(async_handler, 'transition_steps', return_value=True)
+    @patch.object(async_handler, 'get_trainingjob')
+    @patch('trainingmgr.service.training_job_service.start_training_pipeline',
+           side_effect=DownstreamUnavailableException("KF Adapter is unavailable"))
+    def test_start_pipeline_unavailable_is_retried(self, mock_start_pipeline, mock_get_trainingjob, mock_transition_steps,
+                                                   mock_failed, mock_retry_work, mock_complete_work, trainingjob):
+        mock_get_trainingjob.return_value = trainingjob
+        work = {"id": 7, "trainingjob_id": 1, "action": "START_PIPELINE", "attempts": 1}
+        with patch.object(async_handler, 'POLL_BACKOFF', async_handler.PollBackoff(10, 300, 2, 0)):
+            async_handler.run_lifecycle_work(MagicMock(), work)
+        # The trainingjob goes back to data extraction, so that the retried start moves it on again
+        mock_transition_steps.assert_called_with(1,
+            {"DATA_EXTRACTION": "IN_PROGRESS", "DATA_EXTRACTION_AND_TRAINING": "NOT_STARTED"},
+            expected={"DATA_EXTRACTION_AND_TRAINING": "IN_PROGRESS"})
+        mock_failed.assert_not_called()
+        mock_retry_work.assert_called_once_with(7, async_handler.WORKER_ID, 40, True)
+        mock_complete_work.assert_not_called()
+
+    @patch.object(async_handler, 'notification_rapp')
+    @patch.object(async_handler, 'change_steps_state')
+    @patch.object(async_handler, 'change_field_value')
+    @patch.object(async_handler, 'get_modelinfo_by_modelId_service', return_value=[{"modelId": {"artifactVersion": "1.0.0"}}])
+    @patch.object(async_handler, 'get_trainingjob')
+    def test_resolve_model_url(self, mock_get_trainingjob, mock_modelinfo, mock_change_field_value,
+                               mock_change_steps_state, mock_notify, trainingjob):
+        trainingjob.modelId.modelname = "qoe"
+        trainingjob.modelId.modelversion = "1"
+        mock_get_trainingjob.return_value = trainingjob
+        with patch.object(async_handler, 'Model_Metrics_Sdk') as mock_mm_sdk:
+            mock_mm_sdk.check_object.return_value = True
+            assert async_handler.resolve_model_url(MagicMock(), 1) is True
+        model_url = mock_change_field_value.call_args[0][2]
+        assert model_url.endswith("/model/qoe/1/1.0.0/Model.zip")
+        mock_change_steps_state.assert_called_once_with(1, "TRAINED_MODEL", "FINISHED")
+        mock_notify.assert_called_once_with(1)
+        mock_modelinfo.assert_called_once_with("qoe", "1", use_cache=False)
+
+    @patch.object(async_handler, 'complete_work')
+    @patch.object(async_handler, 'retry_work')
+    @patch.object(async_handler, 'resolve_model_url', return_value=False)
+    def test_missing_model_is_retried(self, mock_resolve, mock_retry_work, mock_complete_work):
+        work = {"id": 7, "trainingjob_id": 1, "action": "RESOLVE_MODEL_URL", "attempts": 0}
+        async_handler.run_lifecycle_work(MagicMock(), work)
+        mock_retry_work.assert_called_once()
+        mock_complete_work.assert_not_called()
+
+    @patch.object(async_handler, 'notification_rapp')
+    @patch.object(async_handler, 'change_steps_state')
+    @patch.object(async_handler, 'complete_work')
+    @patch.object(async_handler, 'retry_work')
+    @patch.object(async_handler, 'resolve_model_url', side_effect=TMException("MME unavailable"))
+    def test_model_url_fails_after_max_attempts(self, mock_resolve, mock_retry_work, mock_complete_work,
+                                                mock_change_steps_state, mock_notify):
+        attempts = async_handler.TRAININGMGR_CONFIG_OBJ.lifecycle_work_max_attempts - 1
+        work = {"id": 7, "trainingjob_id": 1, "action": "RESOLVE_MODEL_URL", "attempts": attempts}
+        async_handler.run_lifecycle_work(MagicMock(), work)
+        mock_change_steps_state.assert_called_once_with(1, "TRAINED_MODEL", "FAILED")
+        mock_notify.assert_called_once_with(1)
+        mock_retry_work.assert_not_called()
+        mock_complete_work.assert_called_once_with(7, async_handler.WORKER_ID)
+
+
+class TestDeletionJobs:
+    @patch.object(async_handler, 'enqueue_works')
+    def test_add_jobs_queues_deletions(self, mock_enqueue_works):
+        async_handler.WORK_AVAILABLE.clear()
+        async_handler.add_deletion_jobs([1, 2])
+        mock_enqueue_works.assert_called_once_with([(1, 0), (2, 0)], "DELETE_TRAININGJOB")
+        assert async_handler.WORK_AVAILABLE.is_set()
+
+    @patch.object(async_handler, 'enqueue_works')
+    def test_nothing_to_queue(self, mock_enqueue_works):
+        async_handler.add_deletion_jobs([])
+        mock_enqueue_works.assert_not_called()
+
+    @patch.object(async_handler, 'complete_work')
+    @patch('trainingmgr.service.training_job_service.delete_training_job', return_value=True)
+    def test_deletion(self, mock_delete, mock_complete_work):
+        work = {"id": 7, "trainingjob_id": 1, "action": "DELETE_TRAININGJOB", "attempts": 0}
+        async_handler.run_lifecycle_work(MagicMock(), work)
+        mock_delete.assert_called_once_with(1)
+        mock_complete_work.assert_called_once_with(7, async_handler.WORKER_ID)
+
+    @patch.object(async_handler, 'retry_work')
+    @patch('trainingmgr.service.training_job_service.delete_training_job',
+           side_effect=DownstreamUnavailableException("KF Adapter is unavailable"))
+    def test_failed_deletion_is_retried(self, mock_delete, mock_retry_work):
+        work = {"id": 7, "trainingjob_id": 1, "action": "DELETE_TRAININGJOB", "attempts": 2}
+        with patch.object(async_handler, 'POLL_BACKOFF', async_handler.PollBackoff(10, 300, 2, 0)):
+            async_handler.run_lifecycle_work(MagicMock(), work)
+        mock_retry_work.assert_called_once_with(7, async_handler.WORKER_ID, 80, True)
+
+    @patch.object(async_handler, 'change_field_value')
+    @patch.object(async_handler, 'complete_work')
+    @patch.object(async_handler, 'retry_work')
+    @patch('trainingmgr.service.training_job_service.delete_training_job',
+           side_effect=DownstreamUnavailableException("KF Adapter is unavailable"))
+    def test_deletion_gives_up_after_max_attempts(self, mock_delete, mock_retry_work, mock_complete_work,
+                                                  mock_change_field_value):
+        attempts = async_handler.TRAININGMGR_CONFIG_OBJ.lifecycle_work_max_attempts - 1
+        work = {"id": 7, "trainingjob_id": 1, "action": "DELETE_TRAININGJOB", "attempts": attempts}
+        async_handler.run_lifecycle_work(MagicMock(), work)
+        # The trainingjob is no longer marked, so it is not queued again and can be deleted again
+        mock_change_field_value.assert_called_once_with(1, "deletion_in_progress", False)
+        mock_retry_work.assert_not_called()
+        mock_complete_work.assert_called_once_with(7, async_handler.WORKER_ID)
+
+    @patch.object(async_handler, 'retry_work')
+    @patch('trainingmgr.service.training_job_service.delete_training_job')
+    def test_deletion_waits_for_a_slot(self, mock_delete, mock_retry_work):
+        work = {"id": 7, "trainingjob_id": 1, "action": "DELETE_TRAININGJOB", "attempts": 0}
+        with patch.object(async_handler, 'DELETION_SLOTS', threading.BoundedSemaphore(1)) as slots:
+            slots.acquire()
+            async_handler.run_lifecycle_work(MagicMock(), work)
+            slots.release()
+        mock_delete.assert_not_called()
+        # Waiting is not counted as an attempt
+        mock_retry_work.assert_called_once_with(7, async_handler.WORKER_ID, async_handler.POLL_TICK, False)
+
+
+class TestReconcileLifecycleWork:
+    @staticmethod
+    def make_trainingjob(trainingjob_id):
+        trainingjob = MagicMock()
+        trainingjob.id = trainingjob_id
+        trainingjob.deletion_in_progress = False
+        return trainingjob
+
+    @patch.object(async_handler, 'requeue_work', return_value=True)
+    @patch.object(async_handler, 'get_trainingjob_ids_being_deleted', return_value=[1, 4])
+    @patch.object(async_handler, 'get_trainingjobs_by_step_state')
+    @patch.object(async_handler, 'get_queued_trainingjob_ids', return_value={1})
+    def test_lost_work_is_queued_again(self, mock_queued, mock_by_step_state, mock_being_deleted, mock_requeue_work):
+        # Trainingjob 1 is still queued
+        mock_by_step_state.side_effect = [[self.make_trainingjob(1), self.make_trainingjob(2)],
+                                          [self.make_trainingjob(3)]]
+
+        assert async_handler.reconcile_lifecycle_work() == [2, 3, 4]
+        mock_by_step_state.assert_any_call("DATA_EXTRACTION", "IN_PROGRESS")
+        mock_by_step_state.assert_any_call("TRAINED_MODEL", "IN_PROGRESS")
+        assert mock_requeue_work.call_args_list[0][0][:2] == (2, "POLL_DATA_EXTRACTION")
+        mock_requeue_work.assert_any_call(3, "RESOLVE_MODEL_URL")
+        mock_requeue_work.assert_called_with(4, "DELETE_TRAININGJOB")
+
+
+    @patch.object(async_handler, 'requeue_work', side_effect=[False, True])
+    @patch.object(async_handler, 'get_trainingjob_ids_being_deleted', return_value=[])
+    @patch.object(async_handler, 'get_trainingjobs_by_step_state')
+    @patch.object(async_handler, 'get_queued_trainingjob_ids', return_value=set())
+    def test_work_queued_in_the_meantime_is_not_reported(self, mock_queued, mock_by_step_state,
+                                                         mock_being_deleted, mock_requeue_work):
+        # The work of trainingjob 2 was queued after the queue was read
+        mock_by_step_state.side_effect = [[self.make_trainingjob(2)], [self.make_trainingjob(3)]]
+        assert async_handler.reconcile_lifecycle_work() == [3]
+
+
+class TestReplicaInfo:
+    def test_not_leader_before_start(self):
+        with patch.object(async_handler, 'LEADER', None):
+            assert async_handler.get_replica_info() == {"replica_id": async_handler.WORKER_ID, "leader": False}
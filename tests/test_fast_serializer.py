@@ -0,0 +1,72 @@
+# ==================================================================================
+#
+#      Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# ==================================================================================
+import json
+import pytest
+from flask import Flask, jsonify
+from marshmallow import post_dump
+from dotenv import load_dotenv
+load_dotenv('tests/test.env')
+from trainingmgr.models import TrainingJob, FeatureGroup, ModelID
+from trainingmgr.schemas import TrainingJobSchema, FeatureGroupSchema
+from trainingmgr.schemas.fast_serializer import CompiledSerializer, TRAININGJOB_SERIALIZER, \
+    FEATUREGROUP_SERIALIZER, dumps, json_response
+
+
+def trainingjob(index, **kwargs):
+    return TrainingJob(id=index, training_config=json.dumps({"description": f"job {index}", "epochs": index}),
+                       modelId=ModelID(id=index, modelname="qoe", modelversion=str(index)), **kwargs)
+
+
+TRAININGJOBS = [
+    trainingjob(1),
+    trainingjob(2, model_location="s3://models/qoe", consumer_rapp_id="rapp-1", notification_url="http://rapp/notify"),
+    trainingjob(3, producer_rapp_id="rApp für Zellen"),
+]
+FEATUREGROUPS = [
+    FeatureGroup(id=1, featuregroup_name="fg1", feature_list="pdcpBytesDl", enable_dme=False),
+    FeatureGroup(id=2, featuregroup_name="fg2", feature_list="pdcpBytesUl", enable_dme=True, dme_port="31823",
+                 host="influxdb", port="8086"),
+]
+
+
+class TestCompiledSerializer:
+    def test_trainingjobs_are_dumped_as_by_the_schema(self):
+        assert TRAININGJOB_SERIALIZER.dump_many(TRAININGJOBS) == TrainingJobSchema(many=True).dump(TRAININGJOBS)
+
+    def test_featuregroups_are_dumped_as_by_the_schema(self):
+        assert FEATUREGROUP_SERIALIZER.dump_many(FEATUREGROUPS) == FeatureGroupSchema(many=True).dump(FEATUREGROUPS)
+
+    def test_unknown_hook_is_rejected(self):
+        class HookedSchema(FeatureGroupSchema):
+            @post_dump
+            def add_link(self, data, **kwargs):
+                return data
+        with pytest.raises(TypeError, match="add_link"):
+            CompiledSerializer(HookedSchema())
+
+
+class TestJsonResponse:
+    @pytest.mark.parametrize("data", [
+        {"FeatureGroups": [{"b": 1, "a": None}]},
+        [{"producer_rapp_id": "rApp für Zellen", "training_config": {"epochs": 3}}],
+        [],
+    ])
+    def test_same_body_as_jsonify(self, data):
+        app = Flask(__name__)
+        with app.app_context():
+            assert json_response(data).get_data() == jsonify(data).get_data()
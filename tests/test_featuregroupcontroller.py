@@ -1,3 +1,4 @@
+import json
 import pytest
 from flask import Flask
 from unittest.mock import patch
@@ -20,6 +21,7 @@ from trainingmgr.schemas.problemdetail_schema import ProblemDetails
 from types import SimpleNamespace
 from trainingmgr import trainingmgr_main
 from trainingmgr.common.tmgr_logger import TMLogger
+from trainingmgr.models import FeatureGroup
 
 trainingmgr_main.LOGGER = pytest.logger
 
@@ -75,4 +77,26 @@ class TestGetFeatureGroup:
         response = client.get("/featureGroup")
         assert response.status_code == 500
         expected = ProblemDetails(500, "Internal Server Error", "Failed to get featuregroups").to_dict()
-        assert response.get_json() == expected
\ No newline at end of file
+        assert response.get_json() == expected
+    @patch('trainingmgr.controller.featuregroup_controller.get_featuregroups_version', return_value=(2, 2, None))
+    @patch('trainingmgr.controller.featuregroup_controller.get_all_featuregroups')
+    def test_get_not_modified(self, mock_get, mock_version, client):
+        mock_get.return_value = [FeatureGroup(featuregroup_name="fg1", enable_dme=False)]
+        response = client.get("/featureGroup")
+        assert response.status_code == 200
+        assert response.get_json()["FeatureGroups"][0]["featuregroup_name"] == "fg1"
+        etag = response.headers["ETag"]
+        response = client.get("/featureGroup", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        mock_get.assert_called_once()
+        mock_version.return_value = (2, 2, datetime.datetime(2025, 6, 1))
+        response = client.get("/featureGroup", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+    @patch('trainingmgr.controller.featuregroup_controller.iter_all_featuregroups')
+    def test_get_streamed_as_ndjson(self, mock_iter, client):
+        mock_iter.return_value = iter([FeatureGroup(featuregroup_name="fg1"), FeatureGroup(featuregroup_name="fg2")])
+        response = client.get("/featureGroup", headers={"Accept": "application/x-ndjson"})
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [line["featuregroup_name"] for line in lines] == ["fg1", "fg2"]
@@ -0,0 +1,121 @@
+# ==================================================================================
+#
+#      Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# ==================================================================================
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+from dotenv import load_dotenv
+load_dotenv('tests/test.env')
+from trainingmgr.common import http_client
+from trainingmgr.common.http_client import HttpClient, LatencyHistogram, CircuitBreaker, get_http_client, KF_ADAPTER
+from trainingmgr.common.exceptions_utls import DownstreamUnavailableException
+
+
+@pytest.fixture
+def client():
+    return HttpClient("test", timeout=(3, 30), retries=2, retry_backoff=0.2, pool_size=10)
+
+@pytest.fixture
+def isolated_client():
+    return HttpClient("test", timeout=(3, 30), retries=0, retry_backoff=0.2, pool_size=10, isolated=True,
+                      max_concurrent=1, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=30))
+
+
+class TestLatencyHistogram:
+    def test_buckets_are_cumulative(self):
+        histogram = LatencyHistogram()
+        histogram.observe(0.02)
+        histogram.observe(0.3)
+        histogram.observe(20, error=True)
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 3
+        assert snapshot["errors"] == 1
+        assert snapshot["buckets"]["0.01"] == 0
+        assert snapshot["buckets"]["0.025"] == 1
+        assert snapshot["buckets"]["0.5"] == 2
+        assert snapshot["buckets"]["10"] == 2
+        assert snapshot["buckets"]["+Inf"] == 3
+
+
+class TestHttpClient:
+    def test_connections_are_pooled_and_retried(self, client):
+        adapter = client.session.get_adapter("http://kf-adapter:5001")
+        assert adapter._pool_maxsize == 10
+        assert adapter.max_retries.connect == 2
+        assert adapter.max_retries.read == 0
+        assert 503 in adapter.max_retries.status_forcelist
+
+    def test_request_uses_default_timeout(self, client):
+        with patch.object(client.session, "request", return_value=MagicMock(status_code=200)) as mock_request:
+            client.get("http://kf-adapter:5001/pipelines")
+        mock_request.assert_called_once_with("GET", "http://kf-adapter:5001/pipelines", timeout=(3, 30))
+        assert client.latency.snapshot()["count"] == 1
+
+    def test_failed_request_is_recorded(self, client):
+        with patch.object(client.session, "request", side_effect=requests.ConnectionError("refused")):
+            with pytest.raises(requests.ConnectionError):
+                client.post("http://kf-adapter:5001/trainingjobs/1/execution", timeout=1)
+        assert client.latency.snapshot()["errors"] == 1
+
+    def test_one_client_per_service(self):
+        assert get_http_client(KF_ADAPTER) is get_http_client(KF_ADAPTER)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+        breaker.record(False)
+        breaker.record(True)
+        breaker.record(False)
+        assert breaker.allow()
+        breaker.record(False)
+        assert not breaker.allow()
+        assert breaker.snapshot()["state"] == CircuitBreaker.OPEN
+
+    @patch.object(http_client.time, "monotonic")
+    def test_one_trial_request_after_reset_timeout(self, mock_monotonic):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        mock_monotonic.return_value = 100
+        breaker.record(False)
+        mock_monotonic.return_value = 131
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record(False)
+        assert breaker.snapshot()["state"] == CircuitBreaker.OPEN
+        mock_monotonic.return_value = 162
+        assert breaker.allow()
+        breaker.record(True)
+        assert breaker.snapshot() == {"state": CircuitBreaker.CLOSED, "failures": 0, "retry_in": None}
+
+
+class TestIsolation:
+    def test_fails_fast_while_breaker_is_open(self, isolated_client):
+        with patch.object(isolated_client.session, "request", return_value=MagicMock(status_code=503)) as mock_request:
+            for _ in range(2):
+                isolated_client.get("http://mme:8080/models")
+            with pytest.raises(DownstreamUnavailableException):
+                isolated_client.get("http://mme:8080/models")
+        assert mock_request.call_count == 2
+        assert isolated_client.state()["in_flight"] == 0
+
+    def test_rejects_requests_over_limit(self, isolated_client):
+        isolated_client.in_flight = 1
+        with patch.object(isolated_client.session, "request") as mock_request:
+            with pytest.raises(DownstreamUnavailableException):
+                isolated_client.get("http://mme:8080/models")
+        mock_request.assert_not_called()
+        assert isolated_client.breaker.snapshot()["failures"] == 0
@@ -0,0 +1,88 @@
+# ==================================================================================
+#
+#      Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# ==================================================================================
+
+import pytest
+from unittest.mock import patch, MagicMock
+from sqlalchemy.dialects import postgresql
+from trainingmgr.common.exceptions_utls import DBException
+from trainingmgr.db.lifecycle_work_db import claim_due_work, handover_work, remove_work, requeue_work
+
+
+class TestClaimDueWork:
+    @patch('trainingmgr.db.lifecycle_work_db.db')
+    def test_rows_are_locked_skipping_locked_rows(self, mock_db):
+        row = MagicMock(id=7, trainingjob_id=1, action="POLL_DATA_EXTRACTION", attempts=2)
+        mock_db.session.execute.return_value.scalars.return_value.all.return_value = [row]
+
+        work = claim_due_work("worker-1", 5, 300)
+
+        assert work == [{"id": 7, "trainingjob_id": 1, "action": "POLL_DATA_EXTRACTION", "attempts": 2}]
+        assert row.locked_by == "worker-1"
+        query = str(mock_db.session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "FOR UPDATE SKIP LOCKED" in query
+        mock_db.session.commit.assert_called_once()
+
+    @patch('trainingmgr.db.lifecycle_work_db.db')
+    def test_db_error(self, mock_db):
+        mock_db.session.execute.side_effect = Exception("Database error")
+        with pytest.raises(DBException):
+            claim_due_work("worker-1", 5, 300)
+        mock_db.session.rollback.assert_called_once()
+
+
+class TestHandoverWork:
+    @patch('trainingmgr.db.lifecycle_work_db.db')
+    def test_work_taken_by_someone_else(self, mock_db):
+        mock_db.session.execute.return_value.rowcount = 0
+        assert handover_work(1, "POLL_DATA_EXTRACTION", "START_PIPELINE") is False
+        mock_db.session.rollback.assert_called_once()
+        mock_db.session.commit.assert_not_called()
+
+    @patch('trainingmgr.db.lifecycle_work_db.db')
+    def test_success(self, mock_db):
+        mock_db.session.execute.return_value.rowcount = 1
+        assert handover_work(1, "POLL_DATA_EXTRACTION", "START_PIPELINE") is True
+        # The delete and the insert are committed together
+        assert mock_db.session.execute.call_count == 2
+        mock_db.session.commit.assert_called_once()
+
+
+class TestRequeueWork:
+    @patch('trainingmgr.db.lifecycle_work_db.db')
+    def test_queued_work_is_left_untouched(self, mock_db):
+        mock_db.session.execute.return_value.rowcount = 0
+        assert requeue_work(1, "POLL_DATA_EXTRACTION") is False
+        query = str(mock_db.session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        # A lease taken since the queue was read is not reset
+        assert "ON CONFLICT ON CONSTRAINT" in query and "DO NOTHING" in query
+        assert "locked_by" not in query
+        mock_db.session.commit.assert_called_once()
+
+    @patch('trainingmgr.db.lifecycle_work_db.db')
+    def test_db_error(self, mock_db):
+        mock_db.session.execute.side_effect = Exception("Database error")
+        with pytest.raises(DBException):
+            requeue_work(1, "POLL_DATA_EXTRACTION")
+        mock_db.session.rollback.assert_called_once()
+
+
+class TestRemoveWork:
+    @patch('trainingmgr.db.lifecycle_work_db.db')
+    def test_returns_removed_count(self, mock_db):
+        mock_db.session.execute.return_value.rowcount = 1
+        assert remove_work(1, "POLL_DATA_EXTRACTION") == 1
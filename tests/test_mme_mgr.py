@@ -45,7 +45,7 @@ class TestMmeMgr:
         (200, {"model": "info"}),
         (404, None),
     ])
-    @patch("requests.get")
+    @patch("trainingmgr.common.http_client.HttpClient.get")
     def test_get_modelInfo_success_or_not_found(self, mock_get, status_code, expected):
         mock_response = MagicMock()
         mock_response.status_code = status_code
@@ -57,7 +57,7 @@ class TestMmeMgr:
         result = mme_mgr.get_modelInfo_by_modelId("dummy_model", "1")
         assert result == expected
 
-    @patch("requests.get")
+    @patch("trainingmgr.common.http_client.HttpClient.get")
     def test_get_modelInfo_error(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 500
@@ -0,0 +1,102 @@
+# ==================================================================================
+#
+#      Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# ==================================================================================
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+from dotenv import load_dotenv
+load_dotenv('tests/test.env')
+from trainingmgr.handler import notification_handler
+from trainingmgr.handler.notification_handler import NotificationDispatcher
+
+
+@pytest.fixture
+def dispatcher():
+    return NotificationDispatcher(workers=2, queue_size=4, timeout=5, max_attempts=3, retry_backoff=1)
+
+def response(status_code):
+    resp = MagicMock()
+    resp.status_code = status_code
+    return resp
+
+
+class TestSubmit:
+    def test_trainingjob_notifications_go_to_one_worker(self, dispatcher):
+        assert dispatcher.submit(1, "http://rapp/notify", "a")
+        assert dispatcher.submit(3, "http://rapp/notify", "b")
+        assert dispatcher.queues[1].qsize() == 2
+        assert dispatcher.queues[0].qsize() == 0
+
+    def test_waiting_notification_is_replaced(self, dispatcher):
+        dispatcher.submit(1, "http://rapp/notify", "first")
+        dispatcher.submit(1, "http://rapp/notify", "second")
+        assert dispatcher.queues[1].qsize() == 1
+        assert dispatcher.pending[1][1] == "second"
+        assert dispatcher.stats()["coalesced"] == 1
+
+    def test_dropped_when_queue_is_full(self, dispatcher):
+        for trainingjob_id in (1, 3):
+            assert dispatcher.submit(trainingjob_id, "http://rapp/notify", "a")
+        assert dispatcher.submit(5, "http://rapp/notify", "a") is False
+        stats = dispatcher.stats()
+        assert stats["dropped"] == 1
+        assert stats["queue_depth"] == 2
+
+
+class TestDeliver:
+    def test_requests_time_out_without_client_retries(self):
+        client = notification_handler.NOTIFICATION_DISPATCHER.client
+        assert client.timeout[1] == notification_handler.TRAININGMGR_CONFIG_OBJ.notification_timeout
+        assert client.session.get_adapter("http://rapp").max_retries.total == 0
+
+    def test_success(self, dispatcher):
+        client = MagicMock()
+        dispatcher.client = client
+        client.post.return_value = response(200)
+        assert dispatcher.deliver(1, "http://rapp/notify", "a", 0.0)
+        client.post.assert_called_once()
+        stats = dispatcher.stats()
+        assert stats["delivered"] == 1
+        assert stats["latency_max"] > 0
+
+    @patch.object(notification_handler.time, 'sleep')
+    def test_retried_with_backoff(self, mock_sleep, dispatcher):
+        client = MagicMock()
+        dispatcher.client = client
+        client.post.side_effect = [requests.ConnectionError("refused"), response(500), response(200)]
+        assert dispatcher.deliver(1, "http://rapp/notify", "a", 0.0)
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2]
+        assert client.post.call_count == 3
+
+    @patch.object(notification_handler.time, 'sleep')
+    def test_given_up_after_max_attempts(self, mock_sleep, dispatcher):
+        client = MagicMock()
+        dispatcher.client = client
+        client.post.return_value = response(503)
+        assert dispatcher.deliver(1, "http://rapp/notify", "a", 0.0) is False
+        assert client.post.call_count == 3
+        assert dispatcher.stats()["failed"] == 1
+
+    @patch.object(notification_handler.time, 'sleep')
+    def test_retry_superseded_by_newer_notification(self, mock_sleep, dispatcher):
+        client = MagicMock()
+        dispatcher.client = client
+        client.post.return_value = response(503)
+        dispatcher.submit(1, "http://rapp/notify", "newer")
+        assert dispatcher.deliver(1, "http://rapp/notify", "older", 0.0)
+        client.post.assert_called_once()
+        assert dispatcher.stats()["failed"] == 0
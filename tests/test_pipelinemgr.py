@@ -28,10 +28,19 @@ from trainingmgr.common.exceptions_utls import TMException
 @pytest.fixture
 def pipeline_mgr():
     """Fixture to get an instance of PipelineMgr."""
-    return PipelineMgr()
+    pipeline_mgr = PipelineMgr()
+    pipeline_mgr.invalidate_catalog()
+    return pipeline_mgr
+
+def kf_response(body):
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = {"content-type": "application/json"}
+    mock_response.json.return_value = body
+    return mock_response
     
 class TestPipelineMgr:
-    @patch("requests.get")
+    @patch("trainingmgr.common.http_client.HttpClient.get")
     def test_get_all_pipelines_success(self, mock_get, pipeline_mgr):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -42,7 +51,7 @@ class TestPipelineMgr:
         assert len(result) == 2
         assert result[0]["id"] == "pipeline1"
 
-    @patch("requests.get")
+    @patch("trainingmgr.common.http_client.HttpClient.get")
     def test_get_all_pipelines_invalid_response(self, mock_get, pipeline_mgr):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -51,7 +60,7 @@ class TestPipelineMgr:
         with pytest.raises(TMException, match="Kf adapter doesn't sends json type response"):
             pipeline_mgr.get_all_pipelines()
 
-    @patch("requests.get")
+    @patch("trainingmgr.common.http_client.HttpClient.get")
     def test_get_all_pipeline_versions_success(self, mock_get, pipeline_mgr):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -62,7 +71,7 @@ class TestPipelineMgr:
         assert len(result) == 2
         assert result[0]["version"] == "1.0"
 
-    @patch("requests.post")
+    @patch("trainingmgr.common.http_client.HttpClient.post")
     def test_upload_pipeline_file_success(self, mock_post, pipeline_mgr, tmp_path):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -73,7 +82,7 @@ class TestPipelineMgr:
         result = pipeline_mgr.upload_pipeline_file("pipeline1", str(file_path), "Test pipeline")
         assert result is True
 
-    @patch("requests.post")
+    @patch("trainingmgr.common.http_client.HttpClient.post")
     def test_upload_pipeline_file_failure(self, mock_post, pipeline_mgr, tmp_path):
         mock_response = MagicMock()
         mock_response.status_code = 400
@@ -85,7 +94,7 @@ class TestPipelineMgr:
         with pytest.raises(TMException, match="Error while uploading pipeline"):
             pipeline_mgr.upload_pipeline_file("pipeline1", str(file_path), "Test pipeline")
 
-    @patch("requests.post")
+    @patch("trainingmgr.common.http_client.HttpClient.post")
     def test_start_training_success(self, mock_post, pipeline_mgr):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -94,7 +103,7 @@ class TestPipelineMgr:
         response = pipeline_mgr.start_training(training_details, "trainingjob1")
         assert response.status_code == 200
 
-    @patch("requests.delete")
+    @patch("trainingmgr.common.http_client.HttpClient.delete")
     def test_terminate_training_success(self, mock_delete, pipeline_mgr):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -102,7 +111,7 @@ class TestPipelineMgr:
         response = pipeline_mgr.terminate_training("run1")
         assert response.status_code == 200
 
-    @patch("requests.get")
+    @patch("trainingmgr.common.http_client.HttpClient.get")
     def test_get_experiments_success(self, mock_get, pipeline_mgr):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -113,11 +122,51 @@ class TestPipelineMgr:
         assert len(result) == 2
         assert result[0]["id"] == "experiment1"
 
-    @patch("requests.get")
+    @patch("trainingmgr.common.http_client.HttpClient.get")
     def test_get_experiments_invalid_content_type(self, mock_get, pipeline_mgr):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"content-type": "text/plain"}
         mock_get.return_value = mock_response
         with pytest.raises(TMException, match="Kf adapter doesn't sends json type response"):
-            pipeline_mgr.get_experiments()
\ No newline at end of file
+            pipeline_mgr.get_experiments()
+
+
+class TestPipelineCatalog:
+    pipelines = {"pipelines": [{"display_name": "qoe_pipeline", "pipeline_id": "p1"},
+                               {"display_name": "ad_pipeline", "pipeline_id": "p2"}]}
+
+    @patch("trainingmgr.common.http_client.HttpClient.get")
+    def test_pipelines_are_fetched_once(self, mock_get, pipeline_mgr):
+        mock_get.return_value = kf_response(self.pipelines)
+        assert pipeline_mgr.get_pipeline_by_name("ad_pipeline")["pipeline_id"] == "p2"
+        assert pipeline_mgr.get_pipeline_by_name("unknown") is None
+        assert pipeline_mgr.get_all_pipelines() == self.pipelines
+        mock_get.assert_called_once()
+
+    @patch("trainingmgr.common.http_client.HttpClient.get")
+    def test_stale_entry_is_served_while_refreshed(self, mock_get, pipeline_mgr):
+        mock_get.return_value = kf_response({"versions_list": ["v1"]})
+        pipeline_mgr.get_all_pipeline_versions("qoe_pipeline")
+        value, fetched_at = pipeline_mgr.catalog["versions/qoe_pipeline"]
+        pipeline_mgr.catalog["versions/qoe_pipeline"] = (value, fetched_at - pipeline_mgr.catalog_refresh_interval - 1)
+        mock_get.return_value = kf_response({"versions_list": ["v1", "v2"]})
+        with patch("trainingmgr.pipeline.pipeline_mgr.threading.Thread") as mock_thread:
+            assert pipeline_mgr.get_all_pipeline_versions("qoe_pipeline") == {"versions_list": ["v1"]}
+        target, args = mock_thread.call_args.kwargs["target"], mock_thread.call_args.kwargs["args"]
+        target(*args)
+        assert pipeline_mgr.get_all_pipeline_versions("qoe_pipeline") == {"versions_list": ["v1", "v2"]}
+        assert pipeline_mgr.refreshing == set()
+
+    @patch("trainingmgr.common.http_client.HttpClient.post")
+    @patch("trainingmgr.common.http_client.HttpClient.get")
+    def test_upload_invalidates_pipeline(self, mock_get, mock_post, pipeline_mgr, tmp_path):
+        mock_get.return_value = kf_response(self.pipelines)
+        pipeline_mgr.get_all_pipelines()
+        pipeline_mgr.get_experiments()
+        mock_post.return_value = MagicMock(status_code=200)
+        file_path = tmp_path / "test_pipeline.yaml"
+        file_path.write_text("pipeline content")
+        pipeline_mgr.upload_pipeline_file("qoe_pipeline", str(file_path), "Test pipeline")
+        assert "pipelines" not in pipeline_mgr.catalog
+        assert "experiments" in pipeline_mgr.catalog
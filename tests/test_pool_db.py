@@ -0,0 +1,56 @@
+# ==================================================================================
+#
+#      Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# ==================================================================================
+from types import SimpleNamespace
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+from trainingmgr.db.pool_db import engine_options, warm_pool, PoolMonitor
+
+
+def test_engine_options():
+    config = SimpleNamespace(db_pool_size=5, db_max_overflow=10, db_pool_timeout=30.0, db_pool_recycle=1800,
+                             db_pool_pre_ping=True, db_connect_timeout=10)
+    assert engine_options(config) == {"pool_size": 5, "max_overflow": 10, "pool_timeout": 30.0, "pool_recycle": 1800,
+                                      "pool_pre_ping": True, "connect_args": {"connect_timeout": 10}}
+
+
+class TestPoolMonitor:
+    def setup_method(self):
+        self.engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=2, max_overflow=2)
+        self.monitor = PoolMonitor(self.engine, 2)
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def test_warm_pool_opens_the_connections_once(self):
+        warm_pool(self.engine, 2)
+        assert self.monitor.stats() == {"size": 2, "max_overflow": 2, "checked_out": 0, "checked_in": 2, "overflow": 0,
+                                        "saturation": 0.0, "connects": 2, "checkouts": 2, "invalidations": 0}
+        with self.engine.connect() as conn:
+            conn.execute(text("select 1"))
+        stats = self.monitor.stats()
+        assert (stats["connects"], stats["checkouts"]) == (2, 3)
+
+    def test_saturation(self):
+        connections = [self.engine.raw_connection() for _ in range(3)]
+        stats = self.monitor.stats()
+        assert (stats["checked_out"], stats["overflow"], stats["saturation"]) == (3, 1, 0.75)
+        connections[0].invalidate()
+        for conn in connections:
+            conn.close()
+        stats = self.monitor.stats()
+        assert (stats["checked_out"], stats["invalidations"]) == (0, 1)
@@ -0,0 +1,148 @@
+# ==================================================================================
+#
+#      Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# ==================================================================================
+import datetime
+import json
+import threading
+import pytest
+from flask import Flask
+from types import SimpleNamespace
+from unittest.mock import patch
+from dotenv import load_dotenv
+load_dotenv('tests/test.env')
+from trainingmgr.handler import status_stream_handler
+from trainingmgr.handler.status_stream_handler import StatusBroadcaster, stream_status, stream_events, FEED
+from trainingmgr.models import TrainingJobEvent
+
+IN_PROGRESS = json.dumps({"DATA_EXTRACTION": "FINISHED", "TRAINING": "IN_PROGRESS"})
+FINISHED = json.dumps({"DATA_EXTRACTION": "FINISHED", "TRAINING": "FINISHED"})
+
+
+@pytest.fixture
+def broadcaster():
+    broadcaster = StatusBroadcaster(max_watchers=2, poll_interval=0, event_buffer_size=3)
+    broadcaster.app = Flask(__name__)
+    with patch.object(status_stream_handler, 'STATUS_BROADCASTER', broadcaster):
+        yield broadcaster
+
+
+class TestStatusBroadcaster:
+    def test_watchers_are_limited(self, broadcaster):
+        assert broadcaster.subscribe(1)
+        assert broadcaster.subscribe(2)
+        assert broadcaster.subscribe(1) is False
+        broadcaster.unsubscribe(2)
+        assert broadcaster.subscribe(1)
+        assert broadcaster.stats() == {"watchers": 2, "trainingjobs": 1, "feed_watchers": 0, "buffered_events": 0,
+                                       "max_watchers": 2, "published": 0, "rejected": 1}
+
+    def test_publish_wakes_the_watchers(self, broadcaster):
+        broadcaster.subscribe(1)
+        updates = []
+        watcher = threading.Thread(target=lambda: updates.append(broadcaster.wait(1, 3, timeout=5)))
+        watcher.start()
+        broadcaster.publish(1, 3, IN_PROGRESS)
+        broadcaster.publish(1, 4, FINISHED)
+        watcher.join()
+        assert updates == [(4, FINISHED)]
+
+    def test_older_version_is_not_published(self, broadcaster):
+        broadcaster.subscribe(1)
+        broadcaster.publish(1, 4, FINISHED)
+        broadcaster.publish(1, 3, IN_PROGRESS)
+        assert broadcaster.wait(1, 3, timeout=0) == (4, FINISHED)
+        assert broadcaster.wait(1, 4, timeout=0) is None
+
+    def test_unwatched_trainingjob_is_not_read(self, broadcaster):
+        with patch.object(status_stream_handler.trainingjob_db, 'get_steps_states') as mock_get_steps_states:
+            broadcaster.on_step_transition(1)
+            mock_get_steps_states.assert_not_called()
+            broadcaster.subscribe(1)
+            mock_get_steps_states.return_value = {1: SimpleNamespace(version=2, states=FINISHED)}
+            broadcaster.on_step_transition(1)
+            mock_get_steps_states.assert_called_once_with([1])
+        assert broadcaster.wait(1, 1, timeout=0) == (2, FINISHED)
+
+
+class TestStreamStatus:
+    def test_streams_until_finished(self, broadcaster):
+        broadcaster.subscribe(1)
+        broadcaster.publish(1, 4, FINISHED)
+        events = list(stream_status(1, 3, IN_PROGRESS))
+        assert events == [f"id: 3\nevent: status\ndata: {IN_PROGRESS}\n\n",
+                          f"id: 4\nevent: status\ndata: {FINISHED}\n\n"]
+
+    def test_state_already_sent_is_skipped(self, broadcaster):
+        broadcaster.subscribe(1)
+        assert list(stream_status(1, 4, FINISHED, last_event_id="4")) == []
+
+    @patch.object(status_stream_handler.TRAININGMGR_CONFIG_OBJ, '_TrainingMgrConfig__status_stream_timeout', 0.05)
+    @patch.object(status_stream_handler.TRAININGMGR_CONFIG_OBJ, '_TrainingMgrConfig__status_stream_keepalive', 0.01)
+    def test_keepalive_until_timeout(self, broadcaster):
+        broadcaster.subscribe(1)
+        events = list(stream_status(1, 3, IN_PROGRESS, last_event_id="3"))
+        assert events and set(events) == {": keepalive\n\n"}
+
+
+def event(event_id, trainingjob_id):
+    return TrainingJobEvent(id=event_id, trainingjob_id=trainingjob_id, step="TRAINING", state="FINISHED", version=2,
+                            event_time=datetime.datetime(2025, 7, 1))
+
+
+@pytest.fixture
+def feed(broadcaster):
+    broadcaster.subscribe(FEED)
+    with patch.object(status_stream_handler.trainingjob_db, 'get_last_trainingjob_event_id', return_value=5), \
+            patch.object(status_stream_handler.trainingjob_db, 'get_trainingjob_events') as mock_get_events:
+        broadcaster.start_feed()
+        yield broadcaster, mock_get_events
+
+
+class TestEventFeed:
+    def test_events_are_served_from_the_buffer(self, feed):
+        broadcaster, mock_get_events = feed
+        mock_get_events.return_value = [event(6, 1), event(7, 2)]
+        broadcaster.on_step_transition(2)
+        mock_get_events.assert_called_once_with(5, 3)
+        events, cursor = broadcaster.buffered_events(5)
+        assert [event_id for event_id, _ in events] == [6, 7] and cursor == 7
+        assert json.loads(events[0][1]) == {"id": 6, "trainingjob_id": 1, "step": "TRAINING", "state": "FINISHED",
+                                            "version": 2, "event_time": "2025-07-01T00:00:00"}
+        events, cursor = broadcaster.buffered_events(5, trainingjob_id=2)
+        assert [event_id for event_id, _ in events] == [7] and cursor == 7
+        assert broadcaster.wait_events(6, timeout=0)
+        assert not broadcaster.wait_events(7, timeout=0)
+
+    def test_watchers_behind_the_buffer_read_the_database(self, feed):
+        broadcaster, mock_get_events = feed
+        broadcaster.publish_events([(6, 1, "{}"), (7, 1, "{}"), (8, 1, "{}"), (9, 1, "{}")])
+        assert [event[0] for event in broadcaster.events] == [7, 8, 9]
+        assert broadcaster.buffered_events(5) is None
+        mock_get_events.return_value = [event(6, 1)]
+        events, cursor = broadcaster.read_events(5)
+        assert [event_id for event_id, _ in events] == [6]
+        # Every event up to the buffered ones has been looked for
+        assert cursor == 9
+
+    @patch.object(status_stream_handler.TRAININGMGR_CONFIG_OBJ, '_TrainingMgrConfig__status_stream_timeout', 0.05)
+    @patch.object(status_stream_handler.TRAININGMGR_CONFIG_OBJ, '_TrainingMgrConfig__status_stream_keepalive', 0.01)
+    def test_stream(self, feed):
+        broadcaster, _ = feed
+        broadcaster.publish_events([(6, 1, '{"id":6}'), (7, 2, '{"id":7}')])
+        events = list(stream_events(5, trainingjob_id=1))
+        assert events[0] == 'id: 6\nevent: transition\ndata: {"id":6}\n\n'
+        assert set(events[1:]) == {": keepalive\n\n"}
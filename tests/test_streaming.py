@@ -0,0 +1,69 @@
+# ==================================================================================
+#
+#      Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# ==================================================================================
+import json
+import pytest
+from flask import Flask, request
+from trainingmgr.common.streaming import streaming_format, stream_response
+
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+
+class TestStreamingFormat:
+    @pytest.mark.parametrize("headers, query, expected", [
+        ({}, "", None),
+        ({"Accept": "application/json"}, "", None),
+        ({"Accept": "application/x-ndjson"}, "", "ndjson"),
+        ({}, "?stream=true", "json"),
+    ])
+    def test_format(self, app, headers, query, expected):
+        with app.test_request_context("/training-jobs/" + query, headers=headers):
+            assert streaming_format(request) == expected
+
+
+class TestStreamResponse:
+    def test_json_array_in_chunks(self, app):
+        with app.test_request_context("/featureGroup"):
+            response = stream_response(range(5), lambda row: {"id": row}, "json", 2, envelope="FeatureGroups")
+            chunks = list(response.response)
+        assert response.mimetype == "application/json"
+        assert chunks[0] == '{"FeatureGroups":['
+        assert len(chunks) == 5
+        assert json.loads("".join(chunks)) == {"FeatureGroups": [{"id": row} for row in range(5)]}
+
+    def test_ndjson(self, app):
+        with app.test_request_context("/training-jobs/"):
+            response = stream_response(range(3), lambda row: {"id": row}, "ndjson", 500)
+            body = "".join(response.response)
+        assert response.mimetype == "application/x-ndjson"
+        assert [json.loads(line) for line in body.splitlines()] == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+    def test_empty(self, app):
+        with app.test_request_context("/training-jobs/"):
+            response = stream_response(iter(()), lambda row: row, "json", 500)
+            assert "".join(response.response) == "[]"
+
+    def test_query_error_before_response(self, app):
+        def rows():
+            raise Exception("Database error")
+            yield
+        with app.test_request_context("/training-jobs/"):
+            with pytest.raises(Exception, match="Database error"):
+                stream_response(rows(), lambda row: row, "json", 500)
@@ -27,6 +27,7 @@ from threading import Lock
 import os
 import sys
 import datetime
+from types import SimpleNamespace
 from flask_api import status
 from dotenv import load_dotenv
 load_dotenv('tests/test.env')
@@ -34,7 +35,7 @@ from trainingmgr.constants.states import States
 from threading import Lock
 from trainingmgr.common.tmgr_logger import TMLogger
 from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
-from trainingmgr.common.exceptions_utls import DBException, TMException
+from trainingmgr.common.exceptions_utls import DBException, TMException, DownstreamUnavailableException
 from trainingmgr.models import TrainingJob
 from trainingmgr.models import FeatureGroup
 from trainingmgr.schemas.problemdetail_schema import ProblemDetails
@@ -43,6 +44,7 @@ from trainingmgr.common.trainingConfig_parser import getField
 #mock ModelMetricsSdk before importing
 mock_modelmetrics_sdk = MagicMock()
 sys.modules["trainingmgr.handler.async_handler"] = MagicMock(ModelMetricsSdk=mock_modelmetrics_sdk)
+from trainingmgr.controller import trainingjob_controller
 from trainingmgr.controller.trainingjob_controller import training_job_controller
 from trainingmgr import trainingmgr_main
 
@@ -164,6 +166,58 @@ class TestCreateTrainingJob:
         assert response.status_code == 400
         assert response.json == expected_data
         
+class TestCreateTrainingJobsBatch:
+    def setup_method(self):
+        app = Flask(__name__)
+        app.register_blueprint(training_job_controller)
+        self.client = app.test_client()
+    @patch('trainingmgr.controller.trainingjob_controller.create_training_jobs',
+           return_value=[{"status": 201, "location": "ai-ml-model-training/v1/training-jobs/1", "trainingJob": {"id": 1}},
+                         {"title": "Bad Request", "status": 400, "detail": "The 'trainingConfig' field is missing."}])
+    def test_results_per_spec(self, mock_create_training_jobs):
+        specs = [{"modelId": {"modelName": "qoe", "modelVersion": "1"}, "trainingConfig": {}},
+                 {"modelId": {"modelName": "qoe", "modelVersion": "1"}}]
+        response = self.client.post("/training-jobs:batch", json={"trainingJobs": specs})
+        assert response.status_code == 200
+        assert [result["status"] for result in response.json["results"]] == [201, 400]
+        mock_create_training_jobs.assert_called_once_with(specs)
+    @pytest.mark.parametrize("body", ['{"trainingJobs": {}}', '[]', 'not json'])
+    def test_missing_list(self, body):
+        response = self.client.post("/training-jobs:batch", data=body, content_type="application/json")
+        assert response.status_code == 400
+    @patch.object(trainingjob_controller.TRAININGMGR_CONFIG_OBJ, '_TrainingMgrConfig__trainingjob_batch_max_size', 2)
+    def test_too_many_specs(self):
+        response = self.client.post("/training-jobs:batch", json={"trainingJobs": [{}, {}, {}]})
+        assert response.status_code == 400
+        assert response.json["detail"] == "At most 2 training jobs can be created at once."
+
+class TestDeleteTrainingJobsBatch:
+    def setup_method(self):
+        app = Flask(__name__)
+        app.register_blueprint(training_job_controller)
+        self.client = app.test_client()
+    @patch('trainingmgr.controller.trainingjob_controller.delete_training_jobs', return_value=([1, 3], [2]))
+    def test_deletions_are_accepted(self, mock_delete_training_jobs):
+        response = self.client.post("/training-jobs:batchDelete", json={"trainingJobIds": [1, 2, 3]})
+        assert response.status_code == 202
+        assert response.json == {"accepted": [1, 3], "notFound": [2]}
+        mock_delete_training_jobs.assert_called_once_with([1, 2, 3])
+    @pytest.mark.parametrize("body", ['{"trainingJobIds": 1}', '{"trainingJobIds": ["1"]}', '{"trainingJobIds": [true]}', 'not json'])
+    @patch('trainingmgr.controller.trainingjob_controller.delete_training_jobs')
+    def test_invalid_ids(self, mock_delete_training_jobs, body):
+        response = self.client.post("/training-jobs:batchDelete", data=body, content_type="application/json")
+        assert response.status_code == 400
+        mock_delete_training_jobs.assert_not_called()
+    @patch.object(trainingjob_controller.TRAININGMGR_CONFIG_OBJ, '_TrainingMgrConfig__trainingjob_batch_max_size', 2)
+    def test_too_many_ids(self):
+        response = self.client.post("/training-jobs:batchDelete", json={"trainingJobIds": [1, 2, 3]})
+        assert response.status_code == 400
+        assert response.json["detail"] == "At most 2 training jobs can be deleted at once."
+    @patch('trainingmgr.controller.trainingjob_controller.delete_training_jobs', side_effect=DBException("Database error"))
+    def test_db_error(self, mock_delete_training_jobs):
+        response = self.client.post("/training-jobs:batchDelete", json={"trainingJobIds": [1]})
+        assert response.status_code == 500
+
 class TestDeleteTrainingJob:
     def setup_method(self):
         app = Flask(__name__)
@@ -184,20 +238,66 @@ class TestDeleteTrainingJob:
         response = self.client.delete("/training-jobs/123")
         assert response.status_code == 404
         assert response.json == expected_data
+    @patch('trainingmgr.controller.trainingjob_controller.delete_training_job',
+           side_effect=DownstreamUnavailableException("kf_adapter", "kf_adapter is unavailable, its circuit breaker is open"))
+    def test_delete_trainingjob_downstream_unavailable(self, mock1):
+        expected_data = {
+            "title": "Service Unavailable",
+            "status": 503,
+            "detail": "kf_adapter is unavailable, its circuit breaker is open"
+        }
+        response = self.client.delete("/training-jobs/123")
+        assert response.status_code == 503
+        assert response.content_type == "application/problem+json"
+        assert response.json == expected_data
 
 class TestGetTrainingJobs:
     def setup_method(self):
         app = Flask(__name__)
         app.register_blueprint(training_job_controller)
         self.client = app.test_client()
-    @patch('trainingmgr.controller.trainingjob_controller.get_trainining_jobs', return_value=[{"id": 1, "name": "Test Job"}])
-    @patch('trainingmgr.controller.trainingjob_controller.trainingjobs_schema.dump', return_value=[{"id": 1, "name": "Test Job"}])
-    def test_get_trainingjobs_success(self, mock1, mock2):
+    @patch('trainingmgr.controller.trainingjob_controller.get_trainingjobs_version_service', return_value=(1, 1, None))
+    @patch('trainingmgr.controller.trainingjob_controller.get_trainining_jobs', return_value=([{"id": 1, "name": "Test Job"}], None))
+    @patch('trainingmgr.controller.trainingjob_controller.TRAININGJOB_SERIALIZER.dump_many', return_value=[{"id": 1, "name": "Test Job"}])
+    def test_get_trainingjobs_success(self, mock1, mock2, mock3):
         response = self.client.get('/training-jobs/')
         assert response.status_code == 200
         assert response.json == [{"id": 1, "name": "Test Job"}]
+        assert "Link" not in response.headers
+        assert response.headers["ETag"]
+    @patch('trainingmgr.controller.trainingjob_controller.get_trainingjobs_version_service', return_value=(1, 1, None))
+    @patch('trainingmgr.controller.trainingjob_controller.get_trainining_jobs', return_value=([{"id": 1}], None))
+    @patch('trainingmgr.controller.trainingjob_controller.TRAININGJOB_SERIALIZER.dump_many', return_value=[{"id": 1}])
+    def test_get_trainingjobs_not_modified(self, mock1, mock2, mock3):
+        etag = self.client.get('/training-jobs/?modelName=qoe').headers["ETag"]
+        response = self.client.get('/training-jobs/?modelName=qoe', headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.get_data() == b""
+        mock2.assert_called_once()
+        # Another page or other filters have their own ETag
+        response = self.client.get('/training-jobs/?modelName=other', headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        mock3.return_value = (2, 2, None)
+        response = self.client.get('/training-jobs/?modelName=qoe', headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+    @patch('trainingmgr.controller.trainingjob_controller.get_trainingjobs_version_service', return_value=(1, 1, None))
+    @patch('trainingmgr.controller.trainingjob_controller.get_trainining_jobs', return_value=([{"id": 1}], "next-page"))
+    @patch('trainingmgr.controller.trainingjob_controller.TRAININGJOB_SERIALIZER.dump_many', return_value=[{"id": 1}])
+    def test_get_trainingjobs_next_page(self, mock1, mock2, mock3):
+        response = self.client.get('/training-jobs/?modelName=qoe&limit=1')
+        assert response.status_code == 200
+        assert mock2.call_args[0][0].to_dict() == {"modelName": "qoe", "limit": "1"}
+        assert response.headers["Link"] == '<http://localhost/training-jobs/?modelName=qoe&limit=1&cursor=next-page>; rel="next"'
+    @patch('trainingmgr.controller.trainingjob_controller.get_trainingjobs_version_service', side_effect=TMException("limit must be an integer"))
+    def test_get_trainingjobs_invalid_query(self, mock1):
+        response = self.client.get('/training-jobs/?limit=ten')
+        assert response.status_code == 400
+        assert response.json["detail"] == "limit must be an integer"
+    @patch('trainingmgr.controller.trainingjob_controller.get_trainingjobs_version_service', return_value=(1, 1, None))
     @patch('trainingmgr.controller.trainingjob_controller.get_trainining_jobs')
-    def test_get_trainingjobs_tmexception(self, mock_get_trainingjobs):
+    def test_get_trainingjobs_tmexception(self, mock_get_trainingjobs, mock_version):
         mock_get_trainingjobs.side_effect = Exception('Training jobs not found')
         expected_data = {
             "title": "Internal Server Error",
@@ -213,12 +313,28 @@ class TestGetTrainingJob:
         app = Flask(__name__)
         app.register_blueprint(training_job_controller)
         self.client = app.test_client()
-    @patch('trainingmgr.controller.trainingjob_controller.get_training_job', return_value={"id": 1, "name": "Test Job"})
+    trainingjob = SimpleNamespace(id=1, creation_time=datetime.datetime(2025, 6, 1), updation_time=None)
+    @patch('trainingmgr.controller.trainingjob_controller.get_training_job', return_value=trainingjob)
     @patch('trainingmgr.controller.trainingjob_controller.trainingjob_schema.dump', return_value={"id": 1, "name": "Test Job"})
     def test_get_trainingjob_success(self, mock_schema_dump, mock_get_training_job):
         response = self.client.get('/training-jobs/1')
         assert response.status_code == 200
         assert response.json == {"id": 1, "name": "Test Job"}
+    @patch('trainingmgr.controller.trainingjob_controller.get_training_job', return_value=trainingjob)
+    @patch('trainingmgr.controller.trainingjob_controller.trainingjob_schema.dump', return_value={"id": 1, "name": "Test Job"})
+    def test_get_trainingjob_not_modified(self, mock_schema_dump, mock_get_training_job):
+        etag = self.client.get('/training-jobs/1').headers["ETag"]
+        response = self.client.get('/training-jobs/1', headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        mock_schema_dump.assert_called_once()
+        mock_get_training_job.return_value = SimpleNamespace(id=1, creation_time=datetime.datetime(2025, 6, 1),
+                                                             updation_time=datetime.datetime(2025, 6, 2))
+        response = self.client.get('/training-jobs/1', headers={"If-None-Match": etag})
+        assert response.status_code == 200
+    @patch('trainingmgr.controller.trainingjob_controller.get_training_job', return_value=None)
+    def test_get_trainingjob_not_found(self, mock_get_training_job):
+        response = self.client.get('/training-jobs/1')
+        assert response.status_code == 404
     @patch('trainingmgr.controller.trainingjob_controller.get_training_job')
     def test_get_trainingjob_generic_exception(self, mock_get_training_job):
         mock_get_training_job.side_effect = Exception('Unexpected error')
@@ -237,12 +353,99 @@ class TestGetTrainingJobStatus:
         app.register_blueprint(training_job_controller)
         self.client = app.test_client()
     expected_data = {"status": "running"}
-    @patch('trainingmgr.controller.trainingjob_controller.get_steps_state', return_value=json.dumps(expected_data))
+    trainingjob = SimpleNamespace(steps_state=SimpleNamespace(id=5, version=3, states=json.dumps(expected_data)))
+    @patch('trainingmgr.controller.trainingjob_controller.get_training_job', return_value=trainingjob)
     def test_get_trainingjob_status(self, mock1):
         response = self.client.get("/training-jobs/123/status")
         assert response.status_code == 200
         assert response.json == {"status": "running"}
+    @patch('trainingmgr.controller.trainingjob_controller.get_training_job', return_value=trainingjob)
+    def test_get_trainingjob_status_not_modified(self, mock1):
+        etag = self.client.get("/training-jobs/123/status").headers["ETag"]
+        response = self.client.get("/training-jobs/123/status", headers={"If-None-Match": f'W/{etag}, "other"'})
+        assert response.status_code == 304
+        mock1.return_value = SimpleNamespace(steps_state=SimpleNamespace(id=5, version=4, states=json.dumps({})))
+        response = self.client.get("/training-jobs/123/status", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json == {}
         
+class TestStreamTrainingJobStatus:
+    def setup_method(self):
+        app = Flask(__name__)
+        app.register_blueprint(training_job_controller)
+        self.client = app.test_client()
+    states = json.dumps({"DATA_EXTRACTION": "FINISHED", "TRAINING": "FINISHED"})
+    trainingjob = SimpleNamespace(steps_state=SimpleNamespace(id=5, version=3, states=states))
+    @patch('trainingmgr.controller.trainingjob_controller.unsubscribe_status')
+    @patch('trainingmgr.controller.trainingjob_controller.subscribe_status', return_value=True)
+    @patch('trainingmgr.controller.trainingjob_controller.get_training_job', return_value=trainingjob)
+    def test_stream_ends_with_finished_trainingjob(self, mock_get_training_job, mock_subscribe, mock_unsubscribe):
+        response = self.client.get("/training-jobs/123/status/stream")
+        assert response.status_code == 200
+        assert response.mimetype == "text/event-stream"
+        assert response.get_data(as_text=True) == f"id: 3\nevent: status\ndata: {self.states}\n\n"
+        mock_subscribe.assert_called_once_with(123)
+        # The WSGI server closes the response once it is sent
+        response.close()
+        mock_unsubscribe.assert_called_once_with(123)
+    @patch('trainingmgr.controller.trainingjob_controller.unsubscribe_status')
+    @patch('trainingmgr.controller.trainingjob_controller.subscribe_status', return_value=True)
+    @patch('trainingmgr.controller.trainingjob_controller.get_training_job', return_value=None)
+    def test_stream_of_missing_trainingjob(self, mock_get_training_job, mock_subscribe, mock_unsubscribe):
+        response = self.client.get("/training-jobs/123/status/stream")
+        assert response.status_code == 404
+        mock_unsubscribe.assert_called_once_with(123)
+    @patch('trainingmgr.controller.trainingjob_controller.subscribe_status', return_value=False)
+    def test_too_many_streams(self, mock_subscribe):
+        response = self.client.get("/training-jobs/123/status/stream")
+        assert response.status_code == 503
+
+class TestTrainingJobEvents:
+    def setup_method(self):
+        app = Flask(__name__)
+        app.register_blueprint(training_job_controller)
+        self.client = app.test_client()
+    event = SimpleNamespace(id=7, trainingjob_id=3, step="TRAINING", state="FINISHED", version=4,
+                            event_time=datetime.datetime(2025, 7, 1))
+    @patch('trainingmgr.controller.trainingjob_controller.get_trainingjob_events_service', return_value=([event], 7))
+    def test_get_events(self, mock_get_events):
+        response = self.client.get("/training-jobs:events?after=5")
+        assert response.status_code == 200
+        assert response.json == {"events": [{"id": 7, "trainingjob_id": 3, "step": "TRAINING", "state": "FINISHED",
+                                             "version": 4, "event_time": "2025-07-01T00:00:00"}], "cursor": 7}
+        assert mock_get_events.call_args[0][0]["after"] == "5"
+    def test_get_events_with_invalid_cursor(self):
+        response = self.client.get("/training-jobs:events?after=x")
+        assert response.status_code == 400
+    @patch('trainingmgr.controller.trainingjob_controller.unsubscribe_status')
+    @patch('trainingmgr.controller.trainingjob_controller.subscribe_status', return_value=True)
+    @patch('trainingmgr.controller.trainingjob_controller.stream_events', return_value=iter(["id: 8\n\n"]))
+    def test_stream_resumes_from_last_event_id(self, mock_stream_events, mock_subscribe, mock_unsubscribe):
+        response = self.client.get("/training-jobs:events/stream?after=2&trainingJobId=3", headers={"Last-Event-ID": "7"})
+        assert response.status_code == 200
+        assert response.mimetype == "text/event-stream"
+        assert response.get_data(as_text=True) == "id: 8\n\n"
+        mock_stream_events.assert_called_once_with(7, 3)
+        response.close()
+        mock_subscribe.assert_called_once_with(None)
+        mock_unsubscribe.assert_called_once_with(None)
+    @patch('trainingmgr.controller.trainingjob_controller.subscribe_status', return_value=False)
+    def test_too_many_streams(self, mock_subscribe):
+        response = self.client.get("/training-jobs:events/stream")
+        assert response.status_code == 503
+    def test_stream_with_invalid_trainingjob_id(self):
+        response = self.client.get("/training-jobs:events/stream?trainingJobId=x")
+        assert response.status_code == 400
+    @pytest.mark.parametrize("url, endpoint, view_args", [
+        ("/training-jobs:events", "get_trainingjob_events", {}),
+        ("/training-jobs:events/stream", "stream_trainingjob_events", {}),
+        ("/training-jobs/events/stream", "get_trainingjob_infos_from_model_id",
+         {"model_name": "events", "model_version": "stream"}),
+    ])
+    def test_events_do_not_shadow_model_lookup(self, url, endpoint, view_args):
+        adapter = self.client.application.url_map.bind("localhost")
+        assert adapter.match(url, method="GET") == (f"{training_job_controller.name}.{endpoint}", view_args)
+
 class TestGetTrainingJobInfosFromModelId:
     def setup_method(self):
         app = Flask(__name__)
@@ -16,12 +16,35 @@
 #
 # ==================================================================================
 
+import datetime
+import json
 import pytest
+from contextlib import contextmanager
+from flask import Flask
+from sqlalchemy import event
 from unittest.mock import patch, MagicMock
-from trainingmgr.models.trainingjob import TrainingJob
+from trainingmgr.models import db
+from trainingmgr.models.trainingjob import TrainingJob, ModelID
+from trainingmgr.models import TrainingJobStatus
+from trainingmgr.constants import Steps, States
+from trainingmgr.schemas.trainingjob_schema import TrainingJobSchema
+from trainingmgr.common.exceptions_utls import DBException
+from trainingmgr.common.etag import make_etag
 
 from trainingmgr.db.trainingjob_db import (
-    get_trainingjobs_by_model_id_db
+    get_trainingjobs_by_model_id_db,
+    get_trainingjobs_by_step_state,
+    transition_steps,
+    change_steps_state,
+    change_state_to_failed,
+    get_trainingjobs_page,
+    iter_trainingjobs,
+    get_trainingjobs_version,
+    changeartifact,
+    get_trainingjob_events,
+    get_last_trainingjob_event_id,
+    mark_trainingjobs_for_deletion,
+    get_trainingjob_ids_being_deleted
 )
 
 class TestGetTrainingJobsByModelIdDb:
@@ -48,4 +71,230 @@ class TestGetTrainingJobsByModelIdDb:
         except:
             # Test was supposed to fail, and It failed, So, It will consider Passed
             pass
-        
\ No newline at end of file
+        
+class TestTrainingJobStatus:
+    def test_states_are_stored_per_step(self):
+        status = TrainingJobStatus(states=json.dumps({"DATA_EXTRACTION": "IN_PROGRESS", "TRAINING": "NOT_STARTED"}))
+        assert status.data_extraction == "IN_PROGRESS"
+        assert status.get_state("TRAINING") == "NOT_STARTED"
+        status.set_state("DATA_EXTRACTION", "FINISHED")
+        assert json.loads(status.states)["DATA_EXTRACTION"] == "FINISHED"
+
+    def test_step_columns_are_indexed(self):
+        for step in Steps:
+            assert TrainingJobStatus.column(step.name).index is True
+
+
+class TestGetTrainingJobsByStepState:
+    @patch('trainingmgr.db.trainingjob_db.joinedload')
+    @patch('trainingmgr.db.trainingjob_db.contains_eager')
+    @patch('trainingmgr.db.trainingjob_db.TrainingJob')
+    def test_success(self, mock_trainingjob, mock_contains_eager, mock_joinedload):
+        trainingjobs = [MagicMock()]
+        query = mock_trainingjob.query.join.return_value.options.return_value
+        query.filter.return_value.all.return_value = trainingjobs
+        assert get_trainingjobs_by_step_state("DATA_EXTRACTION", "IN_PROGRESS") == trainingjobs
+        condition = query.filter.call_args[0][0]
+        assert str(condition) == "training_job_status_table.data_extraction = :data_extraction_1"
+
+    @patch('trainingmgr.db.trainingjob_db.TrainingJob')
+    def test_internal_error(self, mock_trainingjob):
+        mock_trainingjob.query.join.side_effect = Exception("Database error")
+        with pytest.raises(DBException):
+            get_trainingjobs_by_step_state("DATA_EXTRACTION", "IN_PROGRESS")
+
+
+class TestTransitionSteps:
+    @patch('trainingmgr.db.trainingjob_db.db')
+    def test_applies_all_changes_in_one_update(self, mock_db):
+        mock_db.session.execute.return_value.rowcount = 1
+        assert transition_steps(1, {"TRAINING": "FINISHED", "TRAINED_MODEL": "IN_PROGRESS"},
+                                expected={"TRAINING": "IN_PROGRESS"}) is True
+        # The update and, in the same transaction, the events of the changes
+        assert mock_db.session.execute.call_count == 2
+        assert str(mock_db.session.execute.call_args_list[1][0][0]).startswith("INSERT INTO trainingjob_event_table")
+        statement = str(mock_db.session.execute.call_args_list[0][0][0])
+        assert statement.startswith("UPDATE training_job_status_table SET training=")
+        assert "trained_model=" in statement
+        assert "version=(training_job_status_table.version +" in statement
+        assert "AND training_job_status_table.training = " in statement
+        mock_db.session.commit.assert_called_once()
+
+    @patch('trainingmgr.db.trainingjob_db.STEP_TRANSITION_LISTENERS', new_callable=list)
+    @patch('trainingmgr.db.trainingjob_db.db')
+    def test_listeners_are_called_after_commit(self, mock_db, listeners):
+        listener = MagicMock()
+        listeners.append(listener)
+        mock_db.session.execute.return_value.rowcount = 0
+        transition_steps(1, {"TRAINING": "FINISHED"}, expected={"TRAINING": "IN_PROGRESS"})
+        listener.assert_not_called()
+        mock_db.session.execute.return_value.rowcount = 1
+        transition_steps(1, {"TRAINING": "FINISHED"})
+        change_state_to_failed(1)
+        assert listener.call_count == 2
+        listener.assert_called_with(1)
+
+    @patch('trainingmgr.db.trainingjob_db.db')
+    def test_expected_states_do_not_match(self, mock_db):
+        mock_db.session.execute.return_value.rowcount = 0
+        assert transition_steps(1, {"TRAINING": "FINISHED"}, expected_version=3) is False
+        assert "training_job_status_table.version = " in str(mock_db.session.execute.call_args[0][0])
+
+    @patch('trainingmgr.db.trainingjob_db.db')
+    def test_internal_error(self, mock_db):
+        mock_db.session.execute.side_effect = Exception("Database error")
+        with pytest.raises(DBException):
+            transition_steps(1, {"TRAINING": "FINISHED"})
+        mock_db.session.rollback.assert_called_once()
+
+    @patch('trainingmgr.db.trainingjob_db.transition_steps', return_value=False)
+    def test_change_steps_state_of_missing_trainingjob(self, mock_transition_steps):
+        with pytest.raises(DBException):
+            change_steps_state(1, "TRAINING", "FINISHED")
+
+    @patch('trainingmgr.db.trainingjob_db.db')
+    def test_change_state_to_failed_in_one_update(self, mock_db):
+        mock_db.session.execute.return_value.rowcount = 1
+        change_state_to_failed(1)
+        statements = [str(call[0][0]) for call in mock_db.session.execute.call_args_list]
+        updates = [statement for statement in statements if statement.startswith("UPDATE")]
+        assert len(updates) == 1
+        assert updates[0].count("CASE WHEN") == len(Steps)
+
+
+class TestGetTrainingJobsPage:
+    @pytest.fixture(autouse=True)
+    def trainingjobs(self):
+        app = Flask(__name__)
+        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            models = [ModelID(modelname="qoe", modelversion="1"), ModelID(modelname="qoe", modelversion="2")]
+            db.session.add_all(models)
+            for index in range(5):
+                status = TrainingJobStatus()
+                status.set_state(Steps.DATA_EXTRACTION.name, States.FINISHED.name if index < 3 else States.NOT_STARTED.name)
+                status.set_state(Steps.TRAINING.name, States.IN_PROGRESS.name if index < 2 else States.NOT_STARTED.name)
+                db.session.add(TrainingJob(training_config="{}", modelId=models[index % 2], steps_state=status,
+                                           consumer_rapp_id=f"rapp-{index % 2}",
+                                           creation_time=datetime.datetime(2025, 6, 1 + index)))
+            db.session.commit()
+            # Nothing is served from the identity map, every load has to query
+            db.session.expunge_all()
+            yield
+            db.session.remove()
+            db.drop_all()
+
+    @contextmanager
+    def count_queries(self):
+        statements = []
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        event.listen(db.engine, "before_cursor_execute", count)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, "before_cursor_execute", count)
+
+    def test_serialized_page_takes_one_query(self):
+        with self.count_queries() as statements:
+            page, _ = get_trainingjobs_page({}, limit=5)
+            dumped = TrainingJobSchema(many=True).dump(page)
+            states = [trainingjob.steps_state.states for trainingjob in page]
+        assert [trainingjob["modelId"]["modelversion"] for trainingjob in dumped] == ["1", "2", "1", "2", "1"]
+        assert len(states) == 5
+        assert len(statements) == 1
+
+    def test_serialized_trainingjobs_of_model_take_one_query(self):
+        with self.count_queries() as statements:
+            trainingjobs = get_trainingjobs_by_model_id_db("qoe", "1")
+            TrainingJobSchema(many=True).dump(trainingjobs)
+            [trainingjob.steps_state.states for trainingjob in trainingjobs]
+        assert len(trainingjobs) == 3
+        assert len(statements) == 1
+
+    def test_pages_follow_each_other(self):
+        first, last = get_trainingjobs_page({}, limit=2)
+        assert [trainingjob.id for trainingjob in first] == [1, 2]
+        second, last = get_trainingjobs_page({}, limit=2, after=last)
+        assert [trainingjob.id for trainingjob in second] == [3, 4]
+        third, last = get_trainingjobs_page({}, limit=2, after=last)
+        assert [trainingjob.id for trainingjob in third] == [5]
+        assert last is None
+
+    def test_unpaginated_listing_returns_every_trainingjob(self):
+        trainingjobs, last = get_trainingjobs_page({}, limit=None)
+        assert [trainingjob.id for trainingjob in trainingjobs] == [1, 2, 3, 4, 5]
+        assert last is None
+
+    def test_descending_by_creation_time(self):
+        page, last = get_trainingjobs_page({}, sort="creation_time", descending=True, limit=3)
+        assert [trainingjob.id for trainingjob in page] == [5, 4, 3]
+        assert last == (datetime.datetime(2025, 6, 3), 3)
+        page, last = get_trainingjobs_page({}, sort="creation_time", descending=True, limit=3, after=last)
+        assert [trainingjob.id for trainingjob in page] == [2, 1]
+
+    def test_filters(self):
+        page, _ = get_trainingjobs_page({"model_name": "qoe", "model_version": "2", "consumer_rapp_id": "rapp-1"})
+        assert [trainingjob.id for trainingjob in page] == [2, 4]
+        page, _ = get_trainingjobs_page({"created_after": datetime.datetime(2025, 6, 2),
+                                         "created_before": datetime.datetime(2025, 6, 4)})
+        assert [trainingjob.id for trainingjob in page] == [2, 3]
+        page, _ = get_trainingjobs_page({"step": Steps.DATA_EXTRACTION.name, "step_state": States.FINISHED.name})
+        assert [trainingjob.id for trainingjob in page] == [1, 2, 3]
+
+    def test_iter_reads_in_chunks(self):
+        with self.count_queries() as statements:
+            trainingjobs = iter_trainingjobs({"consumer_rapp_id": "rapp-0"}, sort="creation_time", descending=True,
+                                             chunk_size=2)
+            assert [(trainingjob.id, trainingjob.modelId.modelversion) for trainingjob in trainingjobs] == \
+                [(5, "1"), (3, "1"), (1, "1")]
+        assert len(statements) == 1
+
+    def test_version_changes_with_the_trainingjobs(self):
+        version = get_trainingjobs_version({"model_version": "1"})
+        assert version[:4] == (3, 5, datetime.datetime(2025, 6, 5), 0)
+        assert get_trainingjobs_version({"model_version": "1"}) == version
+        # The artifact version of the model is part of each of its trainingjobs
+        changeartifact(1, "1.0.1")
+        updated = get_trainingjobs_version({"model_version": "1"})
+        assert updated[:2] == (3, 5) and updated[2] > version[2]
+        assert get_trainingjobs_version({"model_version": "2"})[:4] == (2, 4, datetime.datetime(2025, 6, 4), 0)
+
+    @pytest.mark.parametrize("filters", [{}, {"state": States.IN_PROGRESS.name},
+                                         {"step": Steps.TRAINING.name, "step_state": States.IN_PROGRESS.name}])
+    def test_etag_changes_with_step_transitions(self, filters):
+        etag = make_etag(sorted(filters.items()), *get_trainingjobs_version(filters))
+        # Trainingjob 1 still matches the filters, with other step states
+        transition_steps(1, {Steps.TRAINED_MODEL.name: States.IN_PROGRESS.name})
+        assert make_etag(sorted(filters.items()), *get_trainingjobs_version(filters)) != etag
+
+    def test_transitions_are_logged(self):
+        assert get_last_trainingjob_event_id() == 0
+        transition_steps(1, {Steps.TRAINING.name: States.FINISHED.name, Steps.TRAINED_MODEL.name: States.IN_PROGRESS.name})
+        transition_steps(2, {Steps.TRAINING.name: States.FINISHED.name}, expected={Steps.TRAINING.name: States.NOT_STARTED.name})
+        change_state_to_failed(1)
+        events = [(event.id, event.trainingjob_id, event.step, event.state, event.version)
+                  for event in get_trainingjob_events()]
+        assert events == [(1, 1, "TRAINING", "FINISHED", 1), (2, 1, "TRAINED_MODEL", "IN_PROGRESS", 1),
+                          (3, 1, "TRAINED_MODEL", "FAILED", 2)]
+        assert [event.id for event in get_trainingjob_events(after=1, limit=1)] == [2]
+        assert get_trainingjob_events(trainingjob_id=2) == []
+        assert get_last_trainingjob_event_id() == 3
+
+    def test_mark_for_deletion(self):
+        assert get_trainingjob_ids_being_deleted() == []
+        assert mark_trainingjobs_for_deletion([4, 2, 9]) == [2, 4]
+        assert sorted(get_trainingjob_ids_being_deleted()) == [2, 4]
+        assert mark_trainingjobs_for_deletion([9]) == []
+
+    @pytest.mark.parametrize("state, ids", [
+        (States.IN_PROGRESS.name, [1, 2, 3]),
+        (States.NOT_STARTED.name, [4, 5]),
+        (States.FINISHED.name, []),
+        (States.FAILED.name, []),
+    ])
+    def test_overall_state(self, state, ids):
+        page, _ = get_trainingjobs_page({"state": state})
+        assert [trainingjob.id for trainingjob in page] == ids
@@ -33,12 +33,14 @@ load_dotenv('tests/test.env')
 from trainingmgr.constants.states import States
 from threading import Lock
 from trainingmgr.common.tmgr_logger import TMLogger
+from trainingmgr.common.exceptions_utls import APIException
+from trainingmgr.constants.steps import Steps
 from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
-from trainingmgr.common.exceptions_utls import DBException, TMException
+from trainingmgr.common.exceptions_utls import DBException, TMException, DownstreamUnavailableException
 from trainingmgr.models import TrainingJob
 from trainingmgr.models import FeatureGroup
 from trainingmgr.common.trainingConfig_parser import getField
-from trainingmgr.models import ModelID, FeatureGroup, TrainingJob
+from trainingmgr.models import ModelID, FeatureGroup, TrainingJob, TrainingJobStatus, db
 from sqlalchemy.orm.exc import NoResultFound
 MIMETYPE_JSON = "application/json"
 
@@ -48,7 +50,7 @@ sys.modules["trainingmgr.handler.async_handler"] = MagicMock(ModelMetricsSdk=moc
 from trainingmgr.db.trainingjob_db import (
     change_state_to_failed, delete_trainingjob_by_id, create_trainingjob,
     get_trainingjob, change_steps_state,
-    change_field_value, change_steps_state_df, changeartifact
+    change_field_value, change_steps_state_df, changeartifact, get_trainingjob_events
 )
 from trainingmgr.common.exceptions_utls import DBException, TMException
 from trainingmgr.common.trainingConfig_parser import getField, setField
@@ -60,9 +62,14 @@ from trainingmgr.service.training_job_service import (
     get_trainining_jobs,
     create_training_job,
     delete_training_job,
+    delete_training_jobs,
+    get_steps_state,
     fetch_trainingjob_infos_from_model_id,
     update_artifact_version,
     training,
+    start_training_pipeline,
+    get_trainingjob_events_service,
+    create_training_jobs,
 )
 
 class TestGetTrainingJob:
@@ -82,22 +89,71 @@ class TestGetTrainingJob:
 
 
 class TestGetTrainingJobs:
-    @patch('trainingmgr.service.training_job_service.get_trainingjob')
-    def test_get_trainining_jobs_success(self, mock_get_trainingjob):
-        # Mock successful database response
-        mock_get_trainingjob.return_value = [{"id": 1, "name": "Test Job"}]
-        result = get_trainining_jobs()
-        assert result == [{"id": 1, "name": "Test Job"}]
+    @patch('trainingmgr.service.training_job_service.get_trainingjobs_page')
+    def test_get_trainining_jobs_success(self, mock_get_trainingjobs_page):
+        mock_get_trainingjobs_page.return_value = ([{"id": 1, "name": "Test Job"}], None)
+        result = get_trainining_jobs({"modelName": "qoe", "state": "IN_PROGRESS", "createdAfter": "2025-06-01T09:00:00+09:00"})
+        assert result == ([{"id": 1, "name": "Test Job"}], None)
+        filters, sort, descending, limit, after = mock_get_trainingjobs_page.call_args[0]
+        assert filters == {"model_name": "qoe", "state": "IN_PROGRESS", "created_after": datetime.datetime(2025, 6, 1)}
+        assert (sort, descending, limit, after) == ("id", False, None, None)
 
-    @patch('trainingmgr.service.training_job_service.get_trainingjob')
-    def test_get_trainining_jobs_db_exception(self, mock_get_trainingjob):
+    @patch('trainingmgr.service.training_job_service.TRAININGMGR_CONFIG_OBJ', trainingjob_page_size=2,
+           trainingjob_max_page_size=10)
+    @patch('trainingmgr.service.training_job_service.get_trainingjobs_page', return_value=([], (3, 3)))
+    def test_only_paginated_callers_get_a_page(self, mock_get_trainingjobs_page, mock_config):
+        get_trainining_jobs({})
+        assert mock_get_trainingjobs_page.call_args[0][3] is None
+        _, cursor = get_trainining_jobs({"limit": "5"})
+        assert mock_get_trainingjobs_page.call_args[0][3] == 5
+        get_trainining_jobs({"cursor": cursor})
+        assert mock_get_trainingjobs_page.call_args[0][3] == 2
+
+    @patch('trainingmgr.service.training_job_service.get_trainingjobs_page')
+    def test_cursor_continues_the_sort_order(self, mock_get_trainingjobs_page):
+        mock_get_trainingjobs_page.return_value = ([], (datetime.datetime(2025, 6, 3), 3))
+        _, cursor = get_trainining_jobs({"sort": "-creationTime", "limit": "2"})
+        get_trainining_jobs({"sort": "-creationTime", "limit": "2", "cursor": cursor})
+        assert mock_get_trainingjobs_page.call_args[0][1:] == ("creation_time", True, 2, (datetime.datetime(2025, 6, 3), 3))
+        with pytest.raises(TMException, match="another sort order"):
+            get_trainining_jobs({"sort": "creationTime", "cursor": cursor})
+
+    @pytest.mark.parametrize("query_args", [
+        {"state": "DONE"},
+        {"step": "TRAINING"},
+        {"createdBefore": "yesterday"},
+        {"sort": "name"},
+        {"limit": "0"},
+        {"cursor": "not-a-cursor"},
+    ])
+    def test_invalid_query(self, query_args):
+        with pytest.raises(TMException):
+            get_trainining_jobs(query_args)
+
+    @patch('trainingmgr.service.training_job_service.get_trainingjobs_page')
+    def test_get_trainining_jobs_db_exception(self, mock_get_trainingjobs_page):
         # Simulate a database exception
-        mock_get_trainingjob.side_effect = DBException("Database error")
+        mock_get_trainingjobs_page.side_effect = DBException("Database error")
         with pytest.raises(TMException) as exc_info:
-            get_trainining_jobs()
+            get_trainining_jobs({})
         assert "get_training_jobs failed with exception" in str(exc_info.value)
 
 
+class TestGetTrainingJobEvents:
+    @patch('trainingmgr.service.training_job_service.get_trainingjob_events')
+    def test_cursor_is_the_last_event_id(self, mock_get_trainingjob_events):
+        mock_get_trainingjob_events.return_value = [MagicMock(id=7), MagicMock(id=9)]
+        events, cursor = get_trainingjob_events_service({"after": "5", "limit": "2", "trainingJobId": "3"})
+        mock_get_trainingjob_events.assert_called_once_with(5, 2, 3)
+        assert cursor == 9
+        mock_get_trainingjob_events.return_value = []
+        assert get_trainingjob_events_service({"after": "9"}) == ([], 9)
+
+    @pytest.mark.parametrize("query_args", [{"after": "-1"}, {"after": "x"}, {"limit": "0"}, {"trainingJobId": "0"}])
+    def test_invalid_query(self, query_args):
+        with pytest.raises(TMException):
+            get_trainingjob_events_service(query_args)
+
 class TestCreateTrainingJob:
     @pytest.fixture
     def mock_modelInfo(self):
@@ -183,6 +239,98 @@ class TestCreateTrainingJob:
             create_training_job(trainingjob, {})
         assert "create_training_job failed with exception" in str(exc_info.value)
 
+def trainingjob_spec(model_name, feature_group_name="fg1"):
+    return {
+        "modelId": {"modelName": model_name, "modelVersion": "1"},
+        "modelLocation": "s3://models",
+        "trainingConfig": {
+            "description": "trainingjob for testing",
+            "dataPipeline": {"feature_group_name": feature_group_name, "query_filter": "", "arguments": {"epochs": 1}},
+            "trainingPipeline": {"training_pipeline_name": "qoe_Pipeline", "training_pipeline_version": "qoe_Pipeline",
+                                 "retraining_pipeline_name": "qoe_Pipeline_retrain",
+                                 "retraining_pipeline_version": "qoe_Pipeline_retrain"}
+        }
+    }
+
+
+class TestCreateTrainingJobs:
+    @pytest.fixture(autouse=True)
+    def database(self):
+        app = Flask(__name__)
+        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            db.session.add(FeatureGroup(featuregroup_name="fg1", feature_list="pdcpBytesDl", datalake_source="InfluxSource",
+                                        host="influxdb", port="8086", bucket="pm", token="t", db_org="org",
+                                        measurement="liveCell", enable_dme=False))
+            db.session.commit()
+            yield
+            db.session.remove()
+            db.drop_all()
+
+    @staticmethod
+    def registered_model(model_name, model_version):
+        if model_name == "unregistered":
+            return None
+        if model_name == "unreachable":
+            raise DownstreamUnavailableException("mme")
+        return [{"modelLocation": "s3://models", "modelInformation": {"inputDataType": "pdcpBytesDl"}}]
+
+    @staticmethod
+    def data_extraction(config, training_job_id, *args):
+        if training_job_id == 1:
+            return MagicMock(status_code=200)
+        return MagicMock(status_code=500, headers={'content-type': "application/json"}, json=lambda: {"result": "boom"})
+
+    @patch('trainingmgr.service.training_job_service.add_data_extraction_jobs')
+    @patch('trainingmgr.service.training_job_service.notification_rapp')
+    @patch('trainingmgr.service.training_job_service.data_extraction_start')
+    @patch('trainingmgr.service.training_job_service.get_modelinfo_by_modelId_service')
+    def test_results_per_spec(self, mock_modelinfo, mock_data_extraction, mock_notification, mock_add_job):
+        mock_modelinfo.side_effect = self.registered_model
+        mock_data_extraction.side_effect = self.data_extraction
+        specs = [trainingjob_spec("qoe"), trainingjob_spec("qoe"), trainingjob_spec("unregistered"),
+                 trainingjob_spec("qoe", "missing"), {"modelId": {"modelName": "qoe", "modelVersion": "1"}},
+                 trainingjob_spec("unreachable")]
+        results = create_training_jobs(specs)
+        assert [result["status"] for result in results] == [201, 500, 400, 404, 400, 503]
+        assert results[0]["location"] == "ai-ml-model-training/v1/training-jobs/1"
+        assert results[0]["trainingJob"]["modelId"]["modelname"] == "qoe"
+        assert results[1]["trainingJobId"] == 2 and "boom" in results[1]["detail"]
+        assert results[3]["detail"] == "No featuregroup found with featuregroup name missing"
+        # MME is asked once per model, the new model is created once for both trainingjobs
+        assert mock_modelinfo.call_count == 3
+        assert ModelID.query.filter_by(modelname="qoe").count() == 1
+        statuses = {trainingjob.id: json.loads(trainingjob.steps_state.states) for trainingjob in TrainingJob.query.all()}
+        assert statuses[1][Steps.DATA_EXTRACTION.name] == States.IN_PROGRESS.name
+        assert statuses[2][Steps.DATA_EXTRACTION.name] == States.FAILED.name
+        mock_notification.assert_called_once_with(1)
+        mock_add_job.assert_called_once_with([1])
+        assert [(event.trainingjob_id, event.state) for event in get_trainingjob_events(0, 10)] == \
+            [(2, States.FAILED.name), (1, States.IN_PROGRESS.name)]
+
+    @pytest.mark.parametrize("failing", ["transition_steps_of_trainingjobs", "add_data_extraction_jobs"])
+    @patch('trainingmgr.service.training_job_service.notification_rapp')
+    @patch('trainingmgr.service.training_job_service.data_extraction_start')
+    @patch('trainingmgr.service.training_job_service.get_modelinfo_by_modelId_service')
+    def test_untracked_trainingjobs_are_failed(self, mock_modelinfo, mock_data_extraction, mock_notification, failing):
+        mock_modelinfo.side_effect = self.registered_model
+        mock_data_extraction.side_effect = self.data_extraction
+        with patch(f'trainingmgr.service.training_job_service.{failing}', side_effect=DBException("db down")):
+            results = create_training_jobs([trainingjob_spec("qoe"), trainingjob_spec("qoe")])
+        assert [(result["status"], result["trainingJobId"]) for result in results] == [(500, 1), (500, 2)]
+        statuses = {trainingjob.id: json.loads(trainingjob.steps_state.states) for trainingjob in TrainingJob.query.all()}
+        assert [statuses[id][Steps.DATA_EXTRACTION.name] for id in (1, 2)] == [States.FAILED.name] * 2
+        mock_notification.assert_not_called()
+
+    @patch('trainingmgr.service.training_job_service.data_extraction_start')
+    @patch('trainingmgr.service.training_job_service.get_modelinfo_by_modelId_service', return_value=None)
+    def test_nothing_to_create(self, mock_modelinfo, mock_data_extraction):
+        assert [result["status"] for result in create_training_jobs([trainingjob_spec("qoe")])] == [400]
+        assert TrainingJob.query.count() == 0
+        mock_data_extraction.assert_not_called()
+
 class TestDeleteTrainingJob:
 
     @pytest.fixture
@@ -219,6 +367,23 @@ class TestDeleteTrainingJob:
         result = delete_training_job(1)
         assert result is True
 
+    @patch('trainingmgr.service.training_job_service.get_trainingjob')
+    @patch('trainingmgr.service.training_job_service.delete_trainingjob_by_id', return_value=True)
+    @patch('trainingmgr.service.training_job_service.change_field_value')
+    @patch('trainingmgr.service.training_job_service.remove_work')
+    @patch('trainingmgr.service.training_job_service.terminate_training_service')
+    def test_delete_training_job_in_data_extraction(self, mock_terminate_training, mock_remove_work, mock_field_value,
+                                                    mock_delete_trainingjob_by_id, mock_get_trainingjob, mock_training_job):
+        mock_training_job.steps_state.states = json.dumps({"DATA_EXTRACTION": "IN_PROGRESS",
+                                                           "DATA_EXTRACTION_AND_TRAINING": "NOT_STARTED",
+                                                           "TRAINING": "NOT_STARTED"})
+        mock_get_trainingjob.return_value = mock_training_job
+        assert delete_training_job(1) is True
+        # Its data extraction status is no longer checked
+        mock_remove_work.assert_any_call(1, "POLL_DATA_EXTRACTION")
+        mock_remove_work.assert_any_call(1, "START_PIPELINE")
+        mock_terminate_training.assert_not_called()
+
     @patch('trainingmgr.service.training_job_service.get_trainingjob')
     def test_delete_training_job_no_result(self, mock_get_trainingjob):
         # Simulate no result found
@@ -234,11 +399,43 @@ class TestDeleteTrainingJob:
             delete_training_job(1)
         assert "delete_trainining_job failed with exception" in str(exc_info.value)
 
+class TestDeleteTrainingJobs:
+    @patch('trainingmgr.service.training_job_service.add_deletion_jobs')
+    @patch('trainingmgr.service.training_job_service.mark_trainingjobs_for_deletion', return_value=[1, 3])
+    def test_deletions_are_queued(self, mock_mark, mock_add_deletion_jobs):
+        assert delete_training_jobs([3, 2, 1, 4]) == ([1, 3], [2, 4])
+        mock_mark.assert_called_once_with([3, 2, 1, 4])
+        mock_add_deletion_jobs.assert_called_once_with([1, 3])
+
+    @patch('trainingmgr.service.training_job_service.add_deletion_jobs')
+    @patch('trainingmgr.service.training_job_service.mark_trainingjobs_for_deletion',
+           side_effect=DBException("Database error"))
+    def test_db_error(self, mock_mark, mock_add_deletion_jobs):
+        with pytest.raises(DBException):
+            delete_training_jobs([1])
+        mock_add_deletion_jobs.assert_not_called()
+
+class TestGetStepsState:
+    @patch('trainingmgr.service.training_job_service.get_trainingjob')
+    def test_returns_states(self, mock_get_trainingjob):
+        mock_get_trainingjob.return_value.steps_state.states = '{"DATA_EXTRACTION": "IN_PROGRESS"}'
+        assert get_steps_state(1) == '{"DATA_EXTRACTION": "IN_PROGRESS"}'
+
+    @patch('trainingmgr.service.training_job_service.get_trainingjob', side_effect=Exception("Database error"))
+    def test_db_error(self, mock_get_trainingjob):
+        with pytest.raises(DBException):
+            get_steps_state(1)
+
 class TestUpdateArtifactVersion:
+    @patch('trainingmgr.service.training_job_service.invalidate_modelinfo_service')
+    @patch('trainingmgr.service.training_job_service.get_trainingjob')
     @patch('trainingmgr.service.training_job_service.changeartifact')
-    def test_update_artifact_version_success(self, mock_changeartifact):
+    def test_update_artifact_version_success(self, mock_changeartifact, mock_get_trainingjob, mock_invalidate):
+        mock_get_trainingjob.return_value.modelId.modelname = "qoe"
+        mock_get_trainingjob.return_value.modelId.modelversion = "1"
         result = update_artifact_version(1, "1.0.0", "minor")
         assert result == "1.1.0"
+        mock_invalidate.assert_called_once_with("qoe", "1")
 
     def test_update_artifact_version_invalid_level(self):
         with pytest.raises(TMException) as exc_info:
@@ -327,6 +524,62 @@ class TestTraining:
         response, status_code = training(mock_Trainingjob)
         assert status_code == 500
 
+class TestStartTrainingPipeline:
+    @pytest.fixture
+    def mock_trainingjob(self):
+        trainingjob = MagicMock()
+        trainingjob.id = 1
+        trainingjob.modelId.modelname = "test_model"
+        trainingjob.modelId.modelversion = "1"
+        trainingjob.model_location = ""
+        trainingjob.training_config = {
+            "dataPipeline": {"feature_group_name": "test_fg", "arguments": {"epochs": 1}},
+            "trainingPipeline": {"training_pipeline_name": "qoe_pipeline", "training_pipeline_version": "v1"}
+        }
+        return trainingjob
+
+    @patch('trainingmgr.service.training_job_service.change_update_field_value')
+    @patch('trainingmgr.service.training_job_service.transition_status_tj')
+    @patch('trainingmgr.service.training_job_service.training_start')
+    @patch('trainingmgr.service.training_job_service.get_modelinfo_by_modelId_service',
+           return_value=[{"modelId": {"artifactVersion": "0.0.0"}, "modelLocation": ""}])
+    def test_success(self, mock_modelinfo, mock_training_start, mock_transition_tj, mock_update_field, mock_trainingjob):
+        response = MagicMock()
+        response.headers = {'content-type': 'application/json'}
+        response.status_code = 200
+        response.json.return_value = {'run_status': 'scheduled', 'run_id': 'run-1'}
+        mock_training_start.return_value = response
+
+        assert start_training_pipeline(mock_trainingjob) == "run-1"
+        training_details = mock_training_start.call_args[0][1]
+        assert training_details["pipeline_name"] == "qoe_pipeline"
+        assert training_details["arguments"]["epochs"] == "1"
+        mock_transition_tj.assert_called_once_with(1, {Steps.DATA_EXTRACTION_AND_TRAINING.name: States.FINISHED.name,
+                                                       Steps.TRAINING.name: States.IN_PROGRESS.name})
+        mock_update_field.assert_called_once_with(1, "run_id", "run-1")
+
+    @patch('trainingmgr.service.training_job_service.get_modelinfo_by_modelId_service', return_value=None)
+    def test_model_not_registered(self, mock_modelinfo, mock_trainingjob):
+        with pytest.raises(APIException) as err:
+            start_training_pipeline(mock_trainingjob)
+        assert err.value.code == 400
+
+    @patch('trainingmgr.service.training_job_service.transition_status_tj')
+    @patch('trainingmgr.service.training_job_service.training_start')
+    @patch('trainingmgr.service.training_job_service.get_modelinfo_by_modelId_service',
+           return_value=[{"modelId": {"artifactVersion": "0.0.0"}, "modelLocation": ""}])
+    def test_run_not_scheduled(self, mock_modelinfo, mock_training_start, mock_transition_tj, mock_trainingjob):
+        response = MagicMock()
+        response.headers = {'content-type': 'application/json'}
+        response.status_code = 200
+        response.json.return_value = {'run_status': 'failed', 'run_id': 'run-1'}
+        mock_training_start.return_value = response
+
+        with pytest.raises(TMException):
+            start_training_pipeline(mock_trainingjob)
+        mock_transition_tj.assert_not_called()
+
+
 class TestFetchTrainingJobInfosFromModelId:
     @patch('trainingmgr.service.training_job_service.get_trainingjobs_by_model_id_db')
     def test_success(self, mock_gettrainingJob):
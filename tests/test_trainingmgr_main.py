@@ -35,7 +35,7 @@ from trainingmgr.constants.states import States
 from threading import Lock
 from trainingmgr.common.tmgr_logger import TMLogger
 from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
-from trainingmgr.common.exceptions_utls import DBException, TMException
+from trainingmgr.common.exceptions_utls import DBException, TMException, DownstreamUnavailableException
 from trainingmgr.models import TrainingJob
 from trainingmgr.models import FeatureGroup
 from trainingmgr.common.trainingConfig_parser import getField
@@ -164,8 +164,8 @@ class TestDataExtractionNotification:
     }]
     @patch('trainingmgr.trainingmgr_main.check_key_in_dictionary', return_value = True)
     @patch('trainingmgr.trainingmgr_main.get_training_job')
-    @patch('trainingmgr.trainingmgr_main.get_modelinfo_by_modelId_service', return_value = registered_model_list1)
-    @patch('trainingmgr.trainingmgr_main.fetch_pipelinename_and_version', return_value = ("", ""))
+    @patch('trainingmgr.service.training_job_service.get_modelinfo_by_modelId_service', return_value = registered_model_list1)
+    @patch('trainingmgr.service.training_job_service.fetch_pipelinename_and_version', return_value = ("", ""))
     def test_dataextraction_trainingModel_error(self, mock_fetchname, mock_getmodelInfo, mock_get_trainingjob, mock_check_dict, mock_training_job):        
         mock_get_trainingjob.return_value = mock_training_job
         trainingjob_req = {
@@ -184,8 +184,8 @@ class TestDataExtractionNotification:
     }]
     @patch('trainingmgr.trainingmgr_main.check_key_in_dictionary', return_value = True)
     @patch('trainingmgr.trainingmgr_main.get_training_job')
-    @patch('trainingmgr.trainingmgr_main.get_modelinfo_by_modelId_service', return_value = registered_model_list2)
-    @patch('trainingmgr.trainingmgr_main.fetch_pipelinename_and_version', return_value = ("", ""))
+    @patch('trainingmgr.service.training_job_service.get_modelinfo_by_modelId_service', return_value = registered_model_list2)
+    @patch('trainingmgr.service.training_job_service.fetch_pipelinename_and_version', return_value = ("", ""))
     def test_dataextraction_retrainingModel_error(self, mock_fetch_pipeline, mock_getmodelInfo, mock_get_trainingjob, mock_check_dict, mock_training_job):        
         mock_get_trainingjob.return_value = mock_training_job
         trainingjob_req = {
@@ -205,9 +205,9 @@ class TestDataExtractionNotification:
     }]
     @patch('trainingmgr.trainingmgr_main.check_key_in_dictionary', return_value = True)
     @patch('trainingmgr.trainingmgr_main.get_training_job')
-    @patch('trainingmgr.trainingmgr_main.get_modelinfo_by_modelId_service', return_value = registered_model_list3)
-    @patch('trainingmgr.trainingmgr_main.fetch_pipelinename_and_version', return_value = ("qoe_pipeline", "v1"))
-    @patch('trainingmgr.trainingmgr_main.training_start')
+    @patch('trainingmgr.service.training_job_service.get_modelinfo_by_modelId_service', return_value = registered_model_list3)
+    @patch('trainingmgr.service.training_job_service.fetch_pipelinename_and_version', return_value = ("qoe_pipeline", "v1"))
+    @patch('trainingmgr.service.training_job_service.training_start')
     def test_dataextraction_trainingModel_invalidresponse_kf(self, mock_training_start, mock_fetch_pipeline, 
      mock_getmodelInfo, mock_get_trainingjob, mock_check_dict, mock_training_job):        
          
@@ -226,11 +226,11 @@ class TestDataExtractionNotification:
 
     @patch('trainingmgr.trainingmgr_main.check_key_in_dictionary', return_value = True)
     @patch('trainingmgr.trainingmgr_main.get_training_job')
-    @patch('trainingmgr.trainingmgr_main.get_modelinfo_by_modelId_service', return_value = registered_model_list3)
-    @patch('trainingmgr.trainingmgr_main.fetch_pipelinename_and_version', return_value = ("qoe_pipeline", "v1"))
-    @patch('trainingmgr.trainingmgr_main.training_start')
-    @patch('trainingmgr.trainingmgr_main.change_status_tj')
-    @patch('trainingmgr.trainingmgr_main.change_update_field_value')
+    @patch('trainingmgr.service.training_job_service.get_modelinfo_by_modelId_service', return_value = registered_model_list3)
+    @patch('trainingmgr.service.training_job_service.fetch_pipelinename_and_version', return_value = ("qoe_pipeline", "v1"))
+    @patch('trainingmgr.service.training_job_service.training_start')
+    @patch('trainingmgr.service.training_job_service.transition_status_tj')
+    @patch('trainingmgr.service.training_job_service.change_update_field_value')
     def test_dataextraction_trainingModel_validresponse_kf(self, mock_update_field_val, mock_change_status,
      mock_training_start, mock_fetch_pipeline, mock_getmodelInfo, mock_get_trainingjob, mock_check_dict, mock_training_job):        
          
@@ -249,6 +249,104 @@ class TestDataExtractionNotification:
         assert response.status_code == 200
         assert "pipeline is scheduled" in str(response.data)
 
+    @patch('trainingmgr.trainingmgr_main.retry_training_pipeline_start')
+    @patch('trainingmgr.trainingmgr_main.notification_rapp')
+    @patch('trainingmgr.trainingmgr_main.change_state_to_failed')
+    @patch('trainingmgr.trainingmgr_main.get_training_job')
+    @patch('trainingmgr.trainingmgr_main.start_training_pipeline',
+           side_effect=DownstreamUnavailableException("Circuit breaker of kf-adapter is open"))
+    def test_dataextraction_kf_unavailable_is_retried(self, mock_start_pipeline, mock_get_trainingjob, mock_failed,
+                                                      mock_notify, mock_retry, mock_training_job):
+        mock_get_trainingjob.return_value = mock_training_job
+        response = self.client.post('/trainingjob/dataExtractionNotification', data=json.dumps({"trainingjob_id": "1"}),
+                                    content_type="application/json")
+        assert response.status_code == 503
+        assert response.json["title"] == "Service Unavailable"
+        # The trainingjob is not failed, its start is retried in the background
+        mock_failed.assert_not_called()
+        mock_notify.assert_not_called()
+        mock_retry.assert_called_once_with(1)
+
+    @patch('trainingmgr.trainingmgr_main.retry_training_pipeline_start')
+    @patch('trainingmgr.trainingmgr_main.change_state_to_failed')
+    @patch('trainingmgr.trainingmgr_main.get_training_job')
+    @patch('trainingmgr.service.training_job_service.get_modelinfo_by_modelId_service', return_value = registered_model_list3)
+    @patch('trainingmgr.service.training_job_service.fetch_pipelinename_and_version', return_value = ("qoe_pipeline", "v1"))
+    def test_dataextraction_open_breaker_fails_fast(self, mock_fetch_pipeline, mock_getmodelInfo, mock_get_trainingjob,
+                                                     mock_failed, mock_retry, mock_training_job):
+        from trainingmgr.common.http_client import CircuitBreaker
+        from trainingmgr.common.trainingmgr_operations import KF_ADAPTER_CLIENT
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.record(False)
+        mock_get_trainingjob.return_value = mock_training_job
+        with patch.object(KF_ADAPTER_CLIENT, 'breaker', breaker), \
+                patch.object(KF_ADAPTER_CLIENT, 'isolated', True), \
+                patch.object(KF_ADAPTER_CLIENT, 'max_concurrent', 20), \
+                patch.object(KF_ADAPTER_CLIENT.session, 'request') as mock_request:
+            response = self.client.post('/trainingjob/dataExtractionNotification',
+                                        data=json.dumps({"trainingjob_id": "1"}), content_type="application/json")
+        assert response.status_code == 503
+        # The breaker only fails the call fast, the trainingjob is left to be retried
+        mock_request.assert_not_called()
+        mock_failed.assert_not_called()
+        mock_retry.assert_called_once_with(1)
+
+
+class TestDataExtractionStatusNotification:
+    def setup_method(self):
+        self.client = trainingmgr_main.APP.test_client(self)
+
+    def test_missing_keys(self):
+        response = self.client.post('/trainingjob/dataExtractionStatusNotification',
+                                    data=json.dumps({"trainingjob_id": 1}), content_type="application/json")
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("data", [
+        json.dumps({"trainingjob_id": "abc", "task_status": "Completed"}),
+        json.dumps({"trainingjob_id": None, "task_status": "Completed"}),
+        json.dumps({"trainingjob_id": True, "task_status": "Completed"}),
+        json.dumps({"trainingjob_id": 1, "task_status": 5}),
+        json.dumps([1, "Completed"]),
+        "not json",
+    ])
+    @patch('trainingmgr.trainingmgr_main.get_training_job')
+    def test_invalid_payload(self, mock_get_trainingjob, data):
+        response = self.client.post('/trainingjob/dataExtractionStatusNotification',
+                                    data=data, content_type="application/json")
+        assert response.status_code == 400
+        assert "Exception" in response.json
+        mock_get_trainingjob.assert_not_called()
+
+    @patch('trainingmgr.trainingmgr_main.get_training_job', return_value=None)
+    def test_trainingjob_not_found(self, mock_get_trainingjob):
+        response = self.client.post('/trainingjob/dataExtractionStatusNotification',
+                                    data=json.dumps({"trainingjob_id": 1, "task_status": "Completed"}),
+                                    content_type="application/json")
+        assert response.status_code == 404
+
+    @patch('trainingmgr.trainingmgr_main.defer_data_extraction_job')
+    @patch('trainingmgr.trainingmgr_main.handle_data_extraction_task_status', return_value=True)
+    @patch('trainingmgr.trainingmgr_main.get_training_job')
+    def test_final_status_is_handled(self, mock_get_trainingjob, mock_handle, mock_defer):
+        trainingjob = MagicMock()
+        mock_get_trainingjob.return_value = trainingjob
+        response = self.client.post('/trainingjob/dataExtractionStatusNotification',
+                                    data=json.dumps({"trainingjob_id": "1", "task_status": "Completed"}),
+                                    content_type="application/json")
+        assert response.status_code == 200
+        mock_handle.assert_called_once_with(trainingmgr_main.APP, trainingjob, "Completed")
+        mock_defer.assert_not_called()
+
+    @patch('trainingmgr.trainingmgr_main.defer_data_extraction_job')
+    @patch('trainingmgr.trainingmgr_main.handle_data_extraction_task_status', return_value=False)
+    @patch('trainingmgr.trainingmgr_main.get_training_job')
+    def test_in_progress_status_defers_polling(self, mock_get_trainingjob, mock_handle, mock_defer):
+        response = self.client.post('/trainingjob/dataExtractionStatusNotification',
+                                    data=json.dumps({"trainingjob_id": 1, "task_status": "In-Progress"}),
+                                    content_type="application/json")
+        assert response.status_code == 200
+        mock_defer.assert_called_once_with(1)
+
 
 class TestPipelineNotification:
 
@@ -283,24 +381,13 @@ class TestPipelineNotification:
         TrainingJob.deletion_in_progress = False
         return TrainingJob
     
-    registered_model_list = [{ 
-        "modelId" : { 
-            "artifactVersion" : "1.0"
-        },
-        "modelLocation": "s3://different-location"
-    }]
-        
-    @patch('trainingmgr.trainingmgr_main.MM_SDK', return_value = mocked_mm_sdk)
     @patch('trainingmgr.trainingmgr_main.check_key_in_dictionary', return_value = True)
     @patch('trainingmgr.trainingmgr_main.get_training_job')
-    @patch('trainingmgr.trainingmgr_main.change_status_tj')
+    @patch('trainingmgr.trainingmgr_main.transition_status_tj', return_value = True)
     @patch('trainingmgr.trainingmgr_main.notification_rapp')
-    @patch('trainingmgr.trainingmgr_main.get_modelinfo_by_modelId_service', return_value = registered_model_list)
-    @patch('trainingmgr.trainingmgr_main.change_update_field_value')
-    
-    def test_success(self, mock_update_field_value, mock_get_modelinfo, mock_notification_rapp, mock_change_status, 
-     mock_get_trainingjob, mock_check_in_dict, mock_mmsdk, mock_training_job):
-        mock_mmsdk.check_object.return_value = True
+    @patch('trainingmgr.trainingmgr_main.add_model_url_job')
+    def test_success(self, mock_add_model_url_job, mock_notification_rapp, mock_transition_status,
+     mock_get_trainingjob, mock_check_in_dict, mock_training_job):
         mock_get_trainingjob.return_value = mock_training_job
         trainingjob_req = {
                      "trainingjob_id" : "123",
@@ -310,19 +397,38 @@ class TestPipelineNotification:
                                     content_type="application/json")
         assert response.status_code == 200
         assert response.json == {'Message': 'Training successful'}
+        mock_add_model_url_job.assert_called_once_with("123")
+        mock_transition_status.assert_called_once_with("123",
+            {"TRAINING": "FINISHED", "TRAINING_AND_TRAINED_MODEL": "FINISHED", "TRAINED_MODEL": "IN_PROGRESS"},
+            expected={"TRAINING": "IN_PROGRESS"})
+
+    @patch('trainingmgr.trainingmgr_main.check_key_in_dictionary', return_value = True)
+    @patch('trainingmgr.trainingmgr_main.get_training_job')
+    @patch('trainingmgr.trainingmgr_main.transition_status_tj', return_value = False)
+    @patch('trainingmgr.trainingmgr_main.notification_rapp')
+    @patch('trainingmgr.trainingmgr_main.add_model_url_job')
+    def test_training_not_in_progress(self, mock_add_model_url_job, mock_notification_rapp, mock_transition_status,
+     mock_get_trainingjob, mock_check_in_dict, mock_training_job):
+        mock_get_trainingjob.return_value = mock_training_job
+        trainingjob_req = {
+                     "trainingjob_id" : "123",
+                     "run_status" : "SUCCEEDED"
+        }
+        response = self.client.post('/trainingjob/pipelineNotification', data = json.dumps(trainingjob_req),
+                                    content_type="application/json")
+        assert response.status_code == 409
+        mock_notification_rapp.assert_not_called()
+        mock_add_model_url_job.assert_not_called()
 
 
-    mocked_mm_sdk_false = mock.Mock(name="MM_SDK")
-    @patch('trainingmgr.trainingmgr_main.MM_SDK', return_value = mocked_mm_sdk)
     @patch('trainingmgr.trainingmgr_main.check_key_in_dictionary', return_value = True)
     @patch('trainingmgr.trainingmgr_main.get_training_job')
-    @patch('trainingmgr.trainingmgr_main.change_status_tj')
+    @patch('trainingmgr.trainingmgr_main.transition_status_tj', return_value = True)
     @patch('trainingmgr.trainingmgr_main.notification_rapp')
-    @patch('trainingmgr.trainingmgr_main.get_modelinfo_by_modelId_service', return_value = registered_model_list)
-    
-    def test_unsuccess_object_not_present_in_mmsdk(self, mock_get_modelinfo, mock_notification_rapp, mock_change_status, 
-     mock_get_trainingjob, mock_check_in_dict, mock_mmsdk, mock_training_job):  
-        mock_mmsdk.check_object.return_value = False
+    @patch('trainingmgr.trainingmgr_main.change_state_to_failed')
+    @patch('trainingmgr.trainingmgr_main.add_model_url_job', side_effect = DBException("queue unavailable"))
+    def test_unsuccess_model_url_not_queued(self, mock_add_model_url_job, mock_change_state_to_failed, mock_notification_rapp,
+     mock_transition_status, mock_get_trainingjob, mock_check_in_dict, mock_training_job):
         mock_get_trainingjob.return_value = mock_training_job
         trainingjob_req = {
                      "trainingjob_id" : "123",
@@ -330,13 +436,14 @@ class TestPipelineNotification:
         }
         response = self.client.post('/trainingjob/pipelineNotification', data = json.dumps(trainingjob_req),
                                     content_type="application/json")
-        assert response.status_code == 500    
+        assert response.status_code == 500
+        mock_change_state_to_failed.assert_called_once_with(1)
 
     @patch('trainingmgr.trainingmgr_main.check_key_in_dictionary', return_value = True)
     @patch('trainingmgr.trainingmgr_main.get_training_job')
-    @patch('trainingmgr.trainingmgr_main.change_status_tj')
+    @patch('trainingmgr.trainingmgr_main.transition_status_tj', return_value = True)
     @patch('trainingmgr.trainingmgr_main.notification_rapp')
-    def test_unsuccess(self, mock_notification_rapp, mock_change_status, mock_get_trainingjob, mock_check_in_dict, 
+    def test_unsuccess(self, mock_notification_rapp, mock_transition_status, mock_get_trainingjob, mock_check_in_dict, 
      mock_training_job):
         mock_get_trainingjob.return_value = mock_training_job
         trainingjob_req = {
@@ -441,3 +548,30 @@ class TestDeleteListOfFeatureGroup:
         assert response.status_code == 400
         assert "Wrong Request syntax" in response.json["Exception"]
 
+
+class TestInitTrainingManager:
+    @patch.object(trainingmgr_main.TRAININGMGR_CONFIG_OBJ, 'is_config_loaded_properly', return_value=False)
+    def test_config_not_loaded(self, mock_config_loaded):
+        with pytest.raises(TMException):
+            trainingmgr_main.init_training_manager()
+
+    @patch.dict(trainingmgr_main.APP.config)
+    @patch.multiple(trainingmgr_main, LOGGER=None, PS_DB_OBJ=None, MM_SDK=None, PSDB=MagicMock(), db=MagicMock(),
+                    Migrate=MagicMock(), ensure_schema=MagicMock(return_value=False), CORS=MagicMock(),
+                    ModelMetricsSdk=MagicMock(), monitor_pool=MagicMock(), warm_pool=MagicMock())
+    @patch.object(trainingmgr_main.TRAININGMGR_CONFIG_OBJ, 'is_config_loaded_properly', return_value=True)
+    @patch.object(trainingmgr_main, 'start_status_stream_handler')
+    @patch.object(trainingmgr_main, 'start_notification_handler')
+    @patch.object(trainingmgr_main, 'start_async_handler')
+    def test_starts_handlers_once(self, mock_async_handler, mock_notification_handler, mock_status_stream_handler,
+                                  mock_config_loaded):
+        assert trainingmgr_main.init_training_manager() is trainingmgr_main.APP
+        trainingmgr_main.ensure_schema.assert_called_once_with(trainingmgr_main.TRAININGMGR_CONFIG_OBJ, False)
+        assert trainingmgr_main.APP.config['SQLALCHEMY_ENGINE_OPTIONS']['pool_pre_ping'] is True
+        trainingmgr_main.PS_DB_OBJ.attach_engine.assert_called_once_with(trainingmgr_main.db.engine)
+        trainingmgr_main.warm_pool.assert_called_once_with(trainingmgr_main.db.engine,
+                                                           trainingmgr_main.TRAININGMGR_CONFIG_OBJ.db_pool_size)
+        mock_async_handler.assert_called_once_with(trainingmgr_main.APP, trainingmgr_main.db)
+        mock_notification_handler.assert_called_once()
+        mock_status_stream_handler.assert_called_once_with(trainingmgr_main.APP)
+        assert trainingmgr_main.MM_SDK is not None
@@ -15,6 +15,7 @@
 # #   limitations under the License.
 # #
 # # ==================================================================================
+import json
 from mock import patch
 import pytest
 from requests.models import Response
@@ -37,6 +38,8 @@ class DummyVariable:
     data_extraction_port = 32000
     model_management_service_ip="localhost"
     model_management_service_port=123123
+    my_ip = "localhost"
+    my_port = 32002
     logger = trainingmgr_main.LOGGER
 
 class DummyStepsState:
@@ -45,6 +48,7 @@ class DummyStepsState:
 
 class DummyTrainingJob:
     def __init__(self, cur_state, notification_url):
+        self.id = 1
         self.steps_state = DummyStepsState(cur_state)
         self.notification_url = notification_url
 
@@ -56,7 +60,7 @@ class Test_data_extraction_start:
     de_result = Response()
     de_result.status_code = status.HTTP_200_OK
     de_result.headers={'content-type': MIMETYPE_JSON}
-    @patch('trainingmgr.common.trainingmgr_operations.requests.post', return_value = de_result)
+    @patch('trainingmgr.common.trainingmgr_operations.DATA_EXTRACTION_CLIENT.post', return_value = de_result)
     def test_success(self, mock1):
         trainingjob_id = 1
         featuregroup_name = "base1"
@@ -83,7 +87,7 @@ class Test_data_extraction_status:
     de_result = Response()
     de_result.status_code = status.HTTP_200_OK
     de_result.headers={'content-type': MIMETYPE_JSON}
-    @patch('trainingmgr.common.trainingmgr_operations.requests.get', return_value = de_result)
+    @patch('trainingmgr.common.trainingmgr_operations.DATA_EXTRACTION_CLIENT.get', return_value = de_result)
     def test_success(self, mock1):
         featuregroup_name = "base1"
         trainingjob_id = 1
@@ -104,7 +108,7 @@ class Test_training_start:
     ts_result = Response()
     ts_result.status_code = status.HTTP_200_OK
     ts_result.headers={'content-type': MIMETYPE_JSON}
-    @patch('trainingmgr.common.trainingmgr_operations.requests.post', return_value = ts_result)
+    @patch('trainingmgr.common.trainingmgr_operations.KF_ADAPTER_CLIENT.post', return_value = ts_result)
     def test_success(self, mock1):
         trainingjob_id = 1
         dict_data = {
@@ -159,7 +163,7 @@ class Test_create_url_host_port:
 class Test_create_dme_filtered_data_job:
     the_response=Response()
     the_response.status_code=status.HTTP_201_CREATED
-    @patch('trainingmgr.common.trainingmgr_operations.requests.put', return_value=the_response)
+    @patch('trainingmgr.common.trainingmgr_operations.DME_CLIENT.put', return_value=the_response)
     def test_success(self, mock1):
         training_config_obj = DummyVariable()
         source_name="GNBDU324"
@@ -175,7 +179,7 @@ class Test_create_dme_filtered_data_job:
 class Test_delete_dme_filtered_data_job:
     the_response=Response()
     the_response.status_code=status.HTTP_204_NO_CONTENT
-    @patch('trainingmgr.common.trainingmgr_operations.requests.delete', return_value=the_response)
+    @patch('trainingmgr.common.trainingmgr_operations.DME_CLIENT.delete', return_value=the_response)
     def test_success(self, mock1):
         training_config_obj = DummyVariable()
         feature_group_name="test"
@@ -192,19 +196,23 @@ class Test_notification_rapp:
             Steps.TRAINING_AND_TRAINED_MODEL.name: States.NOT_STARTED.name,
             Steps.TRAINED_MODEL.name: States.NOT_STARTED.name
         }
-    the_response=Response()
-    the_response.status_code=status.HTTP_200_OK
     @patch('trainingmgr.common.trainingmgr_operations.get_trainingjob', return_value = DummyTrainingJob(steps_state, "dummy_url"))
-    @patch('trainingmgr.common.trainingmgr_operations.requests.post', return_value=the_response)
-    def test_success(self, mock1, mock2):
+    @patch('trainingmgr.common.trainingmgr_operations.submit_notification', return_value = True)
+    def test_success(self, mock_submit, mock_get_trainingjob):
         trainingmgr_operations.notification_rapp(1)
-        
-    the_response=Response()
-    the_response.status_code=status.HTTP_404_NOT_FOUND
-    @patch('trainingmgr.common.trainingmgr_operations.get_trainingjob', return_value = DummyTrainingJob(steps_state, "dummy_url"))
-    @patch('trainingmgr.common.trainingmgr_operations.requests.post', return_value=the_response)
-    def test_failure(self, mock1, mock2):
+        mock_submit.assert_called_once_with(1, "dummy_url", json.dumps(self.steps_state))
+
+    @patch('trainingmgr.common.trainingmgr_operations.get_trainingjob', return_value = DummyTrainingJob(steps_state, ""))
+    @patch('trainingmgr.common.trainingmgr_operations.submit_notification')
+    def test_no_notification_url(self, mock_submit, mock_get_trainingjob):
+        trainingmgr_operations.notification_rapp(1)
+        mock_submit.assert_not_called()
+
+    @patch('trainingmgr.common.trainingmgr_operations.get_trainingjob', side_effect = Exception("DB error"))
+    @patch('trainingmgr.common.trainingmgr_operations.submit_notification')
+    def test_failure(self, mock_submit, mock_get_trainingjob):
         resp = trainingmgr_operations.notification_rapp(1)
         assert resp is None, f"notification_rapp is supposed to fail and return None, but except it returned {resp}"
+        mock_submit.assert_not_called()
         
         
\ No newline at end of file
@@ -16,72 +16,23 @@
 #
 # ==================================================================================
 import pytest
-import sys
-import os
-from mock import patch
+from unittest.mock import MagicMock
+from trainingmgr.common.exceptions_utls import DBException
 from trainingmgr.db.trainingmgr_ps_db import PSDB
-from dotenv import load_dotenv
 
-class cred_handle:
-    def __init__(self):
-        self.ps_user = "gdgdgd"
-        self.ps_password = "xxxx"
-        self.ps_ip = 12345
-        self.ps_port = 1000
-    
-    def logger(self):
-        return cred_handle()
-    
-    def error(self):
-        raise Exception('Connection Failed To Exist')
-
-class Cursor:
-    def __init__(self, db_name):
-        self.db_name = db_name
-
-    def execute(self, query):
-        pass
-
-    def fetchall(self):
-        return [self.db_name]
-    
-    def close(self):
-        pass
-
-class connection:
-    def __init__(self, db_name):
-        self.autocommit = False
-        self.db_name = db_name
-    
-    def cursor(self):
-        return Cursor(self.db_name)
-    
-    def rollback(self):
-        pass
-
-    def commit(self):
-        pass
-
-    def close(self):
-        pass
 
 class Test_PSDB:
-    @patch('trainingmgr.db.trainingmgr_ps_db.pg8000.dbapi.connect', return_value = connection('usecase_manager_database'))
-    def setup_method(self,mock1,mock2):
-        self.obj = PSDB(cred_handle())
-
-    def test_init_psdb(self):
-        assert self.obj != None, 'PSDB Object Creation Failed'
-
-    @patch('trainingmgr.db.trainingmgr_ps_db.pg8000.dbapi.connect', return_value = connection('usecase_manager_database'))
-    def test_get_new_conn(self, mock1):
-        out =  self.obj.get_new_conn()
-        assert out != None, 'New Connection Failed'
-
-    def test_negative_get_new_conn(self):
-        try:
-            out =  self.obj.get_new_conn()
-            assert out != None, 'New Connection Failed'
-            assert False
-        except Exception:
-            assert True
\ No newline at end of file
+    def setup_method(self):
+        self.obj = PSDB(MagicMock())
+
+    def test_get_new_conn_from_the_pool(self):
+        engine = MagicMock()
+        self.obj.attach_engine(engine)
+        assert self.obj.get_new_conn() is engine.raw_connection.return_value
+        engine.raw_connection.side_effect = Exception("QueuePool limit reached")
+        with pytest.raises(DBException, match="Failed to get db connection from the pool"):
+            self.obj.get_new_conn()
+
+    def test_get_new_conn_without_engine(self):
+        with pytest.raises(DBException):
+            self.obj.get_new_conn()
@@ -0,0 +1,89 @@
+# ==================================================================================
+#
+#      Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# ==================================================================================
+import threading
+import time
+import pytest
+from unittest.mock import patch, MagicMock
+from trainingmgr.common import ttl_cache
+from trainingmgr.common.ttl_cache import TTLCache
+from trainingmgr.common.exceptions_utls import TMException
+
+
+@pytest.fixture
+def cache():
+    return TTLCache(maxsize=2, ttl=60, negative_ttl=5)
+
+
+class TestTTLCache:
+    def test_loaded_once_until_expired(self, cache):
+        loader = MagicMock(return_value=[{"modelId": {"artifactVersion": "1.0.0"}}])
+        with patch.object(ttl_cache.time, 'monotonic', return_value=100):
+            assert cache.get_or_load("qoe", loader) == loader.return_value
+            assert cache.get_or_load("qoe", loader) == loader.return_value
+        assert loader.call_count == 1
+        with patch.object(ttl_cache.time, 'monotonic', return_value=161):
+            cache.get_or_load("qoe", loader)
+        assert loader.call_count == 2
+
+    def test_not_found_is_cached_briefly(self, cache):
+        loader = MagicMock(return_value=None)
+        with patch.object(ttl_cache.time, 'monotonic', return_value=100):
+            assert cache.get_or_load("qoe", loader) is None
+        with patch.object(ttl_cache.time, 'monotonic', return_value=104):
+            cache.get_or_load("qoe", loader)
+        assert loader.call_count == 1
+        with patch.object(ttl_cache.time, 'monotonic', return_value=106):
+            cache.get_or_load("qoe", loader)
+        assert loader.call_count == 2
+
+    def test_errors_are_not_cached(self, cache):
+        loader = MagicMock(side_effect=[TMException("Unexpected response from mme: 500"), "info"])
+        with pytest.raises(TMException):
+            cache.get_or_load("qoe", loader)
+        assert cache.get_or_load("qoe", loader) == "info"
+
+    def test_least_recently_used_is_evicted(self, cache):
+        cache.get_or_load("a", lambda: 1)
+        cache.get_or_load("b", lambda: 2)
+        cache.get_or_load("a", lambda: 1)
+        cache.get_or_load("c", lambda: 3)
+        assert list(cache.entries) == ["a", "c"]
+
+    def test_invalidate(self, cache):
+        loader = MagicMock(return_value="info")
+        cache.get_or_load("qoe", loader)
+        cache.invalidate("qoe")
+        cache.get_or_load("qoe", loader)
+        assert loader.call_count == 2
+
+    def test_concurrent_lookups_share_one_load(self, cache):
+        release = threading.Event()
+        loader = MagicMock(side_effect=lambda: release.wait(5) and "info")
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("qoe", loader))) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for _ in range(500):
+            if cache.stats()["coalesced"] == 2:
+                break
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert results == ["info"] * 3
+        assert loader.call_count == 1
@@ -0,0 +1,47 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+"""
+Strong ETags of the polled GET endpoints. A client sending the ETag of the representation it holds
+in If-None-Match is answered 304 Not Modified, without the body being built again.
+"""
+
+import hashlib
+import json
+from flask import current_app
+
+
+def make_etag(*parts):
+    """
+    Returns the ETag (unquoted) of a representation from the values identifying its version,
+    e.g. the id and update time of a row.
+    """
+    return hashlib.blake2b(json.dumps(parts, default=str).encode(), digest_size=16).hexdigest()
+
+
+def conditional_response(request, etag, build):
+    """
+    Returns 304 Not Modified if the If-None-Match header of request matches etag, otherwise the
+    response returned by build. Both carry the ETag.
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = build()
+    response.set_etag(etag)
+    return response
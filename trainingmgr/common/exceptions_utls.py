@@ -88,3 +88,29 @@ class DBException(Exception):
         """
         self.message = message
         super().__init__(self.message)
+
+class DownstreamUnavailableException(TMException):
+    """
+    A class used to represent a request to another service which was not sent, because the
+    service is failing (its circuit breaker is open) or already has too many requests in flight
+
+    Attributes
+    ----------
+    service : str
+        name of the service
+    message : str
+        a formatted string to print out what is exception
+    """
+
+    def __init__(self, service, message="service unavailable"):
+        """
+        Parameters
+        ----------
+        service : str
+            name of the service
+        message : str
+            a formatted string to print out what is exception
+
+        """
+        self.service = service
+        super().__init__(message)
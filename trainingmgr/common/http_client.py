@@ -0,0 +1,236 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+"""
+Outbound HTTP clients of the training manager, one per service it calls.
+"""
+
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
+from trainingmgr.common.exceptions_utls import DownstreamUnavailableException
+
+TRAININGMGR_CONFIG_OBJ = TrainingMgrConfig()
+
+# Services called by the training manager
+KF_ADAPTER = "kf_adapter"
+DATA_EXTRACTION = "data_extraction"
+MME = "mme"
+DME = "dme"
+RAPP = "rapp"
+
+# Upper bounds (in seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class LatencyHistogram:
+    """
+    Cumulative histogram of request latencies, in the form used by Prometheus.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.bucket_counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self.errors = 0
+
+    def observe(self, latency, error=False):
+        with self.lock:
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if latency <= bound:
+                    self.bucket_counts[index] += 1
+            self.count += 1
+            self.sum += latency
+            if error:
+                self.errors += 1
+
+    def snapshot(self):
+        with self.lock:
+            buckets = {str(bound): count for bound, count in zip(LATENCY_BUCKETS, self.bucket_counts)}
+            buckets["+Inf"] = self.count
+            return {"count": self.count, "sum": self.sum, "errors": self.errors, "buckets": buckets}
+
+
+class CircuitBreaker:
+    """
+    Stops the requests to a service after failure_threshold consecutive failures (open). After
+    reset_timeout seconds one trial request is let through (half open), its success lets all
+    requests through again (closed) and its failure opens the breaker again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+
+    def allow(self):
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record(self, success):
+        with self.lock:
+            if success:
+                self.state = self.CLOSED
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def snapshot(self):
+        with self.lock:
+            retry_in = None
+            if self.state == self.OPEN:
+                retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+            return {"state": self.state, "failures": self.failures, "retry_in": retry_in}
+
+
+class HttpClient:
+    """
+    Keeps a pool of connections to one service and sends its requests with timeouts and retries.
+
+    Requests that fail to connect are retried, as are idempotent requests answered with a 502,
+    503 or 504. The latency of every request is recorded, including failed ones.
+
+    Unless isolated is False, requests fail right away with DownstreamUnavailableException while the
+    circuit breaker of the service is open or max_concurrent requests are already in flight, so
+    that a failing or hanging service does not hold up the threads of the training manager.
+    """
+
+    def __init__(self, name, timeout, retries, retry_backoff, pool_size, isolated=False,
+                 max_concurrent=None, breaker=None):
+        self.name = name
+        self.timeout = timeout
+        self.isolated = isolated
+        self.max_concurrent = max_concurrent
+        self.in_flight = 0
+        self.in_flight_lock = threading.Lock()
+        self.breaker = breaker
+        retry = Retry(total=retries, connect=retries, read=0, status=retries,
+                      backoff_factor=retry_backoff, status_forcelist=(502, 503, 504),
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.latency = LatencyHistogram()
+
+    def request(self, method, url, **kwargs):
+        if not self.isolated:
+            return self._send(method, url, **kwargs)
+        with self.in_flight_lock:
+            if self.in_flight >= self.max_concurrent:
+                raise DownstreamUnavailableException(self.name, f"{self.name} has too many requests in flight")
+            self.in_flight += 1
+        if not self.breaker.allow():
+            with self.in_flight_lock:
+                self.in_flight -= 1
+            raise DownstreamUnavailableException(self.name, f"{self.name} is unavailable, its circuit breaker is open")
+        success = False
+        try:
+            response = self._send(method, url, **kwargs)
+            success = response.status_code < 500
+            return response
+        finally:
+            with self.in_flight_lock:
+                self.in_flight -= 1
+            self.breaker.record(success)
+
+    def _send(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        started = time.monotonic()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException:
+            self.latency.observe(time.monotonic() - started, error=True)
+            raise
+        self.latency.observe(time.monotonic() - started, error=response.status_code >= 500)
+        return response
+
+    def state(self):
+        with self.in_flight_lock:
+            in_flight = self.in_flight
+        return {**self.breaker.snapshot(), "in_flight": in_flight, "max_concurrent": self.max_concurrent}
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+
+HTTP_CLIENTS = {}
+HTTP_CLIENTS_LOCK = threading.Lock()
+
+
+def get_http_client(name, timeout=None, retries=None, isolated=True):
+    """
+    Returns the client of the service called name, it is created with the configured timeouts,
+    retries and isolation on first use unless others are given.
+    """
+    with HTTP_CLIENTS_LOCK:
+        if name not in HTTP_CLIENTS:
+            if timeout is None:
+                timeout = (TRAININGMGR_CONFIG_OBJ.http_connect_timeout, TRAININGMGR_CONFIG_OBJ.http_read_timeout)
+            if retries is None:
+                retries = TRAININGMGR_CONFIG_OBJ.http_retries
+            breaker = CircuitBreaker(TRAININGMGR_CONFIG_OBJ.circuit_breaker_failure_threshold,
+                                     TRAININGMGR_CONFIG_OBJ.circuit_breaker_reset_timeout)
+            HTTP_CLIENTS[name] = HttpClient(name, timeout, retries, TRAININGMGR_CONFIG_OBJ.http_retry_backoff,
+                                            TRAININGMGR_CONFIG_OBJ.http_pool_size, isolated,
+                                            TRAININGMGR_CONFIG_OBJ.http_max_concurrent_requests, breaker)
+        return HTTP_CLIENTS[name]
+
+
+def get_http_client_stats():
+    """
+    Returns the request latency histogram of each service called so far.
+    """
+    with HTTP_CLIENTS_LOCK:
+        return {name: client.latency.snapshot() for name, client in HTTP_CLIENTS.items()}
+
+
+def get_circuit_breaker_states():
+    """
+    Returns the circuit breaker state and the requests in flight of each isolated service called so far.
+    """
+    with HTTP_CLIENTS_LOCK:
+        return {name: client.state() for name, client in HTTP_CLIENTS.items() if client.isolated}
@@ -0,0 +1,70 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+"""
+Streamed responses of the list endpoints, sent while the rows are read from the database.
+"""
+
+from itertools import chain, islice
+from flask import Response, stream_with_context
+from trainingmgr.schemas.fast_serializer import dumps
+
+MIMETYPE_JSON = "application/json"
+MIMETYPE_NDJSON = "application/x-ndjson"
+
+
+def streaming_format(request):
+    """
+    Returns the format a list is streamed in for request: "ndjson" when the client accepts NDJSON,
+    "json" when it asked for a streamed JSON array with stream=true and None when it is not streamed.
+    """
+    if request.accept_mimetypes.best_match([MIMETYPE_JSON, MIMETYPE_NDJSON]) == MIMETYPE_NDJSON:
+        return "ndjson"
+    if request.args.get("stream", "").lower() == "true":
+        return "json"
+    return None
+
+
+def stream_response(rows, dump, stream_format, chunk_size, envelope=None):
+    """
+    Returns a response sending the rows serialized by dump, chunk_size rows per write.
+
+    As a JSON array the rows are wrapped in {envelope: [...]} when envelope is given, so that the
+    body is the same as the one of the response which is not streamed. As NDJSON each row is one line.
+    The first row is read before returning, so that a failing query still gets an error response.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    rows = chain([first], rows) if first is not None else iter(())
+
+    def generate():
+        if stream_format == "ndjson":
+            items = (dumps(dump(row)) + "\n" for row in rows)
+        else:
+            yield '{' + dumps(envelope) + ':[' if envelope else '['
+            items = (("," if index else "") + dumps(dump(row)) for index, row in enumerate(rows))
+        while True:
+            chunk = "".join(islice(items, chunk_size))
+            if not chunk:
+                break
+            yield chunk
+        if stream_format == "json":
+            yield ']}' if envelope else ']'
+
+    mimetype = MIMETYPE_NDJSON if stream_format == "ndjson" else MIMETYPE_JSON
+    return Response(stream_with_context(generate()), mimetype=mimetype)
@@ -66,6 +66,54 @@ class TrainingMgrConfig:
         self.__llm_agent_model_for_tm = getenv('LLM_AGENT_MODEL_FOR_TM').rstrip() if getenv('LLM_AGENT_MODEL_FOR_TM') is not None else None
         self.__llm_agent_model_token_for_tm = getenv('LLM_AGENT_MODEL_TOKEN_FOR_TM').rstrip() if getenv('LLM_AGENT_MODEL_TOKEN_FOR_TM') is not None else None
 
+        # DATA_EXTRACTION_POLL_WORKERS is the deprecated name of LIFECYCLE_WORK_WORKERS, from when data
+        # extraction status checks were the only lifecycle work
+        self.__lifecycle_work_workers = int(getenv('LIFECYCLE_WORK_WORKERS',
+                                                   getenv('DATA_EXTRACTION_POLL_WORKERS', '10')).rstrip())
+        self.__data_extraction_poll_interval = float(getenv('DATA_EXTRACTION_POLL_INTERVAL', '10').rstrip())
+        self.__data_extraction_poll_max_interval = float(getenv('DATA_EXTRACTION_POLL_MAX_INTERVAL', '300').rstrip())
+        self.__data_extraction_poll_backoff_factor = float(getenv('DATA_EXTRACTION_POLL_BACKOFF_FACTOR', '2').rstrip())
+        self.__data_extraction_poll_jitter = float(getenv('DATA_EXTRACTION_POLL_JITTER', '0.2').rstrip())
+        self.__data_extraction_reconcile_interval = float(getenv('DATA_EXTRACTION_RECONCILE_INTERVAL', '60').rstrip())
+        self.__lifecycle_work_lease = float(getenv('LIFECYCLE_WORK_LEASE', '300').rstrip())
+        self.__lifecycle_work_max_attempts = int(getenv('LIFECYCLE_WORK_MAX_ATTEMPTS', '10').rstrip())
+        self.__lifecycle_reconcile_interval = float(getenv('LIFECYCLE_RECONCILE_INTERVAL', '300').rstrip())
+        self.__notification_workers = int(getenv('NOTIFICATION_WORKERS', '4').rstrip())
+        self.__notification_queue_size = int(getenv('NOTIFICATION_QUEUE_SIZE', '1000').rstrip())
+        self.__notification_timeout = float(getenv('NOTIFICATION_TIMEOUT', '5').rstrip())
+        self.__notification_max_attempts = int(getenv('NOTIFICATION_MAX_ATTEMPTS', '5').rstrip())
+        self.__notification_retry_backoff = float(getenv('NOTIFICATION_RETRY_BACKOFF', '1').rstrip())
+        self.__http_connect_timeout = float(getenv('HTTP_CONNECT_TIMEOUT', '3').rstrip())
+        self.__http_read_timeout = float(getenv('HTTP_READ_TIMEOUT', '30').rstrip())
+        self.__http_retries = int(getenv('HTTP_RETRIES', '2').rstrip())
+        self.__http_retry_backoff = float(getenv('HTTP_RETRY_BACKOFF', '0.2').rstrip())
+        self.__http_pool_size = int(getenv('HTTP_POOL_SIZE', '10').rstrip())
+        self.__http_max_concurrent_requests = int(getenv('HTTP_MAX_CONCURRENT_REQUESTS', '20').rstrip())
+        self.__circuit_breaker_failure_threshold = int(getenv('CIRCUIT_BREAKER_FAILURE_THRESHOLD', '5').rstrip())
+        self.__circuit_breaker_reset_timeout = float(getenv('CIRCUIT_BREAKER_RESET_TIMEOUT', '30').rstrip())
+        self.__mme_cache_size = int(getenv('MME_CACHE_SIZE', '256').rstrip())
+        self.__mme_cache_ttl = float(getenv('MME_CACHE_TTL', '60').rstrip())
+        self.__mme_cache_negative_ttl = float(getenv('MME_CACHE_NEGATIVE_TTL', '5').rstrip())
+        self.__pipeline_catalog_refresh_interval = float(getenv('PIPELINE_CATALOG_REFRESH_INTERVAL', '30').rstrip())
+        self.__trainingjob_page_size = int(getenv('TRAININGJOB_PAGE_SIZE', '100').rstrip())
+        self.__trainingjob_max_page_size = int(getenv('TRAININGJOB_MAX_PAGE_SIZE', '1000').rstrip())
+        self.__trainingjob_batch_max_size = int(getenv('TRAININGJOB_BATCH_MAX_SIZE', '1000').rstrip())
+        self.__trainingjob_batch_workers = int(getenv('TRAININGJOB_BATCH_WORKERS', '8').rstrip())
+        self.__trainingjob_delete_workers = int(getenv('TRAININGJOB_DELETE_WORKERS', '4').rstrip())
+        self.__stream_chunk_size = int(getenv('STREAM_CHUNK_SIZE', '500').rstrip())
+        self.__status_stream_max_watchers = int(getenv('STATUS_STREAM_MAX_WATCHERS', '256').rstrip())
+        self.__status_stream_keepalive = float(getenv('STATUS_STREAM_KEEPALIVE', '15').rstrip())
+        self.__status_stream_timeout = float(getenv('STATUS_STREAM_TIMEOUT', '600').rstrip())
+        self.__status_stream_poll_interval = float(getenv('STATUS_STREAM_POLL_INTERVAL', '2').rstrip())
+        self.__status_stream_event_buffer = int(getenv('STATUS_STREAM_EVENT_BUFFER', '1000').rstrip())
+        self.__db_pool_size = int(getenv('DB_POOL_SIZE', '5').rstrip())
+        self.__db_max_overflow = int(getenv('DB_MAX_OVERFLOW', '10').rstrip())
+        self.__db_pool_timeout = float(getenv('DB_POOL_TIMEOUT', '30').rstrip())
+        self.__db_pool_recycle = int(getenv('DB_POOL_RECYCLE', '1800').rstrip())
+        self.__db_pool_pre_ping = getenv('DB_POOL_PRE_PING', 'true').rstrip().lower() == 'true'
+        self.__db_connect_timeout = int(getenv('DB_CONNECT_TIMEOUT', '10').rstrip())
+        self.__schema_migration_on_startup = getenv('SCHEMA_MIGRATION_ON_STARTUP', 'false').rstrip().lower() == 'true'
+
         conf_filepath = getenv("CONF_LOG", "common/conf_log.yaml")
         self.tmgr_logger = TMLogger(conf_filepath)
         self.__logger = self.tmgr_logger.logger
@@ -274,6 +322,581 @@ class TrainingMgrConfig:
         """
         return self.__llm_agent_model_token_for_tm
 
+    @property
+    def lifecycle_work_workers(self):
+        """
+        Function for getting the maximum number of lifecycle work items, of any action,
+        which are run concurrently by the async handler
+
+        Args:None
+
+        Returns:
+            maximum number of concurrent lifecycle work items
+        """
+        return self.__lifecycle_work_workers
+
+    @property
+    def data_extraction_poll_workers(self):
+        """
+        Function for getting the maximum number of lifecycle work items which are run
+        concurrently, deprecated name of lifecycle_work_workers
+
+        Args:None
+
+        Returns:
+            maximum number of concurrent lifecycle work items
+        """
+        return self.__lifecycle_work_workers
+
+    @property
+    def data_extraction_poll_interval(self):
+        """
+        Function for getting the time in seconds between the first two data extraction
+        status checks of a trainingjob, later checks are backed off from it
+
+        Args:None
+
+        Returns:
+            minimum data extraction status check interval in seconds
+        """
+        return self.__data_extraction_poll_interval
+
+    @property
+    def data_extraction_poll_max_interval(self):
+        """
+        Function for getting the upper limit in seconds of the backed off time between two
+        data extraction status checks of the same trainingjob
+
+        Args:None
+
+        Returns:
+            maximum data extraction status check interval in seconds
+        """
+        return self.__data_extraction_poll_max_interval
+
+    @property
+    def data_extraction_poll_backoff_factor(self):
+        """
+        Function for getting the factor by which the time between two data extraction
+        status checks of the same trainingjob grows after every check
+
+        Args:None
+
+        Returns:
+            data extraction status check backoff factor
+        """
+        return self.__data_extraction_poll_backoff_factor
+
+    @property
+    def data_extraction_poll_jitter(self):
+        """
+        Function for getting the fraction by which the time between two data extraction
+        status checks is randomly varied, so that checks do not happen at the same instant
+
+        Args:None
+
+        Returns:
+            data extraction status check jitter as a fraction between 0 and 1
+        """
+        return self.__data_extraction_poll_jitter
+
+    @property
+    def data_extraction_reconcile_interval(self):
+        """
+        Function for getting the time in seconds after which the status of a trainingjob
+        is checked again once data extraction has notified its status
+
+        Args:None
+
+        Returns:
+            data extraction reconcile interval in seconds
+        """
+        return self.__data_extraction_reconcile_interval
+
+    @property
+    def lifecycle_work_lease(self):
+        """
+        Function for getting the time in seconds for which a claimed lifecycle work item is
+        reserved for one worker, after that it can be claimed by another worker
+
+        Args:None
+
+        Returns:
+            lifecycle work lease in seconds
+        """
+        return self.__lifecycle_work_lease
+
+    @property
+    def lifecycle_work_max_attempts(self):
+        """
+        Function for getting the number of times a retryable lifecycle work item is tried
+        before the trainingjob is failed
+
+        Args:None
+
+        Returns:
+            maximum number of lifecycle work attempts
+        """
+        return self.__lifecycle_work_max_attempts
+
+    @property
+    def lifecycle_reconcile_interval(self):
+        """
+        Function for getting the time in seconds between two runs of the leader replica's
+        check for trainingjobs whose lifecycle work has been lost
+
+        Args:None
+
+        Returns:
+            lifecycle reconcile interval in seconds
+        """
+        return self.__lifecycle_reconcile_interval
+
+    @property
+    def notification_workers(self):
+        """
+        Function for getting the number of threads delivering the notifications to the rApps
+
+        Args:None
+
+        Returns:
+            number of notification workers
+        """
+        return self.__notification_workers
+
+    @property
+    def notification_queue_size(self):
+        """
+        Function for getting the number of notifications which can wait for delivery,
+        further notifications are dropped
+
+        Args:None
+
+        Returns:
+            notification queue size
+        """
+        return self.__notification_queue_size
+
+    @property
+    def notification_timeout(self):
+        """
+        Function for getting the time in seconds after which a notification request to an rApp
+        is given up
+
+        Args:None
+
+        Returns:
+            notification timeout in seconds
+        """
+        return self.__notification_timeout
+
+    @property
+    def notification_max_attempts(self):
+        """
+        Function for getting the number of times the delivery of a notification is tried
+
+        Args:None
+
+        Returns:
+            maximum number of notification delivery attempts
+        """
+        return self.__notification_max_attempts
+
+    @property
+    def notification_retry_backoff(self):
+        """
+        Function for getting the time in seconds before the first retry of a notification,
+        it doubles with every further retry
+
+        Args:None
+
+        Returns:
+            notification retry backoff in seconds
+        """
+        return self.__notification_retry_backoff
+
+    @property
+    def http_connect_timeout(self):
+        """
+        Function for getting the time in seconds allowed for connecting to another service
+
+        Args:None
+
+        Returns:
+            outbound http connect timeout in seconds
+        """
+        return self.__http_connect_timeout
+
+    @property
+    def http_read_timeout(self):
+        """
+        Function for getting the time in seconds allowed between two bytes of the response
+        of another service
+
+        Args:None
+
+        Returns:
+            outbound http read timeout in seconds
+        """
+        return self.__http_read_timeout
+
+    @property
+    def http_retries(self):
+        """
+        Function for getting the number of times a request to another service is retried when
+        the connection fails, or when an idempotent request fails with a 502, 503 or 504
+
+        Args:None
+
+        Returns:
+            number of outbound http retries
+        """
+        return self.__http_retries
+
+    @property
+    def http_retry_backoff(self):
+        """
+        Function for getting the backoff factor in seconds between retries of a request to
+        another service
+
+        Args:None
+
+        Returns:
+            outbound http retry backoff factor in seconds
+        """
+        return self.__http_retry_backoff
+
+    @property
+    def http_pool_size(self):
+        """
+        Function for getting the number of connections kept open to each other service
+
+        Args:None
+
+        Returns:
+            outbound http connection pool size
+        """
+        return self.__http_pool_size
+
+    @property
+    def http_max_concurrent_requests(self):
+        """
+        Function for getting the number of requests which can be in flight to another service,
+        further requests fail right away
+
+        Args:None
+
+        Returns:
+            maximum number of concurrent outbound requests per service
+        """
+        return self.__http_max_concurrent_requests
+
+    @property
+    def circuit_breaker_failure_threshold(self):
+        """
+        Function for getting the number of consecutive failed requests to another service after
+        which requests to it fail right away
+
+        Args:None
+
+        Returns:
+            circuit breaker failure threshold
+        """
+        return self.__circuit_breaker_failure_threshold
+
+    @property
+    def circuit_breaker_reset_timeout(self):
+        """
+        Function for getting the time in seconds after which a request is let through again to
+        a service whose requests fail right away
+
+        Args:None
+
+        Returns:
+            circuit breaker reset timeout in seconds
+        """
+        return self.__circuit_breaker_reset_timeout
+
+    @property
+    def mme_cache_size(self):
+        """
+        Function for getting the number of models whose information from the model management
+        service is cached
+
+        Args:None
+
+        Returns:
+            model information cache size
+        """
+        return self.__mme_cache_size
+
+    @property
+    def mme_cache_ttl(self):
+        """
+        Function for getting the time in seconds the information of a model from the model
+        management service is cached
+
+        Args:None
+
+        Returns:
+            model information cache time to live in seconds
+        """
+        return self.__mme_cache_ttl
+
+    @property
+    def mme_cache_negative_ttl(self):
+        """
+        Function for getting the time in seconds it is cached that a model is not registered
+        at the model management service
+
+        Args:None
+
+        Returns:
+            not registered model cache time to live in seconds
+        """
+        return self.__mme_cache_negative_ttl
+
+    @property
+    def pipeline_catalog_refresh_interval(self):
+        """
+        Function for getting the age in seconds after which the cached pipelines, pipeline versions
+        and experiments of the KF adapter are fetched again in the background
+
+        Args:None
+
+        Returns:
+            pipeline catalog refresh interval in seconds
+        """
+        return self.__pipeline_catalog_refresh_interval
+
+    @property
+    def trainingjob_page_size(self):
+        """
+        Function for getting the number of trainingjobs listed per page when no limit is given
+
+        Args:None
+
+        Returns:
+            default trainingjob page size
+        """
+        return self.__trainingjob_page_size
+
+    @property
+    def trainingjob_max_page_size(self):
+        """
+        Function for getting the largest number of trainingjobs which can be listed per page
+
+        Args:None
+
+        Returns:
+            maximum trainingjob page size
+        """
+        return self.__trainingjob_max_page_size
+
+    @property
+    def trainingjob_batch_max_size(self):
+        """
+        Function for getting the maximum number of trainingjobs created by one batch request
+
+        Args:None
+
+        Returns:
+            trainingjob batch max size
+        """
+        return self.__trainingjob_batch_max_size
+
+    @property
+    def trainingjob_batch_workers(self):
+        """
+        Function for getting the number of threads of a batch request calling MME and data
+        extraction, it must stay below http_max_concurrent_requests
+
+        Args:None
+
+        Returns:
+            trainingjob batch workers
+        """
+        return self.__trainingjob_batch_workers
+
+    @property
+    def trainingjob_delete_workers(self):
+        """
+        Function for getting the number of trainingjobs a process deletes at a time in the
+        background, at most as many calls to the KF adapter are made for them
+
+        Args:None
+
+        Returns:
+            trainingjob delete workers
+        """
+        return self.__trainingjob_delete_workers
+
+    @property
+    def stream_chunk_size(self):
+        """
+        Function for getting the number of rows read from the database and sent at a time by
+        streamed responses
+
+        Args:None
+
+        Returns:
+            stream chunk size
+        """
+        return self.__stream_chunk_size
+
+    @property
+    def status_stream_max_watchers(self):
+        """
+        Function for getting the maximum number of status streams open at a time in a process
+
+        Args:None
+
+        Returns:
+            status stream max watchers
+        """
+        return self.__status_stream_max_watchers
+
+    @property
+    def status_stream_keepalive(self):
+        """
+        Function for getting the time in seconds after which a status stream without new
+        status sends a keepalive comment
+
+        Args:None
+
+        Returns:
+            status stream keepalive
+        """
+        return self.__status_stream_keepalive
+
+    @property
+    def status_stream_timeout(self):
+        """
+        Function for getting the time in seconds after which a status stream is ended, the
+        client reconnects with the id of the last status it got
+
+        Args:None
+
+        Returns:
+            status stream timeout
+        """
+        return self.__status_stream_timeout
+
+    @property
+    def status_stream_poll_interval(self):
+        """
+        Function for getting the time in seconds between two reads of the step states of the
+        watched trainingjobs, which catch the transitions made by other processes
+
+        Args:None
+
+        Returns:
+            status stream poll interval
+        """
+        return self.__status_stream_poll_interval
+
+    @property
+    def status_stream_event_buffer(self):
+        """
+        Function for getting the number of latest trainingjob events kept in memory for the
+        watchers of the event feed
+
+        Args:None
+
+        Returns:
+            status stream event buffer
+        """
+        return self.__status_stream_event_buffer
+
+    @property
+    def db_pool_size(self):
+        """
+        Function for getting the number of database connections kept open by each process
+
+        Args:None
+
+        Returns:
+            db pool size
+        """
+        return self.__db_pool_size
+
+    @property
+    def db_max_overflow(self):
+        """
+        Function for getting the number of database connections opened past db_pool_size when all of them
+        are in use, closed again once returned
+
+        Args:None
+
+        Returns:
+            db max overflow
+        """
+        return self.__db_max_overflow
+
+    @property
+    def db_pool_timeout(self):
+        """
+        Function for getting the seconds a request waits for a database connection when db_pool_size plus
+        db_max_overflow are in use
+
+        Args:None
+
+        Returns:
+            db pool timeout
+        """
+        return self.__db_pool_timeout
+
+    @property
+    def db_pool_recycle(self):
+        """
+        Function for getting the seconds after which a pooled database connection is replaced by a new one,
+        -1 never replaces them
+
+        Args:None
+
+        Returns:
+            db pool recycle
+        """
+        return self.__db_pool_recycle
+
+    @property
+    def db_pool_pre_ping(self):
+        """
+        Function for getting whether a pooled database connection is checked before it is handed out,
+        a dead one (after a failover) is then replaced transparently
+
+        Args:None
+
+        Returns:
+            db pool pre ping
+        """
+        return self.__db_pool_pre_ping
+
+    @property
+    def db_connect_timeout(self):
+        """
+        Function for getting the seconds to wait for a new database connection to be established
+
+        Args:None
+
+        Returns:
+            db connect timeout
+        """
+        return self.__db_connect_timeout
+
+    @property
+    def schema_migration_on_startup(self):
+        """
+        Function for getting whether the training manager migrates an outdated database schema at
+        startup, otherwise it refuses to start until python -m trainingmgr.migrate has run
+
+        Args:None
+
+        Returns:
+            schema migration on startup
+        """
+        return self.__schema_migration_on_startup
+
     def is_config_loaded_properly(self):
         """
         This function checks where all environment variable got value or not.
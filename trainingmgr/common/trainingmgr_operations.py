@@ -22,16 +22,20 @@ Training manager main operations
 """
 
 import json
-import requests
 from trainingmgr.db.trainingjob_db import get_trainingjob
 from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
 import validators
-from trainingmgr.common.exceptions_utls import TMException
+from trainingmgr.common.exceptions_utls import TMException, DownstreamUnavailableException
+from trainingmgr.handler.notification_handler import submit_notification
+from trainingmgr.common.http_client import get_http_client, KF_ADAPTER, DATA_EXTRACTION, DME
 from flask_api import status
 TRAININGMGR_CONFIG_OBJ = TrainingMgrConfig()
 LOGGER = TRAININGMGR_CONFIG_OBJ.logger
 
 MIMETYPE_JSON = "application/json"
+DATA_EXTRACTION_CLIENT = get_http_client(DATA_EXTRACTION)
+KF_ADAPTER_CLIENT = get_http_client(KF_ADAPTER)
+DME_CLIENT = get_http_client(DME)
 
 def create_url_host_port(protocol, host, port, path=''):
     """
@@ -87,10 +91,14 @@ def data_extraction_start(training_config_obj, training_job_id, feature_list_str
     dictionary['sink'] = sink
     dictionary['influxdb_info']= influxdb_info_dic
     dictionary["trainingjob_id"] = str(training_job_id)
+    # Data extraction reports the task status here, polling is kept as a fallback
+    dictionary["notification_url"] = 'http://' + str(training_config_obj.my_ip) + ':' + \
+                                     str(training_config_obj.my_port) + \
+                                     '/trainingjob/dataExtractionStatusNotification' #NOSONAR
    
     logger.debug(json.dumps(dictionary))
 
-    response = requests.post(url,
+    response = DATA_EXTRACTION_CLIENT.post(url,
                              data=json.dumps(dictionary),
                              headers={'content-type': MIMETYPE_JSON,
                                       'Accept-Charset': 'UTF-8'})
@@ -107,7 +115,7 @@ def data_extraction_status(featuregroup_name, trainingjob_id, training_config_ob
     task_id = featuregroup_name + "_" + str(trainingjob_id)
     url = 'http://'+str(data_extraction_ip)+':'+str(data_extraction_port)+'/task-status/'+str(task_id) #NOSONAR
     LOGGER.debug(url)
-    response = requests.get(url)
+    response = DATA_EXTRACTION_CLIENT.get(url)
     return response
 
 def training_start(training_config_obj, dict_data, trainingjob_id):
@@ -123,12 +131,14 @@ def training_start(training_config_obj, dict_data, trainingjob_id):
         kf_adapter_port = training_config_obj.kf_adapter_port
         url = 'http://'+str(kf_adapter_ip)+':'+str(kf_adapter_port)+'/trainingjobs/' + str(trainingjob_id) + '/execution' #NOSONAR
         LOGGER.debug(url)
-        response = requests.post(url,
+        response = KF_ADAPTER_CLIENT.post(url,
                                 data=json.dumps(dict_data),
                                 headers={'content-type': MIMETYPE_JSON,
                                         'Accept-Charset': 'UTF-8'})
 
         return response
+    except DownstreamUnavailableException:
+        raise
     except Exception as err:
         errMsg= f'the training start failed as {str(err)}'
         LOGGER.error(errMsg)
@@ -168,7 +178,7 @@ def create_dme_filtered_data_job(training_config_obj, source_name, features, fea
     url = create_url_host_port('http', host, port, 'data-consumer/v1/info-jobs/{}'.format(feature_group_name))
     logger.debug(url)
     logger.debug(json.dumps(job_json))
-    response = requests.put(url, data=json.dumps(job_json), headers=headers)
+    response = DME_CLIENT.put(url, data=json.dumps(job_json), headers=headers)
     return response
 
 def delete_dme_filtered_data_job(training_config_obj, feature_group_name, host, port):
@@ -179,21 +189,18 @@ def delete_dme_filtered_data_job(training_config_obj, feature_group_name, host,
 
     url = create_url_host_port('http', host, port, 'data-consumer/v1/info-jobs/{}'.format(feature_group_name))
     logger.debug(url)
-    response = requests.delete(url)
+    response = DME_CLIENT.delete(url)
     return response
 
 def notification_rapp(trainingjob_id):
+    """
+    This function queues the notification of the current step states of trainingjob to its rApp,
+    it is delivered in the background by the notification handler.
+    """
     try:
         trainingjob = get_trainingjob(trainingjob_id)
-        steps_state = trainingjob.steps_state.states
         if trainingjob.notification_url != "" and trainingjob.notification_url is not None:
-            response = requests.post(trainingjob.notification_url,
-                                    data=json.dumps(steps_state),
-                                    headers={
-                                        'content-type': MIMETYPE_JSON,
-                                        'Accept-Charset': 'UTF-8'
-                                    })
-            if response.status_code != 200:
-                raise TMException("Notification failed: "+response.text)
+            submit_notification(trainingjob.id, trainingjob.notification_url,
+                                json.dumps(trainingjob.steps_state.states))
     except Exception as err:
-        LOGGER.error(f"failed to notify rapp due to {str(err)}")
\ No newline at end of file
+        LOGGER.error(f"failed to notify rapp due to {str(err)}")
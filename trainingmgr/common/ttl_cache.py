@@ -0,0 +1,106 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class _Load:
+    """
+    A load of a key in progress, which concurrent lookups of the key wait for.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class TTLCache:
+    """
+    Bounded cache whose entries expire after a time to live, the least recently used entry is
+    evicted when it is full.
+
+    Values are loaded on a miss, concurrent lookups of the same key share one load. A None value
+    (nothing found) is kept for negative_ttl seconds only, and errors are not cached.
+    """
+
+    def __init__(self, maxsize, ttl, negative_ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.entries = OrderedDict()    # key -> (value, expiry time)
+        self.loads = {}
+        self.lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "coalesced": 0}
+
+    def get_or_load(self, key, loader):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                self.entries.move_to_end(key)
+                self.counters["hits"] += 1
+                return entry[0]
+            load = self.loads.get(key)
+            loading = load is None
+            if loading:
+                load = self.loads[key] = _Load()
+                self.counters["misses"] += 1
+            else:
+                self.counters["coalesced"] += 1
+
+        if not loading:
+            load.done.wait()
+            if load.error is not None:
+                raise load.error
+            return load.value
+
+        try:
+            load.value = loader()
+        except Exception as err:
+            load.error = err
+            raise
+        else:
+            self._store(key, load)
+            return load.value
+        finally:
+            with self.lock:
+                if self.loads.get(key) is load:
+                    del self.loads[key]
+            load.done.set()
+
+    def _store(self, key, load):
+        ttl = self.negative_ttl if load.value is None else self.ttl
+        with self.lock:
+            # The key was invalidated while it was loading, the value may be stale
+            if self.loads.get(key) is not load or ttl <= 0:
+                return
+            self.entries[key] = (load.value, time.monotonic() + ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+            self.loads.pop(key, None)
+
+    def stats(self):
+        with self.lock:
+            return {"size": len(self.entries), **self.counters}
@@ -17,5 +17,6 @@
 # ==================================================================================
 from trainingmgr.constants.states import States
 from trainingmgr.constants.steps import Steps
+from trainingmgr.constants.work_actions import WorkActions
 
-__all__ = ['States', 'Steps']
\ No newline at end of file
+__all__ = ['States', 'Steps', 'WorkActions']
\ No newline at end of file
@@ -0,0 +1,30 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+"""
+This module contains WorkActions class for the training manager's lifecycle work queue.
+"""
+from enum import Enum
+class WorkActions(Enum):
+    """
+    This class contains the lifecycle actions which are waiting to be done for a trainingjob.
+    """
+    POLL_DATA_EXTRACTION = 1
+    START_PIPELINE = 2
+    RESOLVE_MODEL_URL = 3
+    DELETE_TRAININGJOB = 4
@@ -0,0 +1,227 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+from flask import Blueprint, jsonify
+from flask_api import status
+from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
+from trainingmgr.handler.async_handler import get_work_schedule, get_replica_info
+from trainingmgr.handler.notification_handler import get_notification_stats
+from trainingmgr.handler.status_stream_handler import get_status_stream_stats
+from trainingmgr.common.http_client import get_http_client_stats, get_circuit_breaker_states
+from trainingmgr.service.mme_service import get_modelinfo_cache_stats
+from trainingmgr.db.pool_db import get_db_pool_stats
+
+admin_controller = Blueprint('admin_controller', __name__)
+LOGGER = TrainingMgrConfig().logger
+
+@admin_controller.route('/admin/work-queue', methods=['GET'])
+def work_queue():
+    """
+    Function handling rest endpoint to get the queued lifecycle work of all replicas.
+
+    Args in function:
+        none
+
+    Args in json:
+        no json required
+
+    Returns:
+        json:
+            work: list
+                        trainingjob id, action, seconds until the next run, number of runs done,
+                        seconds since the action was queued and the worker running it,
+                        ordered by next run
+        status code:
+            HTTP status code 200
+
+    Exceptions:
+        all exception are provided with exception message and HTTP status code.
+    """
+    try:
+        return jsonify({"work": get_work_schedule()}), status.HTTP_200_OK
+    except Exception as err:
+        LOGGER.error(f"Failed to get lifecycle work queue: {str(err)}")
+        return jsonify({"error": "An unexpected error occurred"}), status.HTTP_500_INTERNAL_SERVER_ERROR
+
+@admin_controller.route('/admin/replica', methods=['GET'])
+def replica():
+    """
+    Function handling rest endpoint to get the id of the replica serving the request and
+    whether it runs the singleton background tasks.
+
+    Args in function:
+        none
+
+    Args in json:
+        no json required
+
+    Returns:
+        json:
+            replica_id: str
+                        host name and process id of the replica
+            leader: bool
+                        whether the replica is the leader
+        status code:
+            HTTP status code 200
+    """
+    return jsonify(get_replica_info()), status.HTTP_200_OK
+
+@admin_controller.route('/admin/notifications', methods=['GET'])
+def notifications():
+    """
+    Function handling rest endpoint to get the state of the delivery of notifications to
+    the rApps by this replica.
+
+    Args in function:
+        none
+
+    Args in json:
+        no json required
+
+    Returns:
+        json:
+            queue_depth: int
+                        number of notifications waiting for delivery
+            delivered, failed, dropped, coalesced: int
+                        number of notifications delivered, given up after all attempts,
+                        dropped as the queue was full and replaced by a newer one
+            latency_avg, latency_max: float
+                        average and maximum seconds from queuing to delivery
+        status code:
+            HTTP status code 200
+    """
+    return jsonify(get_notification_stats()), status.HTTP_200_OK
+
+@admin_controller.route('/admin/status-streams', methods=['GET'])
+def status_streams():
+    """
+    Function handling rest endpoint to get the training job status streams open on this replica.
+
+    Args in function:
+        none
+
+    Args in json:
+        no json required
+
+    Returns:
+        json:
+            watchers, max_watchers: int
+                        number of open status streams and maximum number of them
+            trainingjobs: int
+                        number of training jobs they watch
+            published, rejected: int
+                        number of statuses pushed to the watchers of a training job and of
+                        streams refused as max_watchers were open
+        status code:
+            HTTP status code 200
+    """
+    return jsonify(get_status_stream_stats()), status.HTTP_200_OK
+
+@admin_controller.route('/admin/http-clients', methods=['GET'])
+def http_clients():
+    """
+    Function handling rest endpoint to get the latency of the requests of this replica to the
+    other services.
+
+    Args in function:
+        none
+
+    Args in json:
+        no json required
+
+    Returns:
+        json:
+            <service>: dict
+                        number of requests, their total seconds, number of failed ones and
+                        cumulative count of requests per latency bucket upper bound
+        status code:
+            HTTP status code 200
+    """
+    return jsonify(get_http_client_stats()), status.HTTP_200_OK
+
+@admin_controller.route('/admin/circuit-breakers', methods=['GET'])
+def circuit_breakers():
+    """
+    Function handling rest endpoint to get the circuit breaker of each service called by this
+    replica.
+
+    Args in function:
+        none
+
+    Args in json:
+        no json required
+
+    Returns:
+        json:
+            <service>: dict
+                        state of the breaker (closed, open or half_open), consecutive failures,
+                        seconds until a trial request is let through when open, requests in
+                        flight and their upper limit
+        status code:
+            HTTP status code 200
+    """
+    return jsonify(get_circuit_breaker_states()), status.HTTP_200_OK
+
+@admin_controller.route('/admin/caches', methods=['GET'])
+def caches():
+    """
+    Function handling rest endpoint to get the use of the caches of this replica.
+
+    Args in function:
+        none
+
+    Args in json:
+        no json required
+
+    Returns:
+        json:
+            mme: dict
+                        number of cached models, lookups answered from the cache, lookups which
+                        went to MME and lookups which waited for the same lookup in progress
+        status code:
+            HTTP status code 200
+    """
+    return jsonify({"mme": get_modelinfo_cache_stats()}), status.HTTP_200_OK
+
+@admin_controller.route('/admin/db-pool', methods=['GET'])
+def db_pool():
+    """
+    Function handling rest endpoint to get the use of the database connection pool of this replica.
+
+    Args in function:
+        none
+
+    Args in json:
+        no json required
+
+    Returns:
+        json:
+            size, max_overflow: int
+                        number of connections kept open and of connections opened past them
+                        when all are in use
+            checked_out, checked_in, overflow: int
+                        number of connections in use, idle in the pool and opened past size
+            saturation: float
+                        checked_out over size plus max_overflow, requests wait for a
+                        connection at 1
+            connects, checkouts, invalidations: int
+                        number of connections established, handed out and dropped as broken
+        status code:
+            HTTP status code 200
+    """
+    return jsonify(get_db_pool_stats()), status.HTTP_200_OK
@@ -19,13 +19,16 @@ import json
 from flask_api import status
 from flask import Blueprint, jsonify, request
 from marshmallow import ValidationError
-from trainingmgr.common.exceptions_utls import DBException
+from trainingmgr.common.exceptions_utls import DBException, DownstreamUnavailableException
 from trainingmgr.common.trainingmgr_operations import create_dme_filtered_data_job
 from trainingmgr.common.trainingmgr_util import check_trainingjob_name_or_featuregroup_name
 from trainingmgr.db.featuregroup_db import add_featuregroup, delete_feature_group_by_name
 from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
 from trainingmgr.schemas import FeatureGroupSchema
-from trainingmgr.service.featuregroup_service import get_all_featuregroups
+from trainingmgr.service.featuregroup_service import get_all_featuregroups, iter_all_featuregroups, get_featuregroups_version
+from trainingmgr.common.streaming import streaming_format, stream_response
+from trainingmgr.common.etag import make_etag, conditional_response
+from trainingmgr.schemas.fast_serializer import FEATUREGROUP_SERIALIZER, json_response
 from trainingmgr.schemas.problemdetail_schema import ProblemDetails
 
 
@@ -33,7 +36,6 @@ featuregroup_controller = Blueprint('featuregroup_controller', __name__)
 TRAININGMGR_CONFIG_OBJ = TrainingMgrConfig()
 LOGGER = TRAININGMGR_CONFIG_OBJ.logger
 MIMETYPE_JSON = "application/json"
-featuregroups_schema = FeatureGroupSchema(many=True)
 
 @featuregroup_controller.route('/featureGroup', methods=['POST'])
 def create_feature_group():
@@ -102,15 +104,20 @@ def create_feature_group():
         add_featuregroup(featuregroup)
         api_response = FeatureGroupSchema().dump(featuregroup)
         if featuregroup.enable_dme:
-            response = create_dme_filtered_data_job(
-                TRAININGMGR_CONFIG_OBJ,
-                featuregroup.source_name,
-                featuregroup.feature_list,
-                featuregroup.featuregroup_name,
-                featuregroup.host,
-                featuregroup.dme_port,
-                featuregroup.measured_obj_class
-            )
+            try:
+                response = create_dme_filtered_data_job(
+                    TRAININGMGR_CONFIG_OBJ,
+                    featuregroup.source_name,
+                    featuregroup.feature_list,
+                    featuregroup.featuregroup_name,
+                    featuregroup.host,
+                    featuregroup.dme_port,
+                    featuregroup.measured_obj_class
+                )
+            except DownstreamUnavailableException as err:
+                LOGGER.error(str(err))
+                delete_feature_group_by_name(featuregroup.featuregroup_name)
+                return ProblemDetails(503, "Service Unavailable", str(err)).to_json()
             if response.status_code != 201:
                 delete_feature_group_by_name(featuregroup.featuregroup_name)
                 return ProblemDetails(
@@ -156,10 +163,14 @@ def get_feature_group():
                         
     """
     LOGGER.debug("Request for getting all feature groups")
-    api_response={}
     try:
-        api_response = featuregroups_schema.dump(get_all_featuregroups())
-        return jsonify({"FeatureGroups": api_response}), 200
+        stream_format = streaming_format(request)
+        if stream_format is not None:
+            return stream_response(iter_all_featuregroups(), FEATUREGROUP_SERIALIZER.dump, stream_format,
+                                   TRAININGMGR_CONFIG_OBJ.stream_chunk_size, envelope="FeatureGroups")
+        etag = make_etag(*get_featuregroups_version())
+        return conditional_response(request, etag, lambda: json_response(
+            {"FeatureGroups": FEATUREGROUP_SERIALIZER.dump_many(get_all_featuregroups())}))
     except Exception as err:
         LOGGER.error(f"Failed to get featuregroups: {str(err)}")
         return ProblemDetails(500, "Internal Server Error", "Failed to get featuregroups").to_json()
@@ -18,10 +18,11 @@
 
 from flask import Blueprint, jsonify, request
 from flask_api import status
-from trainingmgr.common.exceptions_utls import TMException
+from trainingmgr.common.exceptions_utls import TMException, DownstreamUnavailableException
 from trainingmgr.service.pipeline_service import get_single_pipeline, get_all_pipeline_versions, get_all_pipelines, \
     upload_pipeline_service, list_experiments_service
 from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
+from trainingmgr.schemas.problemdetail_schema import ProblemDetails
 import traceback
 import re
 
@@ -37,6 +38,9 @@ def get_pipeline_info_by_name(pipeline_name):
             return jsonify({"pipeline_info": pipeline_info}), status.HTTP_200_OK
         else:
             return jsonify({"error": f"Pipeline '{pipeline_name}' not found"}), status.HTTP_404_NOT_FOUND
+    except DownstreamUnavailableException as err:
+        LOGGER.error(str(err))
+        return ProblemDetails(503, "Service Unavailable", str(err)).to_json()
     except TMException as err:
         LOGGER.error(f"TrainingManager exception: {str(err)}")
         return jsonify({"error": str(err)}), status.HTTP_404_NOT_FOUND
@@ -74,6 +78,9 @@ def get_versions_for_pipeline(pipeline_name):
         
         return jsonify(version_list), status.HTTP_200_OK
         
+    except DownstreamUnavailableException as err:
+        LOGGER.error(str(err))
+        return ProblemDetails(503, "Service Unavailable", str(err)).to_json()
     except Exception as err:
         LOGGER.error(str(err))
         return jsonify({"Exception": str(err)}), status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -103,6 +110,9 @@ def get_pipelines():
     try:
         pipelines = get_all_pipelines()
         return jsonify(pipelines), status.HTTP_200_OK
+    except DownstreamUnavailableException as err:
+        LOGGER.error(str(err))
+        return ProblemDetails(503, "Service Unavailable", str(err)).to_json()
     except Exception as err:
         LOGGER.error(str(err))
         return jsonify({"Exception": str(err)}, status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -162,6 +172,9 @@ def upload_pipeline(pipeline_name):
         # If the below fxn doesn't fails, It means the file is uploaded successfully
         upload_pipeline_service(pipeline_name, uploaded_file, description)
         return jsonify({'result': f"Pipeline uploaded {pipeline_name} Sucessfully!"}), status.HTTP_200_OK
+    except DownstreamUnavailableException as err:
+        LOGGER.error(str(err))
+        return ProblemDetails(503, "Service Unavailable", str(err)).to_json()
     except TMException as err:
         return jsonify({'result': err.message}), status.HTTP_500_INTERNAL_SERVER_ERROR
     except Exception as err:
@@ -192,6 +205,9 @@ def get_all_experiment_names():
     try:
         experiment_names = list_experiments_service()
         return jsonify(experiment_names), status.HTTP_200_OK
+    except DownstreamUnavailableException as err:
+        LOGGER.error(str(err))
+        return ProblemDetails(503, "Service Unavailable", str(err)).to_json()
     except Exception as err:
         LOGGER.error(str(err))
         return jsonify({"Exception": str(err)}), status.HTTP_500_INTERNAL_SERVER_ERROR
\ No newline at end of file
@@ -18,16 +18,24 @@
 
 import json
 from threading import Lock
-from flask import Blueprint, jsonify, request
+from urllib.parse import urlencode
+from flask import Blueprint, Response, jsonify, request
 from flask_api import status
 from marshmallow import ValidationError
-from trainingmgr.common.exceptions_utls import TMException
+from trainingmgr.common.exceptions_utls import TMException, DownstreamUnavailableException
 from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
 from trainingmgr.schemas.trainingjob_schema import TrainingJobSchema
 from trainingmgr.schemas.featuregroup_schema import FeatureGroupSchema
+from trainingmgr.schemas.trainingjob_event_schema import TrainingJobEventSchema
 from trainingmgr.schemas.problemdetail_schema import ProblemDetails
-from trainingmgr.service.training_job_service import delete_training_job, create_training_job, get_training_job, get_trainining_jobs, \
-get_steps_state, fetch_trainingjob_infos_from_model_id, update_model_metrics_service, get_model_metrics_service
+from trainingmgr.service.training_job_service import delete_training_job, delete_training_jobs, create_training_job, create_training_jobs, get_training_job, get_trainining_jobs, \
+fetch_trainingjob_infos_from_model_id, update_model_metrics_service, get_model_metrics_service, \
+iter_training_jobs, iter_trainingjob_infos_from_model_id, get_trainingjobs_version_service, get_trainingjob_events_service, \
+parse_event_args
+from trainingmgr.common.streaming import streaming_format, stream_response
+from trainingmgr.common.etag import make_etag, conditional_response
+from trainingmgr.handler.status_stream_handler import subscribe_status, unsubscribe_status, stream_status, stream_events, FEED
+from trainingmgr.schemas.fast_serializer import TRAININGJOB_SERIALIZER, json_response
 from trainingmgr.common.trainingmgr_util import check_key_in_dictionary
 from trainingmgr.common.trainingConfig_parser import validateTrainingConfig
 from trainingmgr.service.mme_service import get_modelinfo_by_modelId_service
@@ -39,7 +47,7 @@ TRAININGMGR_CONFIG_OBJ = TrainingMgrConfig()
 LOCK = Lock()
 
 trainingjob_schema = TrainingJobSchema()
-trainingjobs_schema = TrainingJobSchema(many=True)
+trainingjob_events_schema = TrainingJobEventSchema(many=True)
 MIMETYPE_JSON = "application/json"
 
 @training_job_controller.route('/training-jobs/<int:training_job_id>', methods=['DELETE'])
@@ -52,6 +60,9 @@ def delete_trainingjob(training_job_id):
         else:
             LOGGER.debug(f'Training job {training_job_id} not found.')
             return ProblemDetails(404, "Not Found", f"Training job with ID {training_job_id} does not exist.").to_json()
+    except DownstreamUnavailableException as err:
+        LOGGER.error(f"Error deleting training job {training_job_id}: {str(err)}")
+        return ProblemDetails(503, "Service Unavailable", str(err)).to_json()
     except Exception as e:
         LOGGER.error(f"Error deleting training job {training_job_id}: {str(e)}")
         return ProblemDetails(500, "Internal Server Error", str(e)).to_json()
@@ -79,16 +90,73 @@ def create_trainingjob():
         return create_training_job(trainingjob=trainingjob, registered_model_dict=registered_model_dict)
     except ValidationError as error:
         return ProblemDetails(400, "Validation Error", str(error.messages)).to_json()
+    except DownstreamUnavailableException as err:
+        LOGGER.error(f"Error creating training job: {str(err)}")
+        return ProblemDetails(503, "Service Unavailable", str(err)).to_json()
     except Exception as e:
         LOGGER.error(f"Error creating training job: {str(e)}")
         return ProblemDetails(500, "Internal Server Error", str(e)).to_json()
 
+@training_job_controller.route('/training-jobs:batch', methods=['POST'])
+def create_trainingjobs_batch():
+    '''
+    Creates the training jobs of the specs in trainingJobs, each as POST /training-jobs would, and
+    returns the result of each of them in the same order.
+    '''
+    try:
+        request_json = request.get_json(silent=True)
+        if not isinstance(request_json, dict) or not isinstance(request_json.get("trainingJobs"), list):
+            return ProblemDetails(400, "Bad Request", "The 'trainingJobs' list is missing.").to_json()
+        trainingjobs_json = request_json["trainingJobs"]
+        LOGGER.debug(f"Request for {len(trainingjobs_json)} training jobs")
+        if len(trainingjobs_json) > TRAININGMGR_CONFIG_OBJ.trainingjob_batch_max_size:
+            return ProblemDetails(400, "Bad Request", f"At most {TRAININGMGR_CONFIG_OBJ.trainingjob_batch_max_size} "
+                                  "training jobs can be created at once.").to_json()
+        return json_response({"results": create_training_jobs(trainingjobs_json)}), 200
+    except Exception as e:
+        LOGGER.error(f"Error creating training jobs: {str(e)}")
+        return ProblemDetails(500, "Internal Server Error", str(e)).to_json()
+
+@training_job_controller.route('/training-jobs:batchDelete', methods=['POST'])
+def delete_trainingjobs_batch():
+    '''
+    Marks the training jobs of trainingJobIds as being deleted and returns right away, the lifecycle
+    workers then terminate their training and delete them in the background.
+    '''
+    try:
+        request_json = request.get_json(silent=True)
+        trainingjob_ids = request_json.get("trainingJobIds") if isinstance(request_json, dict) else None
+        if not isinstance(trainingjob_ids, list) or \
+                not all(isinstance(trainingjob_id, int) and not isinstance(trainingjob_id, bool) for trainingjob_id in trainingjob_ids):
+            return ProblemDetails(400, "Bad Request", "The 'trainingJobIds' list of training job ids is missing.").to_json()
+        LOGGER.debug(f"Request to delete {len(trainingjob_ids)} training jobs")
+        if len(trainingjob_ids) > TRAININGMGR_CONFIG_OBJ.trainingjob_batch_max_size:
+            return ProblemDetails(400, "Bad Request", f"At most {TRAININGMGR_CONFIG_OBJ.trainingjob_batch_max_size} "
+                                  "training jobs can be deleted at once.").to_json()
+        accepted, not_found = delete_training_jobs(trainingjob_ids)
+        return json_response({"accepted": accepted, "notFound": not_found}), 202
+    except Exception as e:
+        LOGGER.error(f"Error deleting training jobs: {str(e)}")
+        return ProblemDetails(500, "Internal Server Error", str(e)).to_json()
+
 @training_job_controller.route('/training-jobs/', methods=['GET'])
 def get_trainingjobs():
-    LOGGER.debug(f'Fetching all training jobs')
+    LOGGER.debug(f'Fetching training jobs')
     try:
-        resp = trainingjobs_schema.dump(get_trainining_jobs())
-        return jsonify(resp), 200
+        stream_format = streaming_format(request)
+        if stream_format is not None:
+            return stream_response(iter_training_jobs(request.args), TRAININGJOB_SERIALIZER.dump, stream_format,
+                                   TRAININGMGR_CONFIG_OBJ.stream_chunk_size)
+        # The page changes with any of the trainingjobs matching the filters, checking that is one aggregate query
+        etag = make_etag(sorted(request.args.items()), *get_trainingjobs_version_service(request.args))
+        def build():
+            trainingjobs, next_cursor = get_trainining_jobs(request.args)
+            response = json_response(TRAININGJOB_SERIALIZER.dump_many(trainingjobs))
+            if next_cursor is not None:
+                next_args = {**request.args, "cursor": next_cursor}
+                response.headers['Link'] = f'<{request.base_url}?{urlencode(next_args)}>; rel="next"'
+            return response
+        return conditional_response(request, etag, build)
     except TMException as err:
         return ProblemDetails(400, "Bad Request", str(err)).to_json()
     except Exception as e:
@@ -99,7 +167,11 @@ def get_trainingjobs():
 def get_trainingjob(training_job_id):
     LOGGER.debug(f'Fetching training job {training_job_id}')
     try:
-        return jsonify(trainingjob_schema.dump(get_training_job(training_job_id))), 200
+        trainingjob = get_training_job(training_job_id)
+        if trainingjob is None:
+            return ProblemDetails(404, "Not Found", f"Training job with ID {training_job_id} does not exist.").to_json()
+        etag = make_etag(trainingjob.id, trainingjob.updation_time or trainingjob.creation_time)
+        return conditional_response(request, etag, lambda: jsonify(trainingjob_schema.dump(trainingjob)))
     except TMException as err:
         return ProblemDetails(400, "Bad Request", str(err)).to_json()
     except Exception as e:
@@ -110,12 +182,82 @@ def get_trainingjob(training_job_id):
 def get_trainingjob_status(training_job_id):
     LOGGER.debug(f'Requesting status for training job {training_job_id}')
     try:
-        status = get_steps_state(training_job_id)
-        return jsonify(json.loads(status)), 200
+        trainingjob = get_training_job(training_job_id)
+        if trainingjob is None:
+            return ProblemDetails(404, "Not Found", f"Training job with ID {training_job_id} does not exist.").to_json()
+        # Every step transition bumps the version of the step states
+        steps_state = trainingjob.steps_state
+        etag = make_etag(steps_state.id, steps_state.version)
+        return conditional_response(request, etag, lambda: jsonify(json.loads(steps_state.states)))
     except Exception as err:
         LOGGER.error(f"Error fetching status for training job {training_job_id}: {str(err)}")
         return ProblemDetails(500, "Internal Server Error", str(err)).to_json()
 
+@training_job_controller.route('/training-jobs/<int:training_job_id>/status/stream', methods=['GET'])
+def stream_trainingjob_status(training_job_id):
+    """
+    Streams the step states of the training job as Server-Sent Events, one event per transition
+    with the version of the step states as id, until the training job finishes or fails.
+    """
+    LOGGER.debug(f'Streaming status of training job {training_job_id}')
+    # Subscribed before reading the status, so that no transition is missed in between
+    if not subscribe_status(training_job_id):
+        return ProblemDetails(503, "Service Unavailable", "Too many status streams are open, retry later.").to_json()
+    try:
+        trainingjob = get_training_job(training_job_id)
+    except Exception as err:
+        unsubscribe_status(training_job_id)
+        LOGGER.error(f"Error fetching status for training job {training_job_id}: {str(err)}")
+        return ProblemDetails(500, "Internal Server Error", str(err)).to_json()
+    if trainingjob is None:
+        unsubscribe_status(training_job_id)
+        return ProblemDetails(404, "Not Found", f"Training job with ID {training_job_id} does not exist.").to_json()
+    steps_state = trainingjob.steps_state
+    events = stream_status(training_job_id, steps_state.version, steps_state.states,
+                           request.headers.get("Last-Event-ID"))
+    response = Response(events, mimetype="text/event-stream",
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    # Also when the client goes away before the stream starts
+    response.call_on_close(lambda: unsubscribe_status(training_job_id))
+    return response
+
+@training_job_controller.route('/training-jobs:events', methods=['GET'])
+def get_trainingjob_events():
+    """
+    Returns the step transitions of the training jobs committed after the after cursor, in the
+    order they were committed, with the cursor to get the following ones with.
+    """
+    LOGGER.debug(f'Fetching training job events')
+    try:
+        events, cursor = get_trainingjob_events_service(request.args)
+        return json_response({"events": trainingjob_events_schema.dump(events), "cursor": cursor}), 200
+    except TMException as err:
+        return ProblemDetails(400, "Bad Request", str(err)).to_json()
+    except Exception as e:
+        LOGGER.error(f"Error fetching training job events: {str(e)}")
+        return ProblemDetails(500, "Internal Server Error", str(e)).to_json()
+
+@training_job_controller.route('/training-jobs:events/stream', methods=['GET'])
+def stream_trainingjob_events():
+    """
+    Streams the step transitions of the training jobs committed after the after cursor, or the
+    Last-Event-ID of a reconnecting client, as Server-Sent Events with the event id as id.
+    """
+    LOGGER.debug(f'Streaming training job events')
+    query_args = request.args.to_dict()
+    if "Last-Event-ID" in request.headers:
+        query_args["after"] = request.headers["Last-Event-ID"]
+    try:
+        after, trainingjob_id = parse_event_args(query_args)
+    except TMException as err:
+        return ProblemDetails(400, "Bad Request", str(err)).to_json()
+    if not subscribe_status(FEED):
+        return ProblemDetails(503, "Service Unavailable", "Too many status streams are open, retry later.").to_json()
+    response = Response(stream_events(after, trainingjob_id), mimetype="text/event-stream",
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    response.call_on_close(lambda: unsubscribe_status(FEED))
+    return response
+
 @training_job_controller.route('/training-jobs/<model_name>/<model_version>', methods=['GET'])
 def get_trainingjob_infos_from_model_id(model_name, model_version):
     '''
@@ -123,8 +265,12 @@ def get_trainingjob_infos_from_model_id(model_name, model_version):
     '''
     LOGGER.debug(f'Requesting trainingJob-info for model-Id for model_Id: {model_name} and {model_version}')
     try:
+        stream_format = streaming_format(request)
+        if stream_format is not None:
+            return stream_response(iter_trainingjob_infos_from_model_id(model_name, model_version),
+                                   TRAININGJOB_SERIALIZER.dump, stream_format, TRAININGMGR_CONFIG_OBJ.stream_chunk_size)
         trainingjob_infos = fetch_trainingjob_infos_from_model_id(model_name, model_version)
-        return jsonify(trainingjobs_schema.dump(trainingjob_infos)), 200
+        return json_response(TRAININGJOB_SERIALIZER.dump_many(trainingjob_infos)), 200
     except Exception as err:
         LOGGER.error(f"Error fetching training-job-infos corresponding to model_name = {model_name} and model_version = {model_version} : {str(err)}")
         return ProblemDetails(500, "Internal Server Error", str(err)).to_json()
@@ -0,0 +1,131 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+"""
+This file contains the Postgres advisory locks which coordinate the training manager replicas
+sharing one database.
+"""
+from contextlib import contextmanager
+from sqlalchemy import select, func
+from trainingmgr.common.exceptions_utls import DBException
+
+# Advisory lock keys, they are shared by all replicas and must not change between releases
+SCHEMA_LOCK_ID = 0x544d0001
+LIFECYCLE_LEADER_LOCK_ID = 0x544d0002
+TRAININGJOB_EVENT_LOCK_ID = 0x544d0003
+
+
+@contextmanager
+def schema_lock(engine):
+    """
+    Serializes the schema setup of replicas which start at the same time.
+    """
+    with engine.connect() as conn:
+        conn.execute(select(func.pg_advisory_lock(SCHEMA_LOCK_ID)))
+        try:
+            yield
+        finally:
+            conn.execute(select(func.pg_advisory_unlock(SCHEMA_LOCK_ID)))
+            conn.commit()
+
+
+def lock_trainingjob_events(session):
+    """
+    Serializes the transactions appending trainingjob events until they end, so that the event ids
+    become visible in increasing order and a reader of the event feed never skips an event whose
+    transaction commits late. Other databases serialize their writers already.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        session.execute(select(func.pg_advisory_xact_lock(TRAININGJOB_EVENT_LOCK_ID)))
+
+
+class LeaderElection:
+    """
+    Elects one replica as leader by holding a session level advisory lock.
+
+    The lock is held on a dedicated connection for as long as the replica lives, it is released by
+    Postgres when the connection is lost, e.g. because the replica crashed, after which another
+    replica acquires it on its next try.
+    """
+
+    def __init__(self, engine, lock_id, replica_id, logger):
+        self.__engine = engine
+        self.__lock_id = lock_id
+        self.__replica_id = replica_id
+        self.__logger = logger
+        self.__conn = None
+
+    @property
+    def replica_id(self):
+        return self.__replica_id
+
+    @property
+    def is_leader(self):
+        return self.__conn is not None
+
+    def try_acquire(self):
+        """
+        Returns True if this replica is the leader, checking first that an already held lock
+        has not been lost with its connection.
+        """
+        if self.__conn is not None:
+            try:
+                self.__conn.execute(select(1))
+                self.__conn.commit()
+                return True
+            except Exception as err:
+                self.__logger.error(f"Replica {self.__replica_id} lost leadership: {str(err)}")
+                self.__close()
+        try:
+            conn = self.__engine.connect()
+        except Exception as err:
+            raise DBException("Failed to connect for leader election," + str(err))
+        try:
+            acquired = conn.execute(select(func.pg_try_advisory_lock(self.__lock_id))).scalar()
+            # Do not keep the connection idle in a transaction while holding the lock
+            conn.commit()
+        except Exception as err:
+            conn.close()
+            raise DBException("Failed to execute query in try_acquire," + str(err))
+        if not acquired:
+            conn.close()
+            return False
+        self.__conn = conn
+        self.__logger.info(f"Replica {self.__replica_id} is the leader")
+        return True
+
+    def release(self):
+        """
+        Gives up leadership.
+        """
+        if self.__conn is None:
+            return
+        try:
+            self.__conn.execute(select(func.pg_advisory_unlock(self.__lock_id)))
+            self.__conn.commit()
+        except Exception as err:
+            self.__logger.error(f"Failed to release leadership of replica {self.__replica_id}: {str(err)}")
+        finally:
+            self.__close()
+
+    def __close(self):
+        try:
+            self.__conn.close()
+        except Exception:
+            pass
+        self.__conn = None
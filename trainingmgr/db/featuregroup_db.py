@@ -17,6 +17,7 @@
 # ==================================================================================
 
 from trainingmgr.common.exceptions_utls import DBException
+from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from psycopg2.errors import UniqueViolation
 from trainingmgr.models import db, FeatureGroup
@@ -67,6 +68,26 @@ def get_feature_groups_db():
     featureGroups = FeatureGroup.query.all()
     return featureGroups
 
+def iter_feature_groups_db(chunk_size=500):
+    """
+    This function yields the feature groups, reading them from the database chunk_size rows at a time
+    """
+    try:
+        yield from FeatureGroup.query.order_by(FeatureGroup.id).yield_per(chunk_size)
+    except Exception as err:
+        raise DBException(f"{DB_QUERY_EXEC_ERROR}iter_feature_groups_db : {str(err)}")
+
+def get_feature_groups_version_db():
+    """
+    This function returns the number of feature groups, their highest id and their latest update
+    time, one of which changes whenever a feature group is added, edited or deleted
+    """
+    try:
+        return tuple(db.session.query(func.count(FeatureGroup.id), func.max(FeatureGroup.id),
+                                      func.max(FeatureGroup.updation_time)).one())
+    except Exception as err:
+        raise DBException(f"{DB_QUERY_EXEC_ERROR}get_feature_groups_version_db : {str(err)}")
+
 def get_feature_group_by_name_db(featuregroup_name):
     """
     This Function return a feature group with name "featuregroup_name"
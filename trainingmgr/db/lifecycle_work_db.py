@@ -0,0 +1,227 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+from datetime import timedelta
+from sqlalchemy import select, update, delete, or_, func
+from sqlalchemy.dialects.postgresql import insert
+from trainingmgr.common.exceptions_utls import DBException
+from trainingmgr.models import db, LifecycleWork
+
+DB_QUERY_EXEC_ERROR = "Failed to execute query in "
+
+
+def _after(seconds):
+    """
+    Returns the database time seconds from now, the database clock is shared by all replicas.
+    """
+    return func.localtimestamp() + timedelta(seconds=seconds)
+
+def _lease_expired():
+    return or_(LifecycleWork.locked_until.is_(None), LifecycleWork.locked_until < func.localtimestamp())
+
+def _upsert_work(trainingjob_id, action, delay):
+    statement = insert(LifecycleWork).values(trainingjob_id=trainingjob_id, action=action,
+                                             next_run_at=_after(delay), attempts=0)
+    db.session.execute(statement.on_conflict_do_update(
+        constraint="unique trainingjob action",
+        set_={"next_run_at": statement.excluded.next_run_at, "attempts": 0,
+              "locked_by": None, "locked_until": None}))
+
+def enqueue_work(trainingjob_id, action, delay=0):
+    """
+    This function schedules action for the trainingjob after delay seconds, an action
+    which is already queued for the trainingjob is rescheduled.
+    """
+    try:
+        _upsert_work(trainingjob_id, action, delay)
+        db.session.commit()
+    except Exception as err:
+        db.session.rollback()
+        raise DBException(DB_QUERY_EXEC_ERROR + "enqueue_work," + str(err))
+
+def requeue_work(trainingjob_id, action, delay=0):
+    """
+    This function schedules action for the trainingjob after delay seconds unless it is already
+    queued, the attempts and the lease of a queued action, which may have been claimed since
+    the caller read the queue, are left untouched.
+
+    Returns:
+        bool: True if the action was queued, False if it was already queued.
+    """
+    try:
+        statement = insert(LifecycleWork).values(trainingjob_id=trainingjob_id, action=action,
+                                                 next_run_at=_after(delay), attempts=0)
+        result = db.session.execute(statement.on_conflict_do_nothing(constraint="unique trainingjob action"))
+        db.session.commit()
+        return result.rowcount > 0
+    except Exception as err:
+        db.session.rollback()
+        raise DBException(DB_QUERY_EXEC_ERROR + "requeue_work," + str(err))
+
+def enqueue_works(works, action):
+    """
+    This function schedules action for each (trainingjob id, delay) of works in one transaction,
+    as enqueue_work does for one trainingjob.
+    """
+    try:
+        for trainingjob_id, delay in works:
+            _upsert_work(trainingjob_id, action, delay)
+        db.session.commit()
+    except Exception as err:
+        db.session.rollback()
+        raise DBException(DB_QUERY_EXEC_ERROR + "enqueue_works," + str(err))
+
+def handover_work(trainingjob_id, from_action, to_action, delay=0):
+    """
+    This function replaces from_action of the trainingjob by to_action in one transaction.
+
+    Returns:
+        bool: True if from_action was queued, False if it was already taken by someone else
+              in which case nothing is changed.
+    """
+    try:
+        result = db.session.execute(delete(LifecycleWork).where(LifecycleWork.trainingjob_id == trainingjob_id,
+                                                                LifecycleWork.action == from_action))
+        if result.rowcount == 0:
+            db.session.rollback()
+            return False
+        _upsert_work(trainingjob_id, to_action, delay)
+        db.session.commit()
+        return True
+    except Exception as err:
+        db.session.rollback()
+        raise DBException(DB_QUERY_EXEC_ERROR + "handover_work," + str(err))
+
+def claim_due_work(worker_id, limit, lease):
+    """
+    This function leases up to limit due work items to worker_id for lease seconds. Rows which
+    are being claimed by other workers are skipped instead of waited for.
+
+    Returns:
+        list: dicts with id, trainingjob_id, action and attempts of the claimed work items.
+    """
+    try:
+        rows = db.session.execute(
+            select(LifecycleWork)
+            .where(LifecycleWork.next_run_at <= func.localtimestamp(), _lease_expired())
+            .order_by(LifecycleWork.next_run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).scalars().all()
+        work = []
+        for row in rows:
+            work.append({"id": row.id, "trainingjob_id": row.trainingjob_id,
+                         "action": row.action, "attempts": row.attempts})
+            row.locked_by = worker_id
+            row.locked_until = _after(lease)
+        db.session.commit()
+        return work
+    except Exception as err:
+        db.session.rollback()
+        raise DBException(DB_QUERY_EXEC_ERROR + "claim_due_work," + str(err))
+
+def retry_work(work_id, worker_id, delay, count_attempt=True):
+    """
+    This function gives back a work item leased by worker_id and runs it again after delay seconds,
+    the run only counts as an attempt if count_attempt is True.
+
+    Returns:
+        bool: False if the work item is gone or leased by another worker.
+    """
+    try:
+        result = db.session.execute(
+            update(LifecycleWork)
+            .where(LifecycleWork.id == work_id, LifecycleWork.locked_by == worker_id)
+            .values(attempts=LifecycleWork.attempts + (1 if count_attempt else 0), next_run_at=_after(delay),
+                    locked_by=None, locked_until=None))
+        db.session.commit()
+        return result.rowcount > 0
+    except Exception as err:
+        db.session.rollback()
+        raise DBException(DB_QUERY_EXEC_ERROR + "retry_work," + str(err))
+
+def complete_work(work_id, worker_id):
+    """
+    This function removes a work item leased by worker_id once it is done.
+    """
+    try:
+        db.session.execute(delete(LifecycleWork).where(LifecycleWork.id == work_id,
+                                                       LifecycleWork.locked_by == worker_id))
+        db.session.commit()
+    except Exception as err:
+        db.session.rollback()
+        raise DBException(DB_QUERY_EXEC_ERROR + "complete_work," + str(err))
+
+def remove_work(trainingjob_id, action=None):
+    """
+    This function removes action (all actions by default) of the trainingjob from the queue.
+
+    Returns:
+        int: number of removed work items, only one of several concurrent callers gets a non zero count.
+    """
+    try:
+        statement = delete(LifecycleWork).where(LifecycleWork.trainingjob_id == trainingjob_id)
+        if action is not None:
+            statement = statement.where(LifecycleWork.action == action)
+        result = db.session.execute(statement)
+        db.session.commit()
+        return result.rowcount
+    except Exception as err:
+        db.session.rollback()
+        raise DBException(DB_QUERY_EXEC_ERROR + "remove_work," + str(err))
+
+def defer_work(trainingjob_id, action, delay):
+    """
+    This function moves the next run of a queued action which is not being worked on delay seconds from now.
+    """
+    try:
+        db.session.execute(
+            update(LifecycleWork)
+            .where(LifecycleWork.trainingjob_id == trainingjob_id, LifecycleWork.action == action, _lease_expired())
+            .values(next_run_at=_after(delay)))
+        db.session.commit()
+    except Exception as err:
+        db.session.rollback()
+        raise DBException(DB_QUERY_EXEC_ERROR + "defer_work," + str(err))
+
+def get_queued_trainingjob_ids():
+    """
+    This function returns the ids of the trainingjobs which have any work queued.
+    """
+    try:
+        return set(db.session.execute(select(LifecycleWork.trainingjob_id).distinct()).scalars().all())
+    except Exception as err:
+        raise DBException(DB_QUERY_EXEC_ERROR + "get_queued_trainingjob_ids," + str(err))
+
+def get_work_queue():
+    """
+    This function returns all queued work items ordered by next run time.
+    """
+    try:
+        rows = db.session.execute(
+            select(LifecycleWork, func.localtimestamp()).order_by(LifecycleWork.next_run_at)).all()
+        return [{
+            "trainingjob_id": work.trainingjob_id,
+            "action": work.action,
+            "next_run_in": round(max(0.0, (work.next_run_at - now).total_seconds()), 3),
+            "attempts": work.attempts,
+            "queued_for": round((now - work.creation_time).total_seconds(), 3),
+            "locked_by": work.locked_by if work.locked_until is not None and work.locked_until > now else None
+        } for work, now in rows]
+    except Exception as err:
+        raise DBException(DB_QUERY_EXEC_ERROR + "get_work_queue," + str(err))
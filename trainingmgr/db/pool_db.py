@@ -0,0 +1,98 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+"""
+This file contains the settings and the statistics of the database connection pool, which the
+SQLAlchemy sessions and the connections of PSDB share.
+"""
+import threading
+from sqlalchemy import event
+
+
+def engine_options(config_hdl):
+    """
+    Returns the SQLAlchemy engine options of the connection pool configured in config_hdl.
+    """
+    return {
+        "pool_size": config_hdl.db_pool_size,
+        "max_overflow": config_hdl.db_max_overflow,
+        "pool_timeout": config_hdl.db_pool_timeout,
+        "pool_recycle": config_hdl.db_pool_recycle,
+        # A connection broken by a failover is replaced when it is checked out instead of
+        # failing the request which gets it
+        "pool_pre_ping": config_hdl.db_pool_pre_ping,
+        "connect_args": {"connect_timeout": config_hdl.db_connect_timeout},
+    }
+
+
+def warm_pool(engine, count):
+    """
+    Opens count connections of the pool of engine, so that the first requests do not wait for
+    connections to be established.
+    """
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(engine.raw_connection())
+    finally:
+        for conn in connections:
+            conn.close()
+
+
+class PoolMonitor:
+    """
+    Counts the connections opened, checked out and invalidated by the pool of an engine.
+    """
+
+    def __init__(self, engine, max_overflow):
+        self.pool = engine.pool
+        self.max_overflow = max_overflow
+        self.lock = threading.Lock()
+        self.counters = {"connects": 0, "checkouts": 0, "invalidations": 0}
+        event.listen(self.pool, "connect", lambda *args: self._count("connects"))
+        event.listen(self.pool, "checkout", lambda *args: self._count("checkouts"))
+        event.listen(self.pool, "invalidate", lambda *args: self._count("invalidations"))
+
+    def _count(self, counter):
+        with self.lock:
+            self.counters[counter] += 1
+
+    def stats(self):
+        """
+        Returns the use of the pool, saturation is the share of the connections it may open which
+        are checked out. Requests wait for a connection once it reaches 1.
+        """
+        size = self.pool.size()
+        checked_out = self.pool.checkedout()
+        with self.lock:
+            counters = dict(self.counters)
+        return {"size": size, "max_overflow": self.max_overflow, "checked_out": checked_out,
+                "checked_in": self.pool.checkedin(), "overflow": max(self.pool.overflow(), 0),
+                "saturation": round(checked_out / (size + self.max_overflow), 3), **counters}
+
+
+POOL_MONITOR = None
+
+
+def monitor_pool(engine, max_overflow):
+    global POOL_MONITOR
+    POOL_MONITOR = PoolMonitor(engine, max_overflow)
+
+
+def get_db_pool_stats():
+    return POOL_MONITOR.stats() if POOL_MONITOR is not None else {}
@@ -0,0 +1,114 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+"""
+This file contains the setup of the training manager's database schema, which is managed by
+the alembic migrations in trainingmgr/migrations.
+"""
+import os
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from flask_migrate import stamp, upgrade
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import OperationalError
+from trainingmgr.common.exceptions_utls import DBException
+from trainingmgr.db.advisory_lock_db import schema_lock
+from trainingmgr.models import db
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+# Schema created by db.create_all before migrations were introduced
+BASELINE_REVISION = '0001'
+DATABASE_NAME = 'training_manager_database'
+
+
+def database_uri(config_hdl, database=DATABASE_NAME):
+    """
+    This function returns the SQLAlchemy url of the database configured in config_hdl, the default
+    database of the user if database is empty.
+    """
+    return f'postgresql+psycopg2://{config_hdl.ps_user}:{config_hdl.ps_password}@{config_hdl.ps_ip}:{config_hdl.ps_port}/{database}'
+
+
+def create_database(config_hdl):
+    """
+    This function creates the training manager database if it does not exist, which the migrations
+    can not do as they run in it.
+    """
+    engine = create_engine(database_uri(config_hdl, ''), isolation_level="AUTOCOMMIT")
+    try:
+        with engine.connect() as conn:
+            exists = conn.execute(text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                                  {"name": DATABASE_NAME}).scalar()
+            if not exists:
+                conn.execute(text(f"CREATE DATABASE {DATABASE_NAME}"))
+    except Exception as err:
+        raise DBException(f"Failed to create {DATABASE_NAME}: {str(err)}")
+    finally:
+        engine.dispose()
+
+
+def upgrade_schema():
+    """
+    This function migrates the database to the latest schema revision, must be called within an app context.
+    """
+    tables = inspect(db.engine).get_table_names()
+    if 'alembic_version' not in tables and 'trainingjob_info_table' in tables:
+        stamp(directory=MIGRATIONS_DIR, revision=BASELINE_REVISION)
+    upgrade(directory=MIGRATIONS_DIR)
+
+
+def get_schema_revision():
+    """
+    This function returns the schema revision of the database, None if it has none, must be called
+    within an app context.
+    """
+    with db.engine.connect() as conn:
+        return MigrationContext.configure(conn).get_current_revision()
+
+
+def get_head_revision():
+    """
+    This function returns the latest schema revision of the migrations.
+    """
+    return ScriptDirectory(MIGRATIONS_DIR).get_current_head()
+
+
+def ensure_schema(config_hdl, migrate):
+    """
+    This function checks that the database schema is at the latest revision, must be called within
+    an app context. If it is not, the database is created if needed and migrated when migrate is
+    True, otherwise DBException is raised. Returns whether the schema was migrated.
+    """
+    head = get_head_revision()
+    try:
+        revision = get_schema_revision()
+    except OperationalError as err:
+        if not migrate:
+            raise DBException(f"Failed to read the schema revision: {str(err)}")
+        # The database may not exist yet
+        create_database(config_hdl)
+        revision = None
+    if revision == head:
+        return False
+    if not migrate:
+        raise DBException(f"Database schema is at revision {revision} but {head} is required, "
+                          "run python -m trainingmgr.migrate")
+    # Replicas started together would otherwise race on migrating the schema
+    with schema_lock(db.engine):
+        upgrade_schema()
+    return True
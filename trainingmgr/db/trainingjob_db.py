@@ -20,15 +20,22 @@ import datetime
 import re
 import json
 from trainingmgr.common.exceptions_utls import DBException
-from trainingmgr.models import db, TrainingJob, TrainingJobStatus, ModelID
+from trainingmgr.models import db, TrainingJob, TrainingJobStatus, ModelID, TrainingJobEvent
+from trainingmgr.models.steps_state import STEP_COLUMNS
 from trainingmgr.constants.steps import Steps
 from trainingmgr.constants.states import States
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy import desc
+from sqlalchemy.orm import contains_eager, joinedload
+from sqlalchemy import desc, and_, not_, or_, case, select, update, insert, tuple_, func, literal
+from trainingmgr.db.advisory_lock_db import lock_trainingjob_events
 
 
 DB_QUERY_EXEC_ERROR = "Failed to execute query in "
+# Columns the trainingjobs can be listed in the order of, the id breaks ties
+SORT_COLUMNS = {"id": TrainingJob.id, "creation_time": TrainingJob.creation_time}
 PATTERN = re.compile(r"\w+")
+# Functions called with the id of a trainingjob once a change of its step states is committed
+STEP_TRANSITION_LISTENERS = []
 
 # with current_app.app_context():
 #     engine = db.engine
@@ -62,18 +69,19 @@ def get_field_value(trainingjob_id, field):
     except Exception as err:
         raise DBException("Failed to execute query in get_field_value," + str(err))
 
+def _initial_steps_state():
+    return json.dumps({
+        Steps.DATA_EXTRACTION.name: States.NOT_STARTED.name,
+        Steps.DATA_EXTRACTION_AND_TRAINING.name: States.NOT_STARTED.name,
+        Steps.TRAINING.name: States.NOT_STARTED.name,
+        Steps.TRAINING_AND_TRAINED_MODEL.name: States.NOT_STARTED.name,
+        Steps.TRAINED_MODEL.name: States.NOT_STARTED.name
+    })
+
 def create_trainingjob(trainingjob):
-        
-        steps_state = {
-            Steps.DATA_EXTRACTION.name: States.NOT_STARTED.name,
-            Steps.DATA_EXTRACTION_AND_TRAINING.name: States.NOT_STARTED.name,
-            Steps.TRAINING.name: States.NOT_STARTED.name,
-            Steps.TRAINING_AND_TRAINED_MODEL.name: States.NOT_STARTED.name,
-            Steps.TRAINED_MODEL.name: States.NOT_STARTED.name
-        }
 
         try:
-            training_job_status = TrainingJobStatus(states= json.dumps(steps_state))
+            training_job_status = TrainingJobStatus(states=_initial_steps_state())
             db.session.add(training_job_status)
             db.session.commit()     #to get the steps_state id
 
@@ -83,6 +91,25 @@ def create_trainingjob(trainingjob):
         except Exception as err:
             raise DBException(f'{DB_QUERY_EXEC_ERROR} in the create_trainingjob : {str(err)}')
 
+def create_trainingjobs(trainingjobs):
+    """
+    This function creates the trainingjobs with their step states in one transaction, none of them
+    is created if one can not be. The trainingjobs are then loaded again with one query, as the
+    commit expired them.
+    """
+    try:
+        for trainingjob in trainingjobs:
+            trainingjob.steps_state = TrainingJobStatus(states=_initial_steps_state())
+        db.session.add_all(trainingjobs)
+        db.session.flush()
+        ids = [trainingjob.id for trainingjob in trainingjobs]
+        db.session.commit()
+        TrainingJob.query.options(joinedload(TrainingJob.modelId), joinedload(TrainingJob.steps_state)) \
+            .filter(TrainingJob.id.in_(ids)).all()
+    except Exception as err:
+        db.session.rollback()
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} in the create_trainingjobs : {str(err)}')
+
 def delete_trainingjob_by_id(id: int):
     """
     This function delets the trainingjob using the id which is PK
@@ -106,12 +133,40 @@ def delete_trainingjob_by_id(id: int):
         db.session.rollback()
         raise DBException(f'{DB_QUERY_EXEC_ERROR} : {str(e)}' )
 
+def mark_trainingjobs_for_deletion(trainingjob_ids):
+    """
+    This function sets deletion_in_progress of the trainingjobs in one transaction.
+
+    Returns:
+        list: ids of the trainingjobs which exist, in increasing order.
+    """
+    try:
+        ids = db.session.execute(select(TrainingJob.id).where(TrainingJob.id.in_(trainingjob_ids))
+                                 .order_by(TrainingJob.id)).scalars().all()
+        if ids:
+            db.session.execute(update(TrainingJob).where(TrainingJob.id.in_(ids)).values(deletion_in_progress=True))
+        db.session.commit()
+        return ids
+    except Exception as err:
+        db.session.rollback()
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} mark_trainingjobs_for_deletion : {str(err)}')
+
+def get_trainingjob_ids_being_deleted():
+    """
+    This function returns the ids of the trainingjobs whose deletion_in_progress is set.
+    """
+    try:
+        return db.session.execute(select(TrainingJob.id).where(TrainingJob.deletion_in_progress.is_(True))).scalars().all()
+    except Exception as err:
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} get_trainingjob_ids_being_deleted : {str(err)}')
+
 def get_trainingjob(id: int=None):
     try:
+        query = TrainingJob.query.options(joinedload(TrainingJob.modelId), joinedload(TrainingJob.steps_state))
         if id is not None:
-            return TrainingJob.query.filter(TrainingJob.id==id).one()
+            return query.filter(TrainingJob.id==id).one()
         else:
-            tjs = TrainingJob.query.all()
+            tjs = query.all()
             return tjs
     except NoResultFound:
         # id is not present
@@ -139,6 +194,7 @@ def get_trainingjobs_by_model_id_db(model_name, model_version):
         trainingjobs = (
             db.session.query(TrainingJob)
             .join(ModelID)
+            .options(contains_eager(TrainingJob.modelId), joinedload(TrainingJob.steps_state))
             .filter(
                 ModelID.modelname == model_name,
                 ModelID.modelversion == model_version
@@ -152,49 +208,339 @@ def get_trainingjobs_by_model_id_db(model_name, model_version):
         raise DBException(f'{DB_QUERY_EXEC_ERROR} in the get_trainingjobs_by_model_id_db : {str(e)}')
 
 
-def change_steps_state(trainingjob_id, step: Steps, state:States):
+def iter_trainingjobs_by_model_id_db(model_name, model_version, chunk_size=500):
+    """
+    This function yields the trainingjobs of a model, reading them from the database chunk_size rows at a time.
+    """
+    try:
+        yield from filter_trainingjobs({"model_name": model_name, "model_version": model_version}) \
+            .order_by(TrainingJob.id).yield_per(chunk_size)
+    except Exception as err:
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} the iter_trainingjobs_by_model_id_db : {str(err)}')
 
+
+def get_trainingjobs_by_step_state(step, state):
+    """
+    This function returns the trainingjobs whose step is in state, using the index on the step's column.
+    """
     try:
-        trainingjob = TrainingJob.query.filter(TrainingJob.id==trainingjob_id).one()
-        steps_state = json.loads(trainingjob.steps_state.states)
-        steps_state[step] = state
-        trainingjob.steps_state.states=json.dumps(steps_state)
-        db.session.add(trainingjob)
+        return TrainingJob.query.join(TrainingJob.steps_state) \
+            .options(contains_eager(TrainingJob.steps_state), joinedload(TrainingJob.modelId)) \
+            .filter(TrainingJobStatus.column(step) == state).all()
+    except Exception as err:
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} the get_trainingjobs_by_step_state : {str(err)}')
+
+def get_trainingjobs_in_state(state, updated_since=None):
+    """
+    This function returns the trainingjobs having any step in state, e.g. all failed trainingjobs,
+    optionally only those whose steps have changed since updated_since.
+    """
+    try:
+        query = TrainingJob.query.join(TrainingJob.steps_state) \
+            .options(contains_eager(TrainingJob.steps_state), joinedload(TrainingJob.modelId)).filter(
+            or_(*[TrainingJobStatus.column(step) == state for step in STEP_COLUMNS]))
+        if updated_since is not None:
+            query = query.filter(TrainingJobStatus.updation_time >= updated_since)
+        return query.all()
+    except Exception as err:
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} the get_trainingjobs_in_state : {str(err)}')
+
+
+def overall_state_condition(state):
+    """
+    This function returns the SQL condition of the overall status of a trainingjob being state,
+    computed from its step states the same way as get_one_word_status.
+    """
+    columns = [TrainingJobStatus.column(step) for step in STEP_COLUMNS]
+    failed = or_(*[column == States.FAILED.name for column in columns])
+    not_started = and_(*[column == States.NOT_STARTED.name for column in columns])
+    finished = and_(*[column == States.FINISHED.name for column in columns])
+    if state == States.FAILED.name:
+        return failed
+    if state == States.NOT_STARTED.name:
+        return not_started
+    if state == States.FINISHED.name:
+        return finished
+    return and_(not_(failed), not_(not_started), not_(finished))
+
+
+def filter_trainingjobs(filters):
+    """
+    This function returns the query of the trainingjobs matching filters.
+
+    Args:
+        filters (dict): any of model_name, model_version, consumer_rapp_id, producer_rapp_id,
+                        state (overall status), step and step_state (state of that step),
+                        created_after, created_before, updated_after and updated_before
+    """
+    # The model and the step states are loaded by the same query, the filters use their columns
+    query = TrainingJob.query.join(TrainingJob.modelId).outerjoin(TrainingJob.steps_state) \
+        .options(contains_eager(TrainingJob.modelId), contains_eager(TrainingJob.steps_state))
+    if "model_name" in filters:
+        query = query.filter(ModelID.modelname == filters["model_name"])
+    if "model_version" in filters:
+        query = query.filter(ModelID.modelversion == filters["model_version"])
+    if "state" in filters:
+        query = query.filter(overall_state_condition(filters["state"]))
+    if "step" in filters:
+        query = query.filter(TrainingJobStatus.column(filters["step"]) == filters["step_state"])
+    if "updated_after" in filters:
+        query = query.filter(TrainingJobStatus.updation_time >= filters["updated_after"])
+    if "updated_before" in filters:
+        query = query.filter(TrainingJobStatus.updation_time < filters["updated_before"])
+    if "consumer_rapp_id" in filters:
+        query = query.filter(TrainingJob.consumer_rapp_id == filters["consumer_rapp_id"])
+    if "producer_rapp_id" in filters:
+        query = query.filter(TrainingJob.producer_rapp_id == filters["producer_rapp_id"])
+    if "created_after" in filters:
+        query = query.filter(TrainingJob.creation_time >= filters["created_after"])
+    if "created_before" in filters:
+        query = query.filter(TrainingJob.creation_time < filters["created_before"])
+    return query
+
+
+def get_trainingjobs_version(filters):
+    """
+    This function returns the number of trainingjobs matching filters (see filter_trainingjobs),
+    their highest id, their latest creation or update time, the sum of the versions of their step
+    states and the latest change of these. One of them changes whenever one of these trainingjobs
+    is created, updated, deleted or moves to another step state, the listing can be validated
+    against them without being read.
+    """
+    try:
+        return tuple(filter_trainingjobs(filters).with_entities(
+            func.count(TrainingJob.id), func.max(TrainingJob.id),
+            func.max(func.coalesce(TrainingJob.updation_time, TrainingJob.creation_time)),
+            # Every step transition increments the version of one trainingjob, a trainingjob which
+            # starts matching the filters has the latest change
+            func.sum(TrainingJobStatus.version),
+            func.max(func.coalesce(TrainingJobStatus.updation_time, TrainingJobStatus.creation_time))).one())
+    except Exception as err:
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} the get_trainingjobs_version : {str(err)}')
+
+
+def get_steps_states(trainingjob_ids):
+    """
+    This function returns the step states of each of the trainingjobs, by trainingjob id.
+    Missing trainingjobs are left out.
+    """
+    try:
+        rows = db.session.query(TrainingJob.id, TrainingJobStatus).join(TrainingJob.steps_state) \
+            .filter(TrainingJob.id.in_(trainingjob_ids)).all()
+    except Exception as err:
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} the get_steps_states : {str(err)}')
+    return dict(rows)
+
+
+def get_trainingjob_events(after=0, limit=100, trainingjob_id=None):
+    """
+    This function returns the first limit trainingjob events after the event with id after, in
+    the order they were committed, only those of the trainingjob trainingjob_id if it is given.
+    """
+    query = TrainingJobEvent.query.filter(TrainingJobEvent.id > after)
+    if trainingjob_id is not None:
+        query = query.filter(TrainingJobEvent.trainingjob_id == trainingjob_id)
+    try:
+        return query.order_by(TrainingJobEvent.id).limit(limit).all()
+    except Exception as err:
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} the get_trainingjob_events : {str(err)}')
+
+
+def get_last_trainingjob_event_id():
+    """
+    This function returns the id of the last trainingjob event, 0 if there is none.
+    """
+    try:
+        return db.session.query(func.max(TrainingJobEvent.id)).scalar() or 0
+    except Exception as err:
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} the get_last_trainingjob_event_id : {str(err)}')
+
+
+def _sort_columns(sort):
+    column = SORT_COLUMNS[sort]
+    return [column] if column is TrainingJob.id else [column, TrainingJob.id]
+
+
+def get_trainingjobs_page(filters, sort="id", descending=False, limit=100, after=None):
+    """
+    This function returns one page of trainingjobs matching filters, ordered by the sort column
+    and then by id, using keyset pagination.
+
+    Args:
+        filters (dict): filters of filter_trainingjobs
+        sort (str): key of SORT_COLUMNS
+        descending (bool): whether the trainingjobs are ordered from the highest sort value
+        limit (int): maximum number of trainingjobs returned, None for all of them
+        after (tuple): (sort value, id) of the last trainingjob of the previous page
+
+    Returns:
+        list: the trainingjobs of the page
+        tuple: (sort value, id) of the last trainingjob, None if it is the last page
+    """
+    query = filter_trainingjobs(filters)
+    columns = _sort_columns(sort)
+    if after is not None:
+        key = tuple_(*columns) if len(columns) > 1 else columns[0]
+        last = tuple_(*after) if len(columns) > 1 else after[1]
+        query = query.filter(key < last if descending else key > last)
+    order = [desc(column) if descending else column for column in columns]
+    query = query.order_by(*order)
+    try:
+        # One more than the page is fetched to know whether there is a next page
+        trainingjobs = query.all() if limit is None else query.limit(limit + 1).all()
+    except Exception as err:
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} the get_trainingjobs_page : {str(err)}')
+    if limit is None or len(trainingjobs) <= limit:
+        return trainingjobs, None
+    trainingjobs = trainingjobs[:limit]
+    last_trainingjob = trainingjobs[-1]
+    return trainingjobs, (getattr(last_trainingjob, sort), last_trainingjob.id)
+
+
+def iter_trainingjobs(filters, sort="id", descending=False, chunk_size=500):
+    """
+    This function yields all the trainingjobs matching filters in the order of get_trainingjobs_page,
+    reading them from the database chunk_size rows at a time.
+    """
+    order = [desc(column) if descending else column for column in _sort_columns(sort)]
+    try:
+        yield from filter_trainingjobs(filters).order_by(*order).yield_per(chunk_size)
+    except Exception as err:
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} the iter_trainingjobs : {str(err)}')
+
+
+def transition_steps(trainingjob_id, changes, expected=None, expected_version=None):
+    """
+    This function applies the step changes of a trainingjob in a single UPDATE, optionally
+    only if its steps are still in the expected states (compare-and-swap).
+
+    Args:
+        trainingjob_id: id of the trainingjob
+        changes (dict): new state of each step to change, by step name
+        expected (dict): state each step must still be in, by step name
+        expected_version (int): version the step states must still be at
+
+    Returns:
+        bool: True if the changes were applied, False if the trainingjob does not exist
+              or its steps no longer match expected or expected_version.
+    """
+    steps_state_id = select(TrainingJob.steps_state_id).where(TrainingJob.id == trainingjob_id).scalar_subquery()
+    conditions = [TrainingJobStatus.id == steps_state_id]
+    conditions += [TrainingJobStatus.column(step) == state for step, state in (expected or {}).items()]
+    if expected_version is not None:
+        conditions.append(TrainingJobStatus.version == expected_version)
+    values = {STEP_COLUMNS[step]: state for step, state in changes.items()}
+    values["version"] = TrainingJobStatus.version + 1
+    try:
+        result = db.session.execute(update(TrainingJobStatus).where(*conditions).values(values),
+                                    execution_options={"synchronize_session": False})
+        if result.rowcount > 0:
+            _append_events(trainingjob_id, steps_state_id, changes)
         db.session.commit()
     except Exception as e:
-        raise DBException(f'{DB_QUERY_EXEC_ERROR} the change_steps_state : {str(e)}')
+        db.session.rollback()
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} the transition_steps : {str(e)}')
+    if result.rowcount == 0:
+        return False
+    _notify_step_transition(trainingjob_id)
+    return True
 
 
-def change_state_to_failed(trainingjob_id):
+def transition_steps_of_trainingjobs(trainingjob_ids, changes):
+    """
+    This function applies the same step changes to several trainingjobs in a single UPDATE and
+    transaction, as transition_steps does for one trainingjob without expected states.
 
+    Returns:
+        list: ids of the trainingjobs changed, the ones which do not exist are left out.
+    """
+    if not trainingjob_ids:
+        return []
+    values = {STEP_COLUMNS[step]: state for step, state in changes.items()}
+    values["version"] = TrainingJobStatus.version + 1
     try:
-        trainingjob = TrainingJob.query.filter(TrainingJob.id==trainingjob_id).one()
-        steps_state = json.loads(trainingjob.steps_state.states)
-        for step in steps_state:
-            if steps_state[step] == States.IN_PROGRESS.name:
-                steps_state[step] = States.FAILED.name
-        trainingjob.steps_state.states=json.dumps(steps_state)
-        db.session.add(trainingjob)
+        changed = db.session.scalars(select(TrainingJob.id).where(TrainingJob.id.in_(trainingjob_ids))
+                                     .order_by(TrainingJob.id)).all()
+        if changed:
+            steps_state_ids = select(TrainingJob.steps_state_id).where(TrainingJob.id.in_(changed))
+            db.session.execute(update(TrainingJobStatus).where(TrainingJobStatus.id.in_(steps_state_ids)).values(values),
+                               execution_options={"synchronize_session": False})
+            lock_trainingjob_events(db.session)
+            for step, state in changes.items():
+                db.session.execute(insert(TrainingJobEvent).from_select(
+                    ["trainingjob_id", "step", "state", "version"],
+                    select(TrainingJob.id, literal(step), literal(state), TrainingJobStatus.version)
+                    .join(TrainingJob.steps_state).where(TrainingJob.id.in_(changed)).order_by(TrainingJob.id)))
         db.session.commit()
     except Exception as e:
-        raise DBException(f'{DB_QUERY_EXEC_ERROR} the change_steps_state to failed : {str(e)}')
+        db.session.rollback()
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} the transition_steps_of_trainingjobs : {str(e)}')
+    for trainingjob_id in changed:
+        _notify_step_transition(trainingjob_id)
+    return changed
 
-def change_steps_state_df(trainingjob_id, step: Steps, state:States):
-    try:
 
-        trainingjob = TrainingJob.query.filter(TrainingJob.id==trainingjob_id).one()
-        steps_state = json.loads(trainingjob.steps_state.states)
-        steps_state[step] = state
-        trainingjob.steps_state.states=json.dumps(steps_state)
-        db.session.add(trainingjob)
+def _append_events(trainingjob_id, steps_state_id, changes):
+    """
+    Appends the events of the step changes of a trainingjob, in the transaction which made them.
+    """
+    lock_trainingjob_events(db.session)
+    version = select(TrainingJobStatus.version).where(TrainingJobStatus.id == steps_state_id).scalar_subquery()
+    db.session.execute(insert(TrainingJobEvent).values([
+        {"trainingjob_id": trainingjob_id, "step": step, "state": state, "version": version}
+        for step, state in changes.items()
+    ]))
+
+
+def _notify_step_transition(trainingjob_id):
+    for listener in STEP_TRANSITION_LISTENERS:
+        listener(trainingjob_id)
+
+
+def change_steps_state(trainingjob_id, step: Steps, state:States):
+    if not transition_steps(trainingjob_id, {step: state}):
+        raise DBException(f"Failed to execute change_steps_state for id: {trainingjob_id}, because id doesn't exist in db")
+
+
+def change_state_to_failed(trainingjob_id):
+    """
+    This function sets every step of the trainingjob which is in progress to failed in a single UPDATE.
+    """
+    steps_state_id = select(TrainingJob.steps_state_id).where(TrainingJob.id == trainingjob_id).scalar_subquery()
+    values = {}
+    for step, column in STEP_COLUMNS.items():
+        state = TrainingJobStatus.column(step)
+        values[column] = case((state == States.IN_PROGRESS.name, States.FAILED.name), else_=state)
+    values["version"] = TrainingJobStatus.version + 1
+    try:
+        # Locked until the commit, the steps in progress read here are the ones the update fails
+        steps_state = db.session.execute(select(TrainingJobStatus).where(TrainingJobStatus.id == steps_state_id)
+                                         .with_for_update()).scalar_one_or_none()
+        result = db.session.execute(update(TrainingJobStatus).where(TrainingJobStatus.id == steps_state_id).values(values),
+                                    execution_options={"synchronize_session": False})
+        failed_steps = {step: States.FAILED.name for step in STEP_COLUMNS
+                        if steps_state is not None and steps_state.get_state(step) == States.IN_PROGRESS.name}
+        if result.rowcount > 0 and failed_steps:
+            _append_events(trainingjob_id, steps_state_id, failed_steps)
         db.session.commit()
     except Exception as e:
-        raise DBException(f'{DB_QUERY_EXEC_ERROR} the change_steps_state : {str(e)}')
+        db.session.rollback()
+        raise DBException(f'{DB_QUERY_EXEC_ERROR} the change_steps_state to failed : {str(e)}')
+    if result.rowcount == 0:
+        raise DBException(f"Failed to execute the change_steps_state to failed for id: {trainingjob_id}, because id doesn't exist in db")
+    _notify_step_transition(trainingjob_id)
+
+def change_steps_state_df(trainingjob_id, step: Steps, state:States):
+    if not transition_steps(trainingjob_id, {step: state}):
+        raise DBException(f"Failed to execute change_steps_state_df for id: {trainingjob_id}, because id doesn't exist in db")
     
 def changeartifact(trainingjob_id, new_artifact_version):
     try:
         trainingjob = TrainingJob.query.filter(TrainingJob.id==trainingjob_id).one()
         trainingjob.modelId.artifactversion = new_artifact_version
+        # The artifact version is part of every trainingjob of the model, they all count as updated
+        db.session.execute(update(TrainingJob).where(TrainingJob.model_id == trainingjob.model_id)
+                           .values(updation_time=func.now()))
         db.session.commit()
     except Exception as err:
         raise DBException(f'{DB_QUERY_EXEC_ERROR} the changeartifact : {str(err)}')
@@ -1,123 +1,464 @@
+import os
+import socket
 import threading
-from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
 import json
+import random
 import time
-import requests
 from trainingmgr.common.trainingConfig_parser import getField
 from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
 from trainingmgr.common.trainingmgr_operations import data_extraction_status, notification_rapp
 # from trainingmgr.common.trainingmgr_util import handle_async_feature_engineering_status_exception_case
-from trainingmgr.common.exceptions_utls import DBException, TMException
-from trainingmgr.constants import Steps, States
+from trainingmgr.common.exceptions_utls import DBException, TMException, DownstreamUnavailableException
+from trainingmgr.constants import Steps, States, WorkActions
 from modelmetricsdk.model_metrics_sdk import ModelMetricsSdk
-from trainingmgr.db.trainingjob_db import change_state_to_failed, get_trainingjob, change_steps_state
+from trainingmgr.db.trainingjob_db import change_state_to_failed, get_trainingjob, change_steps_state, change_field_value, \
+    get_trainingjobs_by_step_state, transition_steps, get_trainingjob_ids_being_deleted
+from trainingmgr.db.lifecycle_work_db import enqueue_work, enqueue_works, requeue_work, handover_work, claim_due_work, retry_work, complete_work, \
+    remove_work, defer_work, get_work_queue, get_queued_trainingjob_ids
+from trainingmgr.db.advisory_lock_db import LeaderElection, LIFECYCLE_LEADER_LOCK_ID
+from trainingmgr.service.mme_service import get_modelinfo_by_modelId_service
 
 
 # Global variables
-LOCK = Lock()
-DATAEXTRACTION_JOBS_CACHE = {}
 LOGGER = TrainingMgrConfig().logger
 TRAININGMGR_CONFIG_OBJ = TrainingMgrConfig()
 Model_Metrics_Sdk = ModelMetricsSdk()
+# Upper limit (in seconds) of the time the worker sleeps before looking for due work again
+POLL_TICK = 1
+# Identifies this process in the leases of the work queue, which is shared by all replicas
+WORKER_ID = f"{socket.gethostname()}-{os.getpid()}"
+# Set when work has been queued which is due right away
+WORK_AVAILABLE = threading.Event()
+# Elects the replica which runs the singleton background tasks, set by start_async_handler
+LEADER = None
+# Limits the trainingjobs this process deletes at a time, and so its calls to the KF adapter
+DELETION_SLOTS = threading.BoundedSemaphore(TRAININGMGR_CONFIG_OBJ.trainingjob_delete_workers)
 
-def get_data_extraction_in_progress_trainingjobs():
-    result = {}
+
+class PollBackoff:
+    """
+    Time between two runs of a repeated lifecycle action.
+
+    The first run happens after min_interval seconds, the interval then grows by backoff_factor
+    after every run up to max_interval, and every interval is varied by +/- jitter so that
+    trainingjobs which were queued together do not hit data extraction at the same instant.
+    """
+
+    def __init__(self, min_interval, max_interval, backoff_factor, jitter):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.backoff_factor = max(1.0, backoff_factor)
+        self.jitter = min(max(jitter, 0.0), 1.0)
+
+    def interval(self, attempts):
+        """
+        Returns the jittered time in seconds until the next run of an action which has run attempts times.
+        """
+        interval = min(self.max_interval, self.min_interval * (self.backoff_factor ** attempts))
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+POLL_BACKOFF = PollBackoff(TRAININGMGR_CONFIG_OBJ.data_extraction_poll_interval,
+                           TRAININGMGR_CONFIG_OBJ.data_extraction_poll_max_interval,
+                           TRAININGMGR_CONFIG_OBJ.data_extraction_poll_backoff_factor,
+                           TRAININGMGR_CONFIG_OBJ.data_extraction_poll_jitter)
+
+def add_data_extraction_job(trainingjob_id):
+    """
+    Queues the data extraction status checks of the trainingjob, must be called within an app context.
+    """
+    enqueue_work(trainingjob_id, WorkActions.POLL_DATA_EXTRACTION.name, POLL_BACKOFF.interval(0))
+
+def add_data_extraction_jobs(trainingjob_ids):
+    """
+    Queues the data extraction status checks of the trainingjobs at once, must be called within an
+    app context. The first checks are spread by the jitter of the backoff.
+    """
+    enqueue_works([(trainingjob_id, POLL_BACKOFF.interval(0)) for trainingjob_id in trainingjob_ids],
+                  WorkActions.POLL_DATA_EXTRACTION.name)
+
+def remove_data_extraction_job(APP, trainingjob_id):
+    """
+    Stops checking the data extraction status of the trainingjob.
+    """
+    with APP.app_context():
+        remove_work(trainingjob_id, WorkActions.POLL_DATA_EXTRACTION.name)
+
+def claim_data_extraction_job(APP, trainingjob_id):
+    """
+    Removes the data extraction status checks of the trainingjob from the queue and returns True
+    if they were still queued, so that a final data extraction status is acted upon only once,
+    whether it was polled or notified by data extraction, and by whichever replica.
+    """
+    with APP.app_context():
+        return remove_work(trainingjob_id, WorkActions.POLL_DATA_EXTRACTION.name) > 0
+
+def defer_data_extraction_job(trainingjob_id):
+    """
+    Postpones the next status check of a trainingjob for which data extraction has just
+    reported its status, the poller then only reconciles the jobs which have gone quiet.
+    Must be called within an app context.
+    """
+    defer_work(trainingjob_id, WorkActions.POLL_DATA_EXTRACTION.name,
+               TRAININGMGR_CONFIG_OBJ.data_extraction_reconcile_interval)
+
+def add_model_url_job(trainingjob_id):
+    """
+    Queues the resolution of the model url of a trainingjob whose training pipeline has succeeded,
+    must be called within an app context.
+    """
+    enqueue_work(trainingjob_id, WorkActions.RESOLVE_MODEL_URL.name)
+    WORK_AVAILABLE.set()
+
+def add_deletion_jobs(trainingjob_ids):
+    """
+    Queues the deletion of the trainingjobs at once, must be called within an app context.
+    """
+    if trainingjob_ids:
+        enqueue_works([(trainingjob_id, 0) for trainingjob_id in trainingjob_ids],
+                      WorkActions.DELETE_TRAININGJOB.name)
+        WORK_AVAILABLE.set()
+
+def get_work_schedule():
+    """
+    Returns the queued lifecycle work of all replicas, must be called within an app context.
+    """
+    return get_work_queue()
+
+def get_replica_info():
+    """
+    Returns the id of this replica and whether it is the leader.
+    """
+    return {"replica_id": WORKER_ID, "leader": LEADER is not None and LEADER.is_leader}
+
+def fail_data_extraction_job(APP, trainingjob_id):
+    """
+    Marks the in progress steps of the trainingjob as failed and notifies the rApp.
+    """
+    #The following try-block will prevent thread-failure when  'change_state_to_failed' fails
     try:
-        trainingjobs = get_trainingjob()
-        for trainingjob in trainingjobs:
-            status = json.loads(trainingjob.steps_state.states)
-            if status[Steps.DATA_EXTRACTION.name] == States.IN_PROGRESS.name:
-                result[trainingjob.id] = "Scheduled"
+        with APP.app_context():
+            remove_work(trainingjob_id, WorkActions.POLL_DATA_EXTRACTION.name)
+            change_state_to_failed(trainingjob_id)
+            notification_rapp(trainingjob_id)
     except Exception as err:
-        raise DBException("get_data_extraction_in_progress_trainingjobs," + str(err))
-    return result
+        LOGGER.error(f"Error checking data extraction status-Exception: {str(err)}")
 
-def check_and_notify_feature_engineering_status(APP,db):
-    """Asynchronous function to check and notify feature engineering status."""
-    LOGGER.debug("in the check_and_notify_feature_engineering_status")
-    url_pipeline_run = (
-        f"http://{TRAININGMGR_CONFIG_OBJ.my_ip}:"
-        f"{TRAININGMGR_CONFIG_OBJ.my_port}/trainingjob/dataExtractionNotification"
-    )
+def handle_data_extraction_task_status(APP, trainingjob, task_status):
+    """
+    Hands the trainingjob over to the training pipeline start when the data extraction task
+    is completed, or fails it when the task reported an error.
 
-    while True:
-        with LOCK:
-            training_job_ids = list(DATAEXTRACTION_JOBS_CACHE)
-        for trainingjob_id in training_job_ids:
-            LOGGER.debug(f"Current DATAEXTRACTION_JOBS_CACHE: {DATAEXTRACTION_JOBS_CACHE}")
+    Returns True if task_status was final (Completed or Error), False otherwise.
+    """
+    if task_status not in ("Completed", "Error"):
+        return False
+
+    featuregroup_name = getField(trainingjob.training_config, "feature_group_name")
+    if task_status == "Error":
+        if claim_data_extraction_job(APP, trainingjob.id):
+            LOGGER.error(f"Data extraction failed for {featuregroup_name}, trainingjob_id {trainingjob.id}")
+            fail_data_extraction_job(APP, trainingjob.id)
+        return True
+
+    with APP.app_context():
+        handed_over = handover_work(trainingjob.id, WorkActions.POLL_DATA_EXTRACTION.name,
+                                    WorkActions.START_PIPELINE.name)
+    if handed_over:
+        LOGGER.debug(f"Data extraction completed for {featuregroup_name}, training pipeline of trainingjob_id {trainingjob.id} is queued")
+        WORK_AVAILABLE.set()
+    else:
+        LOGGER.debug(f"Data extraction status {task_status} of trainingjob_id {trainingjob.id} is already handled")
+    return True
+
+def check_data_extraction_status(APP, trainingjob_id):
+    """
+    Checks the data extraction status of one trainingjob and starts the training once
+    data extraction is completed.
+    """
+    try:
+        with APP.app_context():
+            trainingjob = get_trainingjob(trainingjob_id)
+
+        if trainingjob is None:
+            # trainingjob_id not present in db, A possible case of deletion
+            LOGGER.debug(f"Training-Job Id {trainingjob_id} is Found to be deleted| Removing from work queue")
+            remove_data_extraction_job(APP, trainingjob_id)
+            return
+        featuregroup_name = getField(trainingjob.training_config, "feature_group_name")
+        response = data_extraction_status(featuregroup_name, trainingjob_id, TRAININGMGR_CONFIG_OBJ)
+        if (response.headers.get('content-type') != "application/json" or
+                response.status_code != 200):
+            raise TMException(f"Data extraction API returned an error for {featuregroup_name}. for trainingjob_id {trainingjob.id}")
+
+        response_data = response.json()
+        LOGGER.debug(f"Data extraction status for {featuregroup_name}: {json.dumps(response_data)} for trainingjob_id {trainingjob.id}")
+        handle_data_extraction_task_status(APP, trainingjob, response_data["task_status"])
+    except DBException as err:
+        # If there is any communication error with db, the thread must not fail
+        LOGGER.error("Recieved Db Failure in async-handler| Error : " + str(err))
+    except DownstreamUnavailableException as err:
+        # No request was sent, the status is checked again after the backoff
+        LOGGER.warning(f"Data extraction status of trainingjob_id {trainingjob_id} not checked: {str(err)}")
+    except Exception as err:
+        LOGGER.error(f"Error checking data extraction status: {str(err)}")
+        fail_data_extraction_job(APP, trainingjob_id)
+
+def _back_to_data_extraction(trainingjob_id):
+    """
+    Moves a trainingjob whose training pipeline could not be started back to data extraction,
+    from where START_PIPELINE moves it on again.
+    """
+    transition_steps(trainingjob_id,
+                     {Steps.DATA_EXTRACTION.name: States.IN_PROGRESS.name,
+                      Steps.DATA_EXTRACTION_AND_TRAINING.name: States.NOT_STARTED.name},
+                     expected={Steps.DATA_EXTRACTION_AND_TRAINING.name: States.IN_PROGRESS.name})
+
+def retry_training_pipeline_start(trainingjob_id):
+    """
+    Queues the training pipeline start of a trainingjob whose start was rejected as MME or the
+    KF adapter were unavailable, it is retried after the backoff instead of failing the trainingjob.
+    Must be called within an app context.
+    """
+    _back_to_data_extraction(trainingjob_id)
+    enqueue_work(trainingjob_id, WorkActions.START_PIPELINE.name, POLL_BACKOFF.interval(0))
+
+def start_training_pipeline_job(APP, trainingjob_id):
+    """
+    Starts the training pipeline of a trainingjob whose data extraction is completed,
+    the trainingjob is failed if the pipeline can not be started. DownstreamUnavailableException
+    is raised for the start to be retried if MME or the KF adapter could not be called.
+    """
+    # Imported here as training_job_service queues its trainingjobs through this module
+    from trainingmgr.service.training_job_service import start_training_pipeline
+    try:
+        with APP.app_context():
+            trainingjob = get_trainingjob(trainingjob_id)
+            if trainingjob is None or trainingjob.deletion_in_progress:
+                return
+            started = transition_steps(trainingjob_id,
+                                       {Steps.DATA_EXTRACTION.name: States.FINISHED.name,
+                                        Steps.DATA_EXTRACTION_AND_TRAINING.name: States.IN_PROGRESS.name},
+                                       expected={Steps.DATA_EXTRACTION.name: States.IN_PROGRESS.name})
+            if not started:
+                LOGGER.warning(f"Data extraction of trainingjob_id {trainingjob_id} is no longer in progress, "
+                               "its training pipeline is not started")
+                return
+            run_id = start_training_pipeline(trainingjob)
+        LOGGER.info(f"Training pipeline run {run_id} started for trainingjob_id {trainingjob_id}")
+    except DownstreamUnavailableException as err:
+        # No request was sent, the trainingjob goes back to data extraction for the start to be retried
+        LOGGER.warning(f"Training pipeline of trainingjob_id {trainingjob_id} not started: {str(err)}")
+        with APP.app_context():
+            _back_to_data_extraction(trainingjob_id)
+        raise
+    except Exception as err:
+        LOGGER.error(f"Error starting training pipeline of trainingjob_id {trainingjob_id}: {str(err)}")
+        fail_data_extraction_job(APP, trainingjob_id)
+
+def resolve_model_url(APP, trainingjob_id):
+    """
+    Sets the model url of a trainingjob whose training pipeline has succeeded once the
+    trained model is available.
+
+    Returns False if the trained model is not available yet, True otherwise.
+    """
+    with APP.app_context():
+        trainingjob = get_trainingjob(trainingjob_id)
+        if trainingjob is None:
+            return True
+        model_name = trainingjob.modelId.modelname
+        model_version = trainingjob.modelId.modelversion
+
+        # The artifact version changes when a model is retrained, the cached model information may be stale
+        modelinfo = get_modelinfo_by_modelId_service(model_name, model_version, use_cache=False)[0]
+        artifactversion = modelinfo["modelId"]["artifactVersion"]
+        if not Model_Metrics_Sdk.check_object(model_name, model_version, artifactversion, "Model.zip"):
+            return False
+
+        model_url = "http://" + str(TRAININGMGR_CONFIG_OBJ.my_ip) + ":" + \
+                    str(TRAININGMGR_CONFIG_OBJ.my_port) + "/model/" + \
+                    model_name + "/" + str(model_version) + "/" + str(artifactversion) + "/Model.zip"
+        change_field_value(trainingjob_id, "model_url", model_url)
+        change_steps_state(trainingjob_id, Steps.TRAINED_MODEL.name, States.FINISHED.name)
+        notification_rapp(trainingjob_id)
+    return True
+
+def delete_trainingjob_job(APP, trainingjob_id):
+    """
+    Deletes a trainingjob whose deletion was requested, its training pipeline run is terminated
+    and its data extraction is no longer checked. Errors are raised for the deletion to be retried.
+    """
+    # Imported here as training_job_service queues its trainingjobs through this module
+    from trainingmgr.service.training_job_service import delete_training_job
+    with APP.app_context():
+        if delete_training_job(trainingjob_id):
+            LOGGER.info(f"Trainingjob_id {trainingjob_id} deleted")
+
+def give_up_deletion(APP, trainingjob_id):
+    """
+    Clears deletion_in_progress of a trainingjob which could not be deleted within the maximum
+    number of attempts, so that it is not queued again and its deletion can be requested again.
+    """
+    LOGGER.error(f"Trainingjob_id {trainingjob_id} could not be deleted, its deletion has to be requested again")
+    try:
+        with APP.app_context():
+            change_field_value(trainingjob_id, "deletion_in_progress", False)
+    except Exception as err:
+        LOGGER.error(f"Error clearing deletion_in_progress of trainingjob_id {trainingjob_id}: {str(err)}")
+
+def fail_model_url_job(APP, trainingjob_id):
+    """
+    Marks the TRAINED_MODEL step of the trainingjob as failed and notifies the rApp.
+    """
+    try:
+        with APP.app_context():
+            change_steps_state(trainingjob_id, Steps.TRAINED_MODEL.name, States.FAILED.name)
+            notification_rapp(trainingjob_id)
+    except Exception as err:
+        LOGGER.error(f"Error failing trainingjob_id {trainingjob_id}: {str(err)}")
+
+def run_lifecycle_work(APP, work):
+    """
+    Runs one claimed work item and then completes it, or gives it back to the queue
+    if the action has to be run again.
+    """
+    trainingjob_id = work["trainingjob_id"]
+    retry_after = None
+    count_attempt = True
+    try:
+        if work["action"] == WorkActions.POLL_DATA_EXTRACTION.name:
+            check_data_extraction_status(APP, trainingjob_id)
+            # Gone from the queue if the status was final
+            retry_after = POLL_BACKOFF.interval(work["attempts"] + 1)
+        elif work["action"] == WorkActions.START_PIPELINE.name:
+            start_training_pipeline_job(APP, trainingjob_id)
+        elif work["action"] == WorkActions.RESOLVE_MODEL_URL.name:
             try:
-                # trainingjob_name = trainingjob.trainingjob_name
-                with APP.app_context():
-                    trainingjob = get_trainingjob(trainingjob_id)
-                
-                if trainingjob is None:
-                    # trainingjob_id not present in db, A possible case of deletion
-                    LOGGER.debug(f"Training-Job Id {trainingjob_id} is Found to be deleted| Removing from DATAEXTRACTION_JOBS_CACHE")
-                    with LOCK:
-                        DATAEXTRACTION_JOBS_CACHE.pop(trainingjob_id)
-                    continue
-                    
-                featuregroup_name = getField(trainingjob.training_config, "feature_group_name")
-                response = data_extraction_status(featuregroup_name, trainingjob_id, TRAININGMGR_CONFIG_OBJ)
-                if (response.headers.get('content-type') != "application/json" or
-                        response.status_code != 200):
-                    raise TMException(f"Data extraction API returned an error for {featuregroup_name}. for trainingjob_id {trainingjob.id}")
-
-                response_data = response.json()
-                LOGGER.debug(f"Data extraction status for {featuregroup_name}: {json.dumps(response_data)} for trainingjob_id {trainingjob.id}")
-
-                if response_data["task_status"] == "Completed":
-                    with APP.app_context():
-                        
-                        change_steps_state(trainingjob.id, Steps.DATA_EXTRACTION.name, States.FINISHED.name)
-                        change_steps_state(trainingjob.id, Steps.DATA_EXTRACTION_AND_TRAINING.name, States.IN_PROGRESS.name)
-
-                    LOGGER.info("url_pipeline_run is : "+ str(url_pipeline_run))
-
-                    kf_response = requests.post(
-                        url_pipeline_run,
-                        data=json.dumps({"trainingjob_id": trainingjob.id}),
-                        headers={'Content-Type': "application/json", 'Accept-Charset': 'UTF-8'}
-                    )
-                    if (kf_response.headers.get('content-type') != "application/json" or
-                            kf_response.status_code != 200):
-                        LOGGER.error(f"KF adapter returned an error for {featuregroup_name}. | Response : {kf_response.json()}")
-                        raise TMException(f"KF adapter returned an error for {featuregroup_name}. ")
-
-                    with LOCK:
-                        DATAEXTRACTION_JOBS_CACHE.pop(trainingjob.id)
-                elif response_data["task_status"] == "Error":
-                    raise TMException(f"Data extraction failed for {featuregroup_name}.")
-            except DBException as err:
-                # If there is any communication error with db, the thread must not fail
-                LOGGER.error("Recieved Db Failure in async-handler| Error : " + str(err))
-                continue
+                resolved = resolve_model_url(APP, trainingjob_id)
             except Exception as err:
-                LOGGER.error(f"Error processing DATAEXTRACTION_JOBS_CACHE: {str(err)}")
-                #The following try-block will prevent thread-failure when  'change_state_to_failed' fails
+                LOGGER.error(f"Error resolving model url of trainingjob_id {trainingjob_id}: {str(err)}")
+                resolved = False
+            if not resolved:
+                if work["attempts"] + 1 < TRAININGMGR_CONFIG_OBJ.lifecycle_work_max_attempts:
+                    retry_after = POLL_BACKOFF.interval(work["attempts"])
+                else:
+                    LOGGER.error(f"Trained model is not available for trainingjob_id {trainingjob_id}")
+                    fail_model_url_job(APP, trainingjob_id)
+        elif work["action"] == WorkActions.DELETE_TRAININGJOB.name:
+            if DELETION_SLOTS.acquire(blocking=False):
                 try:
-                    with APP.app_context():
-                        change_state_to_failed(trainingjob.id)
-                        notification_rapp(trainingjob.id)
-                        with LOCK:
-                                DATAEXTRACTION_JOBS_CACHE.pop(trainingjob.id)
-                except KeyError as key_err:
-                    LOGGER.error("The training job key doesn't exist in DATAEXTRACTION_JOBS_CACHE: " + str(key_err))
+                    delete_trainingjob_job(APP, trainingjob_id)
                 except Exception as err:
-                    LOGGER.error(f"Error processing DATAEXTRACTION_JOBS_CACHE-Exception: {str(err)}")
-                    
+                    LOGGER.error(f"Error deleting trainingjob_id {trainingjob_id}: {str(err)}")
+                    if work["attempts"] + 1 < TRAININGMGR_CONFIG_OBJ.lifecycle_work_max_attempts:
+                        retry_after = POLL_BACKOFF.interval(work["attempts"] + 1)
+                    else:
+                        give_up_deletion(APP, trainingjob_id)
+                finally:
+                    DELETION_SLOTS.release()
+            else:
+                # The deletion waits in the queue for a slot, the other workers go on with the other work
+                retry_after = POLL_TICK
+                count_attempt = False
+        else:
+            LOGGER.error(f"Unknown lifecycle action {work['action']} for trainingjob_id {trainingjob_id}")
+    except Exception as err:
+        LOGGER.error(f"Error running {work['action']} for trainingjob_id {trainingjob_id}: {str(err)}")
+        retry_after = POLL_BACKOFF.interval(work["attempts"] + 1)
+
+    try:
+        with APP.app_context():
+            if retry_after is None:
+                complete_work(work["id"], WORKER_ID)
+            else:
+                retry_work(work["id"], WORKER_ID, retry_after, count_attempt)
+    except Exception as err:
+        # The lease runs out and the work item is claimed again
+        LOGGER.error(f"Error releasing {work['action']} of trainingjob_id {trainingjob_id}: {str(err)}")
+
+def check_and_notify_feature_engineering_status(APP,db):
+    """Asynchronous function running the lifecycle work queue, it is shared with the other replicas."""
+    LOGGER.debug("in the check_and_notify_feature_engineering_status")
+    workers = TRAININGMGR_CONFIG_OBJ.lifecycle_work_workers
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lifecycle-worker")
+    running = set()
+    while True:
+        try:
+            # Claim only as much work as there are idle workers, the rest is left to the other replicas
+            capacity = workers - len(running)
+            if capacity > 0:
+                with APP.app_context():
+                    claimed = claim_due_work(WORKER_ID, capacity, TRAININGMGR_CONFIG_OBJ.lifecycle_work_lease)
+                if claimed:
+                    LOGGER.debug(f"Claimed lifecycle work: {claimed}")
+                for work in claimed:
+                    future = executor.submit(run_lifecycle_work, APP, work)
+                    running.add(future)
+                    future.add_done_callback(running.discard)
+        except Exception as err:
+            LOGGER.error(f"Error in lifecycle work queue: {str(err)}")
+
+        # Sleep before checking again, unless work has been queued in the meantime
+        WORK_AVAILABLE.wait(POLL_TICK)
+        WORK_AVAILABLE.clear()
+
 
-        time.sleep(10)  # Sleep before checking again
+def reconcile_lifecycle_work():
+    """
+    Queues again the lifecycle work of trainingjobs which are waiting for data extraction, for
+    their trained model or for their deletion, but have nothing queued, e.g. because their replica
+    crashed in between changing the state and queueing the work. Must be called within an app context.
 
+    Returns the ids of the trainingjobs whose work has been queued again, not those whose work
+    was queued by someone else in the meantime.
+    """
+    # Read the queue before the states, work which is done in between has already moved the state on.
+    # Work queued and claimed in between is left to its worker, requeue_work does not reset its lease
+    queued = get_queued_trainingjob_ids()
+    requeued = []
+    for trainingjob in get_trainingjobs_by_step_state(Steps.DATA_EXTRACTION.name, States.IN_PROGRESS.name):
+        if trainingjob.id not in queued and not trainingjob.deletion_in_progress and \
+                requeue_work(trainingjob.id, WorkActions.POLL_DATA_EXTRACTION.name,
+                             random.uniform(0, POLL_BACKOFF.min_interval)):
+            requeued.append(trainingjob.id)
+    for trainingjob in get_trainingjobs_by_step_state(Steps.TRAINED_MODEL.name, States.IN_PROGRESS.name):
+        if trainingjob.id not in queued and not trainingjob.deletion_in_progress and \
+                requeue_work(trainingjob.id, WorkActions.RESOLVE_MODEL_URL.name):
+            requeued.append(trainingjob.id)
+    # Includes the trainingjobs whose synchronous deletion failed, their deletion is finished in the background
+    for trainingjob_id in get_trainingjob_ids_being_deleted():
+        if trainingjob_id not in queued and requeue_work(trainingjob_id, WorkActions.DELETE_TRAININGJOB.name):
+            requeued.append(trainingjob_id)
+    return requeued
+
+def run_leader_tasks(APP):
+    """
+    Runs the background tasks of which only one may run across all replicas, on the replica
+    which holds the leader lock. The other replicas keep trying to become the leader.
+    """
+    while True:
+        try:
+            with APP.app_context():
+                if LEADER.try_acquire():
+                    requeued = reconcile_lifecycle_work()
+                    if requeued:
+                        LOGGER.warning(f"Lifecycle work of trainingjobs {requeued} was lost and has been queued again")
+                        WORK_AVAILABLE.set()
+        except Exception as err:
+            LOGGER.error(f"Error in leader tasks: {str(err)}")
+        time.sleep(TRAININGMGR_CONFIG_OBJ.lifecycle_reconcile_interval)
 
 
 def start_async_handler(APP,db):
     """Start the asynchronous handler."""
+    global LEADER
 
     LOGGER.debug("Initializing the asynchronous handler...")
-    with APP.app_context():
-        DATAEXTRACTION_JOBS_CACHE = get_data_extraction_in_progress_trainingjobs()
-    print("DATAEXTRACTION_JOBS_CACHE in start async is: ", DATAEXTRACTION_JOBS_CACHE)
-    # Start the async function in a separate thread
+    # The queued work is kept in the database and shared by all replicas, nothing has to be loaded after a restart
     threading.Thread(target=check_and_notify_feature_engineering_status, args=(APP,db), daemon=True).start()
-    LOGGER.debug("Asynchronous handler started.")
\ No newline at end of file
+    with APP.app_context():
+        LEADER = LeaderElection(db.engine, LIFECYCLE_LEADER_LOCK_ID, WORKER_ID, LOGGER)
+    threading.Thread(target=run_leader_tasks, args=(APP,), daemon=True).start()
+    LOGGER.debug(f"Asynchronous handler started as worker {WORKER_ID}.")
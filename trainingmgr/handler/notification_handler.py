@@ -0,0 +1,164 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+"""
+Delivers the step states of trainingjobs to the notification url of their rApp in the background.
+"""
+
+import queue
+import threading
+import time
+import requests
+from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
+from trainingmgr.common.http_client import get_http_client, RAPP
+
+TRAININGMGR_CONFIG_OBJ = TrainingMgrConfig()
+LOGGER = TRAININGMGR_CONFIG_OBJ.logger
+MIMETYPE_JSON = "application/json"
+# Upper limit (in seconds) of the time between two delivery attempts of a notification
+MAX_RETRY_BACKOFF = 60
+
+
+class NotificationDispatcher:
+    """
+    Delivers notifications with a pool of workers sharing the pooled connections to the rApps.
+
+    The notifications of a trainingjob always go to the same worker, so they are delivered in
+    order. A notification still waiting for delivery is replaced by a newer one of the same
+    trainingjob, only the latest step states reach the rApp.
+    """
+
+    def __init__(self, workers, queue_size, timeout, max_attempts, retry_backoff):
+        self.queues = [queue.Queue(maxsize=max(1, queue_size // workers)) for _ in range(workers)]
+        # Failed deliveries are retried here, so that a retry can be superseded by a newer notification.
+        # The rApps are not isolated as one service, the workers already keep them off the request path
+        self.client = get_http_client(RAPP, timeout=(TRAININGMGR_CONFIG_OBJ.http_connect_timeout, timeout), retries=0,
+                                      isolated=False)
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        # Latest notification of each queued trainingjob: (url, payload, time it was queued)
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.threads = []
+        self.counters = {"delivered": 0, "failed": 0, "dropped": 0, "coalesced": 0}
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def start(self):
+        with self.lock:
+            if self.threads:
+                return
+            for index, shard in enumerate(self.queues):
+                thread = threading.Thread(target=self._work, args=(shard,), daemon=True,
+                                          name=f"notification-worker-{index}")
+                thread.start()
+                self.threads.append(thread)
+
+    def submit(self, trainingjob_id, url, payload):
+        """
+        Queues the notification of a trainingjob, returns False if it was dropped as the queue is full.
+        """
+        with self.lock:
+            if trainingjob_id in self.pending:
+                queued_at = self.pending[trainingjob_id][2]
+                self.pending[trainingjob_id] = (url, payload, queued_at)
+                self.counters["coalesced"] += 1
+                return True
+            try:
+                self.queues[trainingjob_id % len(self.queues)].put_nowait(trainingjob_id)
+            except queue.Full:
+                self.counters["dropped"] += 1
+                LOGGER.error(f"Notification queue is full, notification of trainingjob_id {trainingjob_id} is dropped")
+                return False
+            self.pending[trainingjob_id] = (url, payload, time.monotonic())
+        return True
+
+    def _work(self, shard):
+        while True:
+            trainingjob_id = shard.get()
+            with self.lock:
+                url, payload, queued_at = self.pending.pop(trainingjob_id)
+            try:
+                self.deliver(trainingjob_id, url, payload, queued_at)
+            except Exception as err:
+                LOGGER.error(f"Error delivering notification of trainingjob_id {trainingjob_id}: {str(err)}")
+
+    def deliver(self, trainingjob_id, url, payload, queued_at):
+        """
+        Posts a notification, retrying with exponential backoff until it is accepted, superseded
+        by a newer notification of the same trainingjob or out of attempts.
+        """
+        for attempt in range(self.max_attempts):
+            if attempt > 0:
+                time.sleep(min(self.retry_backoff * 2 ** (attempt - 1), MAX_RETRY_BACKOFF))
+                with self.lock:
+                    if trainingjob_id in self.pending:
+                        self.counters["coalesced"] += 1
+                        return True
+            try:
+                response = self.client.post(url, data=payload,
+                                            headers={'content-type': MIMETYPE_JSON, 'Accept-Charset': 'UTF-8'})
+                if response.status_code == 200:
+                    self._record_delivery(time.monotonic() - queued_at)
+                    return True
+                LOGGER.warning(f"Notification of trainingjob_id {trainingjob_id} to {url} failed: {response.text}")
+            except requests.RequestException as err:
+                LOGGER.warning(f"Notification of trainingjob_id {trainingjob_id} to {url} failed: {str(err)}")
+        with self.lock:
+            self.counters["failed"] += 1
+        LOGGER.error(f"Giving up notification of trainingjob_id {trainingjob_id} after {self.max_attempts} attempts")
+        return False
+
+    def _record_delivery(self, latency):
+        with self.lock:
+            self.counters["delivered"] += 1
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+
+    def stats(self):
+        """
+        Returns the number of queued notifications, the delivery counters and the average and
+        maximum time in seconds from queuing to delivery.
+        """
+        with self.lock:
+            delivered = self.counters["delivered"]
+            return {
+                "queue_depth": len(self.pending),
+                **self.counters,
+                "latency_avg": self.latency_total / delivered if delivered else 0.0,
+                "latency_max": self.latency_max,
+            }
+
+
+NOTIFICATION_DISPATCHER = NotificationDispatcher(TRAININGMGR_CONFIG_OBJ.notification_workers,
+                                                 TRAININGMGR_CONFIG_OBJ.notification_queue_size,
+                                                 TRAININGMGR_CONFIG_OBJ.notification_timeout,
+                                                 TRAININGMGR_CONFIG_OBJ.notification_max_attempts,
+                                                 TRAININGMGR_CONFIG_OBJ.notification_retry_backoff)
+
+
+def submit_notification(trainingjob_id, url, payload):
+    return NOTIFICATION_DISPATCHER.submit(trainingjob_id, url, payload)
+
+
+def get_notification_stats():
+    return NOTIFICATION_DISPATCHER.stats()
+
+
+def start_notification_handler():
+    NOTIFICATION_DISPATCHER.start()
@@ -0,0 +1,334 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+"""
+Pushes the step states of trainingjobs and the trainingjob events to the clients watching them
+as Server-Sent Events.
+"""
+
+import collections
+import json
+import threading
+import time
+from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
+from trainingmgr.common.trainingmgr_util import get_one_word_status
+from trainingmgr.constants import States
+from trainingmgr.db import trainingjob_db
+from trainingmgr.schemas.trainingjob_event_schema import TrainingJobEventSchema
+from trainingmgr.schemas.fast_serializer import dumps
+
+TRAININGMGR_CONFIG_OBJ = TrainingMgrConfig()
+LOGGER = TRAININGMGR_CONFIG_OBJ.logger
+# Overall states after which the step states of a trainingjob no longer change
+FINAL_STATES = (States.FINISHED.name, States.FAILED.name)
+# Key of the watchers of the event feed, which are not watching one trainingjob
+FEED = None
+EVENT_SCHEMA = TrainingJobEventSchema()
+
+
+class StatusBroadcaster:
+    """
+    Fans the step states of trainingjobs out to their watchers in this process.
+
+    A step transition committed by this process is published right away, the transitions of
+    other processes are caught by one read of all the watched trainingjobs every poll_interval
+    seconds. Watchers wait on the condition of their trainingjob, so a transition only wakes
+    the watchers of that trainingjob and a watcher costs no database access.
+
+    While the event feed is watched, the latest events are read once into a buffer the feed
+    watchers are served from. Only a watcher behind the buffer reads the events from the database.
+    """
+
+    def __init__(self, max_watchers, poll_interval, event_buffer_size):
+        self.max_watchers = max_watchers
+        self.poll_interval = poll_interval
+        self.lock = threading.Lock()
+        # Number of watchers and condition of each watched trainingjob, FEED for the event feed
+        self.watchers = {}
+        self.conditions = {}
+        # Latest (version, states) published of each watched trainingjob
+        self.latest = {}
+        # Latest events as (id, trainingjob id, JSON), the buffer holds every event after events_after
+        self.events = collections.deque(maxlen=event_buffer_size)
+        self.events_after = None
+        self.app = None
+        self.thread = None
+        self.counters = {"published": 0, "rejected": 0}
+
+    def start(self, APP):
+        with self.lock:
+            if self.thread is not None or self.app is not None:
+                return
+            self.app = APP
+            trainingjob_db.STEP_TRANSITION_LISTENERS.append(self.on_step_transition)
+            if self.poll_interval > 0:
+                self.thread = threading.Thread(target=self._poll, args=(APP,), daemon=True,
+                                               name="status-stream-poller")
+                self.thread.start()
+
+    def subscribe(self, trainingjob_id):
+        """
+        Registers a watcher of the trainingjob, returns False if there are already max_watchers.
+        """
+        with self.lock:
+            if sum(self.watchers.values()) >= self.max_watchers:
+                self.counters["rejected"] += 1
+                return False
+            if trainingjob_id not in self.watchers:
+                self.watchers[trainingjob_id] = 0
+                self.conditions[trainingjob_id] = threading.Condition(self.lock)
+            self.watchers[trainingjob_id] += 1
+            return True
+
+    def unsubscribe(self, trainingjob_id):
+        with self.lock:
+            self.watchers[trainingjob_id] -= 1
+            if self.watchers[trainingjob_id] == 0:
+                del self.watchers[trainingjob_id]
+                del self.conditions[trainingjob_id]
+                self.latest.pop(trainingjob_id, None)
+                if trainingjob_id is FEED:
+                    # Without watchers the buffer is no longer kept up to date
+                    self.events.clear()
+                    self.events_after = None
+
+    def publish(self, trainingjob_id, version, states):
+        """
+        Wakes the watchers of the trainingjob if version is newer than the one they last got.
+        """
+        with self.lock:
+            if trainingjob_id not in self.watchers:
+                return
+            if trainingjob_id in self.latest and self.latest[trainingjob_id][0] >= version:
+                return
+            self.latest[trainingjob_id] = (version, states)
+            self.counters["published"] += 1
+            self.conditions[trainingjob_id].notify_all()
+
+    def wait(self, trainingjob_id, version, timeout):
+        """
+        Returns the (version, states) of the trainingjob published after version, None if there
+        is none within timeout seconds. The trainingjob must be subscribed to.
+        """
+        def newer():
+            latest = self.latest.get(trainingjob_id)
+            return latest if latest is not None and latest[0] > version else None
+        with self.lock:
+            self.conditions[trainingjob_id].wait_for(newer, timeout)
+            return newer()
+
+    def on_step_transition(self, trainingjob_id):
+        with self.lock:
+            watched = trainingjob_id in self.watchers
+            feed_watched = FEED in self.watchers
+        try:
+            if watched:
+                self._publish_steps_states([trainingjob_id])
+            if feed_watched:
+                self._read_events()
+        except Exception as err:
+            LOGGER.error(f"Error publishing the status of trainingjob_id {trainingjob_id}: {str(err)}")
+
+    def _publish_steps_states(self, trainingjob_ids):
+        for trainingjob_id, steps_state in trainingjob_db.get_steps_states(trainingjob_ids).items():
+            self.publish(trainingjob_id, steps_state.version, steps_state.states)
+
+    def _last_event_id(self):
+        return self.events[-1][0] if self.events else self.events_after
+
+    def _read_events(self):
+        """
+        Appends the events committed since the last read to the buffer and wakes the feed watchers.
+        """
+        with self.lock:
+            after = self._last_event_id()
+        if after is None:
+            after = trainingjob_db.get_last_trainingjob_event_id()
+            with self.lock:
+                if self.events_after is None and FEED in self.watchers:
+                    self.events_after = after
+                    self.conditions[FEED].notify_all()
+            return
+        while True:
+            events = trainingjob_db.get_trainingjob_events(after, self.events.maxlen)
+            self.publish_events([(event.id, event.trainingjob_id, dumps(EVENT_SCHEMA.dump(event)))
+                                 for event in events])
+            if len(events) < self.events.maxlen:
+                return
+            after = events[-1].id
+
+    def publish_events(self, events):
+        """
+        Appends the events (id, trainingjob id, JSON) newer than the buffered ones to the buffer.
+        """
+        with self.lock:
+            if FEED not in self.watchers or self.events_after is None:
+                return
+            for event in events:
+                if event[0] <= self._last_event_id():
+                    continue
+                if len(self.events) == self.events.maxlen:
+                    self.events_after = self.events[0][0]
+                self.events.append(event)
+            self.conditions[FEED].notify_all()
+
+    def start_feed(self):
+        with self.lock:
+            if self.events_after is not None:
+                return
+        with self.app.app_context():
+            self._read_events()
+
+    def buffered_events(self, after, trainingjob_id=None):
+        """
+        Returns the buffered events (id, JSON) after the event with id after, only those of the
+        trainingjob if it is given, and the cursor to wait for the following ones with. Returns None
+        if the buffer does not hold all of these events.
+        """
+        with self.lock:
+            if self.events_after is None or after < self.events_after:
+                return None
+            events = []
+            for event_id, event_trainingjob_id, data in reversed(self.events):
+                if event_id <= after:
+                    break
+                if trainingjob_id is None or event_trainingjob_id == trainingjob_id:
+                    events.append((event_id, data))
+            events.reverse()
+            return events, self._last_event_id()
+
+    def read_events(self, after, trainingjob_id=None):
+        """
+        Same as buffered_events, from the database, for the watchers behind the buffer.
+        """
+        with self.lock:
+            known = self._last_event_id() or 0
+        limit = self.events.maxlen
+        with self.app.app_context():
+            events = [(event.id, dumps(EVENT_SCHEMA.dump(event)))
+                      for event in trainingjob_db.get_trainingjob_events(after, limit, trainingjob_id)]
+        if len(events) == limit:
+            return events, events[-1][0]
+        # Event ids become visible in increasing order, none up to known can still show up
+        return events, max([after, known] + [event_id for event_id, _ in events[-1:]])
+
+    def wait_events(self, after, timeout):
+        """
+        Returns whether an event after the event with id after was committed within timeout seconds.
+        """
+        def newer():
+            last = self._last_event_id()
+            return last is not None and last > after
+        with self.lock:
+            return self.conditions[FEED].wait_for(newer, timeout)
+
+    def _poll(self, APP):
+        while True:
+            time.sleep(self.poll_interval)
+            with self.lock:
+                trainingjob_ids = [trainingjob_id for trainingjob_id in self.watchers if trainingjob_id is not FEED]
+                feed_watched = FEED in self.watchers
+            try:
+                with APP.app_context():
+                    if trainingjob_ids:
+                        self._publish_steps_states(trainingjob_ids)
+                    if feed_watched:
+                        self._read_events()
+            except Exception as err:
+                LOGGER.error(f"Error reading the status of the watched trainingjobs: {str(err)}")
+
+    def stats(self):
+        """
+        Returns the number of open status streams, of trainingjobs they watch and the counters
+        of published statuses and of streams rejected as max_watchers were open.
+        """
+        with self.lock:
+            return {"watchers": sum(self.watchers.values()),
+                    "trainingjobs": len([key for key in self.watchers if key is not FEED]),
+                    "feed_watchers": self.watchers.get(FEED, 0), "buffered_events": len(self.events),
+                    "max_watchers": self.max_watchers, **self.counters}
+
+
+STATUS_BROADCASTER = StatusBroadcaster(TRAININGMGR_CONFIG_OBJ.status_stream_max_watchers,
+                                       TRAININGMGR_CONFIG_OBJ.status_stream_poll_interval,
+                                       TRAININGMGR_CONFIG_OBJ.status_stream_event_buffer)
+
+
+def status_event(version, states):
+    return f"id: {version}\nevent: status\ndata: {states}\n\n"
+
+
+def stream_status(trainingjob_id, version, states, last_event_id=None):
+    """
+    Yields the Server-Sent Events of the step states of a subscribed trainingjob, starting from
+    its current version and states, until the trainingjob finishes or fails or the stream times
+    out. The current states are not sent again to a client which already got them (last_event_id).
+    """
+    if last_event_id != str(version):
+        yield status_event(version, states)
+    deadline = time.monotonic() + TRAININGMGR_CONFIG_OBJ.status_stream_timeout
+    while get_one_word_status(json.loads(states)) not in FINAL_STATES:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        update = STATUS_BROADCASTER.wait(trainingjob_id, version,
+                                         min(remaining, TRAININGMGR_CONFIG_OBJ.status_stream_keepalive))
+        if update is None:
+            # Lets the server notice a client which went away
+            yield ": keepalive\n\n"
+            continue
+        version, states = update
+        yield status_event(version, states)
+
+
+def stream_events(after, trainingjob_id=None):
+    """
+    Yields the Server-Sent Events of the trainingjob events after the event with id after, only
+    those of the trainingjob if it is given, until the stream times out. The event feed must be
+    subscribed to (FEED).
+    """
+    STATUS_BROADCASTER.start_feed()
+    deadline = time.monotonic() + TRAININGMGR_CONFIG_OBJ.status_stream_timeout
+    while True:
+        events, after = STATUS_BROADCASTER.buffered_events(after, trainingjob_id) \
+            or STATUS_BROADCASTER.read_events(after, trainingjob_id)
+        for event_id, data in events:
+            yield f"id: {event_id}\nevent: transition\ndata: {data}\n\n"
+        if events:
+            continue
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if not STATUS_BROADCASTER.wait_events(after, min(remaining, TRAININGMGR_CONFIG_OBJ.status_stream_keepalive)):
+            yield ": keepalive\n\n"
+
+
+def subscribe_status(trainingjob_id):
+    return STATUS_BROADCASTER.subscribe(trainingjob_id)
+
+
+def unsubscribe_status(trainingjob_id):
+    STATUS_BROADCASTER.unsubscribe(trainingjob_id)
+
+
+def get_status_stream_stats():
+    return STATUS_BROADCASTER.stats()
+
+
+def start_status_stream_handler(APP):
+    STATUS_BROADCASTER.start(APP)
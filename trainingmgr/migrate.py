@@ -0,0 +1,56 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+"""
+One-shot setup of the training manager database, run before the training manager is rolled out:
+
+    python -m trainingmgr.migrate
+
+It creates the database if it does not exist and migrates its schema to the latest revision, so
+that the training manager processes only read the schema revision when they start.
+"""
+
+import sys
+from flask import Flask
+from flask_migrate import Migrate
+from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
+from trainingmgr.db.schema_db import MIGRATIONS_DIR, database_uri, create_database, ensure_schema, \
+    get_schema_revision
+from trainingmgr.models import db
+
+
+def main():
+    config_hdl = TrainingMgrConfig()
+    if config_hdl.is_config_loaded_properly() is False:
+        print("Not all configuration loaded.")
+        return 1
+    create_database(config_hdl)
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_uri(config_hdl)
+    db.init_app(app)
+    Migrate(app, db, directory=MIGRATIONS_DIR)
+    with app.app_context():
+        migrated = ensure_schema(config_hdl, migrate=True)
+        revision = get_schema_revision()
+        db.engine.dispose()
+    print(f"Database schema {'migrated to' if migrated else 'already at'} revision {revision}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
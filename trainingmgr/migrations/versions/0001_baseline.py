@@ -0,0 +1,80 @@
+"""baseline schema created by db.create_all before migrations were introduced
+
+Revision ID: 0001
+Revises: 
+Create Date: 2025-06-02 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('featuregroup_info_table',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('featuregroup_name', sa.String(length=128), nullable=False),
+    sa.Column('feature_list', sa.String(length=1000), nullable=False),
+    sa.Column('datalake_source', sa.String(length=20000), nullable=False),
+    sa.Column('host', sa.String(length=128), nullable=False),
+    sa.Column('port', sa.String(length=128), nullable=False),
+    sa.Column('bucket', sa.String(length=1000), nullable=False),
+    sa.Column('token', sa.String(length=1000), nullable=False),
+    sa.Column('db_org', sa.String(length=128), nullable=False),
+    sa.Column('measurement', sa.String(length=1000), nullable=False),
+    sa.Column('enable_dme', sa.Boolean(), nullable=False),
+    sa.Column('measured_obj_class', sa.String(length=20000), nullable=True),
+    sa.Column('dme_port', sa.String(length=128), nullable=True),
+    sa.Column('source_name', sa.String(length=20000), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('featuregroup_name', name='unique featuregroup')
+    )
+    op.create_table('model',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('modelname', sa.String(length=128), nullable=False),
+    sa.Column('modelversion', sa.String(length=128), nullable=False),
+    sa.Column('artifactversion', sa.String(length=128), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('modelname', 'modelversion', name='unique model')
+    )
+    op.create_table('training_job_status_table',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('states', sa.String(), nullable=False),
+    sa.Column('creation_time', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    sa.Column('updation_time', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('trainingjob_info_table',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('run_id', sa.String(length=1000), nullable=True),
+    sa.Column('steps_state_id', sa.Integer(), nullable=True),
+    sa.Column('creation_time', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    sa.Column('updation_time', sa.DateTime(), nullable=True),
+    sa.Column('deletion_in_progress', sa.Boolean(), nullable=True),
+    sa.Column('model_location', sa.String(length=1000), nullable=True),
+    sa.Column('training_dataset', sa.String(length=1000), nullable=True),
+    sa.Column('validation_dataset', sa.String(length=1000), nullable=True),
+    sa.Column('training_config', sa.String(length=5000), nullable=False),
+    sa.Column('notification_url', sa.String(length=1000), nullable=True),
+    sa.Column('consumer_rapp_id', sa.String(length=1000), nullable=True),
+    sa.Column('producer_rapp_id', sa.String(length=1000), nullable=True),
+    sa.Column('model_url', sa.String(length=1000), nullable=True),
+    sa.Column('model_id', sa.Integer(), nullable=False),
+    sa.Column('model_metrics', sa.String(length=5000), nullable=True),
+    sa.ForeignKeyConstraint(['model_id'], ['model.id'], ),
+    sa.ForeignKeyConstraint(['steps_state_id'], ['training_job_status_table.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('trainingjob_info_table')
+    op.drop_table('training_job_status_table')
+    op.drop_table('model')
+    op.drop_table('featuregroup_info_table')
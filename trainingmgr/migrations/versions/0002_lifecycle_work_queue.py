@@ -0,0 +1,41 @@
+"""add the lifecycle work queue
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-06-05 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases set up by db.create_all after the queue was added already have it
+    if sa.inspect(op.get_bind()).has_table('lifecycle_work_queue'):
+        return
+    op.create_table('lifecycle_work_queue',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('trainingjob_id', sa.Integer(), nullable=False),
+    sa.Column('action', sa.String(length=64), nullable=False),
+    sa.Column('next_run_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('locked_by', sa.String(length=256), nullable=True),
+    sa.Column('locked_until', sa.DateTime(), nullable=True),
+    sa.Column('creation_time', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    sa.ForeignKeyConstraint(['trainingjob_id'], ['trainingjob_info_table.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('trainingjob_id', 'action', name='unique trainingjob action')
+    )
+    op.create_index('ix_lifecycle_work_queue_next_run_at', 'lifecycle_work_queue', ['next_run_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_lifecycle_work_queue_next_run_at', table_name='lifecycle_work_queue')
+    op.drop_table('lifecycle_work_queue')
@@ -0,0 +1,53 @@
+"""store the state of each trainingjob step in its own indexed column
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-06-09 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+STEPS = ['DATA_EXTRACTION', 'DATA_EXTRACTION_AND_TRAINING', 'TRAINING', 'TRAINING_AND_TRAINED_MODEL', 'TRAINED_MODEL']
+
+
+def upgrade():
+    for step in STEPS:
+        op.add_column('training_job_status_table',
+                      sa.Column(step.lower(), sa.String(length=32), server_default='NOT_STARTED', nullable=True))
+
+    # Copy the states out of the JSON string, steps missing from it have not been started
+    if op.get_bind().dialect.name == 'postgresql':
+        extract = "CAST(states AS json) ->> '{step}'"
+    else:
+        extract = "json_extract(states, '$.{step}')"
+    op.execute(
+        "UPDATE training_job_status_table SET " +
+        ", ".join(f"{step.lower()} = COALESCE({extract.format(step=step)}, 'NOT_STARTED')" for step in STEPS))
+
+    with op.batch_alter_table('training_job_status_table') as batch_op:
+        for step in STEPS:
+            batch_op.alter_column(step.lower(), existing_type=sa.String(length=32), nullable=False)
+            batch_op.create_index(f'ix_training_job_status_table_{step.lower()}', [step.lower()], unique=False)
+        batch_op.create_index('ix_training_job_status_table_updation_time', ['updation_time'], unique=False)
+        batch_op.drop_column('states')
+
+
+def downgrade():
+    op.add_column('training_job_status_table', sa.Column('states', sa.String(), nullable=True))
+    op.execute(
+        "UPDATE training_job_status_table SET states = json_build_object(" +
+        ", ".join(f"'{step}', {step.lower()}" for step in STEPS) + ")::text")
+    op.alter_column('training_job_status_table', 'states', nullable=False)
+
+    op.drop_index('ix_training_job_status_table_updation_time', table_name='training_job_status_table')
+    for step in STEPS:
+        op.drop_index(f'ix_training_job_status_table_{step.lower()}', table_name='training_job_status_table')
+        op.drop_column('training_job_status_table', step.lower())
@@ -0,0 +1,26 @@
+"""add a version to the trainingjob step states for optimistic concurrency
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-06-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('training_job_status_table',
+                  sa.Column('version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('training_job_status_table') as batch_op:
+        batch_op.drop_column('version')
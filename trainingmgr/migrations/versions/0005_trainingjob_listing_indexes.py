@@ -0,0 +1,31 @@
+"""index the trainingjob columns filtered and sorted on when listing trainingjobs
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-06-23 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+COLUMNS = ['steps_state_id', 'consumer_rapp_id', 'producer_rapp_id', 'model_id']
+
+
+def upgrade():
+    for column in COLUMNS:
+        op.create_index(f'ix_trainingjob_info_table_{column}', 'trainingjob_info_table', [column], unique=False)
+    op.create_index('ix_trainingjob_info_table_creation_time_id', 'trainingjob_info_table',
+                    ['creation_time', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_trainingjob_info_table_creation_time_id', table_name='trainingjob_info_table')
+    for column in COLUMNS:
+        op.drop_index(f'ix_trainingjob_info_table_{column}', table_name='trainingjob_info_table')
@@ -0,0 +1,26 @@
+"""add an update time to the featuregroups for the ETag of the featuregroup listing
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-06-30 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('featuregroup_info_table',
+                  sa.Column('updation_time', sa.DateTime(timezone=False), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('featuregroup_info_table') as batch_op:
+        batch_op.drop_column('updation_time')
@@ -0,0 +1,35 @@
+"""add the append-only log of the trainingjob step transitions
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-07-07 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('trainingjob_event_table',
+    sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), autoincrement=True, nullable=False),
+    sa.Column('trainingjob_id', sa.Integer(), nullable=False),
+    sa.Column('step', sa.String(length=64), nullable=False),
+    sa.Column('state', sa.String(length=32), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('event_time', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_trainingjob_event_table_trainingjob_id_id', 'trainingjob_event_table',
+                    ['trainingjob_id', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_trainingjob_event_table_trainingjob_id_id', table_name='trainingjob_event_table')
+    op.drop_table('trainingjob_event_table')
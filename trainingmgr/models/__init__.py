@@ -22,5 +22,7 @@ db = SQLAlchemy()
 from trainingmgr.models.trainingjob import TrainingJob, ModelID
 from trainingmgr.models.featuregroup import FeatureGroup
 from trainingmgr.models.steps_state import TrainingJobStatus
+from trainingmgr.models.lifecycle_work import LifecycleWork
+from trainingmgr.models.trainingjob_event import TrainingJobEvent
 
-__all__ = ['TrainingJob', 'FeatureGroup', 'TrainingJobStatus', 'ModelID']
\ No newline at end of file
+__all__ = ['TrainingJob', 'FeatureGroup', 'TrainingJobStatus', 'ModelID', 'LifecycleWork', 'TrainingJobEvent']
\ No newline at end of file
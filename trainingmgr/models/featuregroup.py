@@ -17,6 +17,7 @@
 # ==================================================================================
 from . import db
 from sqlalchemy import UniqueConstraint
+from sqlalchemy.sql import func
 
 class FeatureGroup(db.Model):
     __tablename__ = "featuregroup_info_table"
@@ -34,6 +35,7 @@ class FeatureGroup(db.Model):
     measured_obj_class = db.Column(db.String(20000), nullable=True)
     dme_port = db.Column(db.String(128), nullable=True)
     source_name = db.Column(db.String(20000), nullable=True)
+    updation_time = db.Column(db.DateTime(timezone=False), onupdate=func.now(), nullable=True)
 
     __table_args__ = (
         UniqueConstraint("featuregroup_name", name="unique featuregroup"),
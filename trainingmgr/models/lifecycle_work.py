@@ -0,0 +1,46 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+from sqlalchemy import Integer, String, Column, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from . import db
+
+class LifecycleWork(db.Model):
+    """
+    A lifecycle action which is waiting to be done for a trainingjob.
+
+    Rows are claimed with SELECT ... FOR UPDATE SKIP LOCKED and leased to one worker until
+    locked_until, a row whose lease has expired (e.g. its worker crashed) can be claimed again.
+    """
+    __tablename__ = 'lifecycle_work_queue'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    trainingjob_id = Column(Integer, ForeignKey('trainingjob_info_table.id', ondelete='CASCADE'), nullable=False)
+    action = Column(String(64), nullable=False)
+    next_run_at = Column(DateTime(timezone=False), server_default=func.now(), nullable=False, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    locked_by = Column(String(256), nullable=True)
+    locked_until = Column(DateTime(timezone=False), nullable=True)
+    creation_time = Column(DateTime(timezone=False), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("trainingjob_id", "action", name="unique trainingjob action"),
+    )
+
+    def __repr__(self):
+        return f'<LifecycleWork {self.action} of trainingjob {self.trainingjob_id}>'
@@ -16,18 +16,57 @@
 #
 # ==================================================================================
 
+import json
 from sqlalchemy import Integer, String, Column, DateTime
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
+from trainingmgr.constants.steps import Steps
+from trainingmgr.constants.states import States
 from . import db
 
+# Column of training_job_status_table holding the state of each step, in the order of the steps
+STEP_COLUMNS = {step.name: step.name.lower() for step in Steps}
+
+def _state_column():
+    return Column(String(32), nullable=False, default=States.NOT_STARTED.name,
+                  server_default=States.NOT_STARTED.name, index=True)
+
 class TrainingJobStatus(db.Model):
     __tablename__ = 'training_job_status_table'
    
     id = Column(Integer, primary_key=True)
-    states = Column(String, nullable=False)
+    data_extraction = _state_column()
+    data_extraction_and_training = _state_column()
+    training = _state_column()
+    training_and_trained_model = _state_column()
+    trained_model = _state_column()
+    # Bumped by every step transition, lets a transition detect that another one got in first
+    version = Column(Integer, nullable=False, default=0, server_default='0')
     creation_time = Column(DateTime(timezone=False), server_default=func.now(),nullable=False)
-    updation_time = Column(DateTime(timezone=False),onupdate=func.now() ,nullable=True)
+    updation_time = Column(DateTime(timezone=False),onupdate=func.now() ,nullable=True, index=True)
 
     # Establish a relationship to TrainingJob
-    trainingjobs = relationship("TrainingJob", back_populates="steps_state")
\ No newline at end of file
+    trainingjobs = relationship("TrainingJob", back_populates="steps_state")
+
+    @staticmethod
+    def column(step):
+        """
+        Returns the column holding the state of step (a Steps name).
+        """
+        return getattr(TrainingJobStatus, STEP_COLUMNS[step])
+
+    def get_state(self, step):
+        return getattr(self, STEP_COLUMNS[step])
+
+    def set_state(self, step, state):
+        setattr(self, STEP_COLUMNS[step], state)
+
+    # The step states used to be stored as one JSON string, it is still accepted and returned in that form
+    @property
+    def states(self):
+        return json.dumps({step: getattr(self, column) for step, column in STEP_COLUMNS.items()})
+
+    @states.setter
+    def states(self, value):
+        for step, state in json.loads(value).items():
+            self.set_state(step, state)
@@ -22,7 +22,7 @@ from sqlalchemy import Integer, ForeignKey, String, DateTime, Column, Boolean
 from sqlalchemy.orm import relationship
 
 from . import db
-from sqlalchemy import ForeignKeyConstraint, UniqueConstraint
+from sqlalchemy import ForeignKeyConstraint, UniqueConstraint, Index
 
 
 class ModelID(db.Model):
@@ -43,7 +43,7 @@ class TrainingJob(db.Model):
     __tablename__ = "trainingjob_info_table"
     id = Column(Integer, primary_key=True, autoincrement=True, nullable=False)
     run_id = Column(String(1000), nullable=True)
-    steps_state_id = Column(Integer, ForeignKey('training_job_status_table.id'), nullable=True)
+    steps_state_id = Column(Integer, ForeignKey('training_job_status_table.id'), nullable=True, index=True)
     creation_time = Column(DateTime(timezone=False), server_default=func.now(),nullable=False)
     updation_time = Column(DateTime(timezone=False),onupdate=func.now() ,nullable=True)
     deletion_in_progress = Column(Boolean, nullable=True)
@@ -53,11 +53,11 @@ class TrainingJob(db.Model):
     validation_dataset = db.Column(db.String(1000), nullable=True)
     training_config = db.Column(db.String(5000), nullable=False)
     notification_url = db.Column(db.String(1000), nullable=True)
-    consumer_rapp_id = db.Column(db.String(1000), nullable=True)
-    producer_rapp_id = db.Column(db.String(1000), nullable=True)
+    consumer_rapp_id = db.Column(db.String(1000), nullable=True, index=True)
+    producer_rapp_id = db.Column(db.String(1000), nullable=True, index=True)
     
     model_url = Column(String(1000), nullable=True)
-    model_id = Column(Integer, nullable=False)
+    model_id = Column(Integer, nullable=False, index=True)
     model_metrics = db.Column(db.String(5000), nullable=True, default=json.dumps({}))
 
     #defineing relationships
@@ -68,6 +68,8 @@ class TrainingJob(db.Model):
             ["model_id"],
             ["model.id"]
         ),
+        # Keyset pagination of the trainingjobs by creation time
+        Index("ix_trainingjob_info_table_creation_time_id", "creation_time", "id"),
     )
     
 
@@ -0,0 +1,45 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+from sqlalchemy import BigInteger, Integer, String, Column, DateTime, Index
+from sqlalchemy.sql import func
+from . import db
+
+class TrainingJobEvent(db.Model):
+    """
+    A step transition of a trainingjob, written in the transaction of the transition.
+
+    Rows are only ever appended, their ids are assigned in commit order and serve as the cursor
+    of the event feed. They are kept when their trainingjob is deleted.
+    """
+    __tablename__ = 'trainingjob_event_table'
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    trainingjob_id = Column(Integer, nullable=False)
+    step = Column(String(64), nullable=False)
+    state = Column(String(32), nullable=False)
+    # Version of the step states of the trainingjob after the transition
+    version = Column(Integer, nullable=False)
+    event_time = Column(DateTime(timezone=False), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Event feed of one trainingjob
+        Index("ix_trainingjob_event_table_trainingjob_id_id", "trainingjob_id", "id"),
+    )
+
+    def __repr__(self):
+        return f'<TrainingJobEvent {self.id} {self.step} {self.state} of trainingjob {self.trainingjob_id}>'
@@ -18,8 +18,8 @@
 
 from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
 import requests
-from trainingmgr.common.exceptions_utls import TMException
-import requests
+from trainingmgr.common.exceptions_utls import TMException, DownstreamUnavailableException
+from trainingmgr.common.http_client import get_http_client, MME
 
 LOGGER = TrainingMgrConfig().logger
 
@@ -43,6 +43,7 @@ class MmeMgr:
 
         self.mme_ip = TrainingMgrConfig().model_management_service_ip
         self.mme_port = TrainingMgrConfig().model_management_service_port
+        self.client = get_http_client(MME)
         
         self.__initialized = True
     
@@ -54,7 +55,7 @@ class MmeMgr:
         try:
             url = f'http://{self.mme_ip}:{self.mme_port}/ai-ml-model-discovery/v1/models/?model-name={modelName}&model-version={int(modelVersion)}'
             LOGGER.debug(f"Requesting modelInfo from: {url}")
-            response = requests.get(url)
+            response = self.client.get(url)
             if response.status_code == 200:
                 return response.json()
             elif response.status_code == 404:
@@ -66,6 +67,8 @@ class MmeMgr:
                 LOGGER.error(err_msg)
                 raise TMException(err_msg)
 
+        except DownstreamUnavailableException:
+            raise
         except requests.RequestException as err:
             err_msg = f"Error communicating with MME : {str(err)}"
             LOGGER.error(err_msg)
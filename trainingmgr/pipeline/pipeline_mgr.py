@@ -18,10 +18,12 @@
 
 from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
 import requests
-from trainingmgr.common.exceptions_utls import TMException
+from trainingmgr.common.exceptions_utls import TMException, DownstreamUnavailableException
+from trainingmgr.common.http_client import get_http_client, KF_ADAPTER
 from flask_api import status
-import requests
 import json
+import threading
+import time
 
 LOGGER = TrainingMgrConfig().logger
 
@@ -45,18 +47,93 @@ class PipelineMgr:
 
         self.kf_adapter_ip = TrainingMgrConfig().kf_adapter_ip
         self.kf_adapter_port = TrainingMgrConfig().kf_adapter_port
+        self.client = get_http_client(KF_ADAPTER)
+        # Catalog of the pipelines, their versions and the experiments of KF: key -> (value, time fetched)
+        self.catalog = {}
+        self.catalog_lock = threading.Lock()
+        self.catalog_refresh_interval = TrainingMgrConfig().pipeline_catalog_refresh_interval
+        self.refreshing = set()
+        self.pipeline_index = (None, {})
         
         self.__initialized = True
-    
-        
+
+    def _cached(self, key, fetch):
+        """
+        Returns the catalog entry key, fetching it if it is missing. An entry older than the
+        refresh interval is still returned while it is fetched again in the background.
+        """
+        with self.catalog_lock:
+            entry = self.catalog.get(key)
+            if entry is not None:
+                value, fetched_at = entry
+                if time.monotonic() - fetched_at > self.catalog_refresh_interval and key not in self.refreshing:
+                    self.refreshing.add(key)
+                    threading.Thread(target=self._refresh, args=(key, fetch), daemon=True).start()
+                return value
+        value = fetch()
+        self._store(key, value)
+        return value
+
+    def _refresh(self, key, fetch):
+        try:
+            self._store(key, fetch())
+        except Exception as err:
+            LOGGER.error(f"Failed to refresh the pipeline catalog entry {key}: {str(err)}")
+        finally:
+            with self.catalog_lock:
+                self.refreshing.discard(key)
+
+    def _store(self, key, value):
+        # Error responses of KF adapter are not cached
+        if isinstance(value, dict):
+            with self.catalog_lock:
+                self.catalog[key] = (value, time.monotonic())
+
+    def invalidate_catalog(self, pipeline_name=None):
+        """
+            Drops the pipelines list and the versions of pipeline_name from the catalog,
+            or the whole catalog if no pipeline_name is given
+        """
+        with self.catalog_lock:
+            if pipeline_name is None:
+                self.catalog.clear()
+            else:
+                self.catalog.pop("pipelines", None)
+                self.catalog.pop(f"versions/{pipeline_name}", None)
+
     def get_all_pipelines(self):
         """
             This function returns the information for all pipelines
         """
+        return self._cached("pipelines", self._fetch_all_pipelines)
+
+    def get_pipeline_by_name(self, pipeline_name):
+        """
+            This function returns the information of the pipeline whose display name is pipeline_name,
+            None if there is no such pipeline
+        """
+        pipelines = self.get_all_pipelines()
+        source, index = self.pipeline_index
+        if source is not pipelines:
+            index = {pipeline_info['display_name']: pipeline_info for pipeline_info in pipelines.get('pipelines', [])}
+            self.pipeline_index = (pipelines, index)
+        return index.get(pipeline_name)
+
+    def get_all_pipeline_versions(self, pipeline_name):
+        """
+            This function returns the version-list for input pipeline
+        """
+        return self._cached(f"versions/{pipeline_name}", lambda: self._fetch_all_pipeline_versions(pipeline_name))
+
+    def get_experiments(self):
+        return self._cached("experiments", self._fetch_experiments)
+    
+        
+    def _fetch_all_pipelines(self):
         try:
             url = f'http://{self.kf_adapter_ip}:{self.kf_adapter_port}/pipelines'
             LOGGER.debug(f"Requesting pipelines from: {url}")
-            response = requests.get(url)
+            response = self.client.get(url)
             if response.status_code == 200:
                 if response.headers['content-type'] != MIMETYPE_JSON:
                     err_msg = ERROR_TYPE_KF_ADAPTER_JSON
@@ -69,6 +146,8 @@ class PipelineMgr:
                 LOGGER.error(err_msg)
                 return TMException(err_msg)
 
+        except DownstreamUnavailableException:
+            raise
         except requests.RequestException as err:
             err_msg = f"Error communicating with KFAdapter : {str(err)}"
             LOGGER.error(err_msg)
@@ -78,14 +157,11 @@ class PipelineMgr:
             LOGGER.error(err_msg)
             raise TMException(err_msg)
         
-    def get_all_pipeline_versions(self, pipeline_name):
-        """
-            This function returns the version-list for input pipeline
-        """
+    def _fetch_all_pipeline_versions(self, pipeline_name):
         try:
             url = f'http://{self.kf_adapter_ip}:{self.kf_adapter_port}/pipelines/{pipeline_name}/versions'
             LOGGER.debug(f"Requesting pipelines Versions from: {url}")
-            response = requests.get(url)
+            response = self.client.get(url)
             if response.status_code == 200:
                 if response.headers['content-type'] != MIMETYPE_JSON:
                     err_msg = ERROR_TYPE_KF_ADAPTER_JSON
@@ -98,6 +174,8 @@ class PipelineMgr:
                 LOGGER.error(err_msg)
                 return TMException(err_msg)
 
+        except DownstreamUnavailableException:
+            raise
         except requests.RequestException as err:
             err_msg = f"Error communicating with KFAdapter : {str(err)}"
             LOGGER.error(err_msg)
@@ -116,14 +194,17 @@ class PipelineMgr:
             with open(filepath, 'rb') as file:
                 files = {'file': file.read()}
                 
-            resp = requests.post(url, files=files, data={"description": description})
+            resp = self.client.post(url, files=files, data={"description": description})
             LOGGER.debug(resp.text)
             if resp.status_code == status.HTTP_200_OK:
                 LOGGER.debug("Pipeline uploaded :%s", pipeline_name)
+                self.invalidate_catalog(pipeline_name)
                 return True
             else:
                 LOGGER.error(resp.json()["message"])
                 raise TMException("Error while uploading pipeline | " + resp.json()["message"])
+        except DownstreamUnavailableException:
+            raise
         except Exception as err:
             err_msg = f"Unexpected error in upload_pipeline_file: {str(err)}"
             LOGGER.error(err_msg)
@@ -140,12 +221,14 @@ class PipelineMgr:
             LOGGER.debug('Will send to kf_adapter: '+json.dumps(training_details))
             url = f'http://{self.kf_adapter_ip}:{self.kf_adapter_port}/trainingjobs/{trainingjob_name}/execution'#NOSONAR
             LOGGER.debug(url)
-            response = requests.post(url,
+            response = self.client.post(url,
                                     data=json.dumps(training_details),
                                     headers={'content-type': MIMETYPE_JSON,
                                             'Accept-Charset': 'UTF-8'})
 
             return response
+        except DownstreamUnavailableException:
+            raise
         except Exception as err:
             err_msg = f"Unexpected error in start_training: {str(err)}"
             LOGGER.error(err_msg)
@@ -156,22 +239,26 @@ class PipelineMgr:
             LOGGER.debug('terminate training for run_id : ' + str(run_id))
             url = f'http://{self.kf_adapter_ip}:{self.kf_adapter_port}/runs/{run_id}'
             LOGGER.debug("Terminate Training API : " + url)
-            response = requests.delete(url)
+            response = self.client.delete(url)
             print("Deletion-Response : ", response)
             return response
+        except DownstreamUnavailableException:
+            raise
         except Exception as err:
             err_msg = f"Unexpected error in terminate_training: {str(err)}"
             LOGGER.error(err_msg)
             raise TMException(err_msg)
         
-    def get_experiments(self):
+    def _fetch_experiments(self):
         try:
             url = f'http://{self.kf_adapter_ip}:{self.kf_adapter_port}/experiments'
             LOGGER.debug("Get Experiments API : " + url)
-            response = requests.get(url)
+            response = self.client.get(url)
             if response.headers['content-type'] != MIMETYPE_JSON:
                 raise TMException(ERROR_TYPE_KF_ADAPTER_JSON)
             return response.json()
+        except DownstreamUnavailableException:
+            raise
         except Exception as err:
             err_msg = f"Unexpected error in get_experiments: {str(err)}"
             LOGGER.error(err_msg)
@@ -4,5 +4,6 @@ ma = Marshmallow()
 
 from trainingmgr.schemas.trainingjob_schema import TrainingJobSchema
 from trainingmgr.schemas.featuregroup_schema import FeatureGroupSchema
+from trainingmgr.schemas.trainingjob_event_schema import TrainingJobEventSchema
 
-__all_ = ['TrainingJobSchema', 'FeatureGroupSchema']
\ No newline at end of file
+__all_ = ['TrainingJobSchema', 'FeatureGroupSchema', 'TrainingJobEventSchema']
\ No newline at end of file
@@ -0,0 +1,118 @@
+# ==================================================================================
+#
+#       Copyright (c) 2025 Samsung Electronics Co., Ltd. All Rights Reserved.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#          http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ==================================================================================
+
+"""
+Serializers compiled from the marshmallow schemas for the endpoints returning many rows. They give
+the same output as dumping with the schemas, without the per field and per hook overhead of marshmallow.
+"""
+
+import json
+from flask import current_app
+from marshmallow import fields
+from trainingmgr.schemas.trainingjob_schema import TrainingJobSchema
+from trainingmgr.schemas.featuregroup_schema import FeatureGroupSchema
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _replace_null_with_empty_string(data):
+    for key, value in data.items():
+        if value is None:
+            data[key] = ""
+    return data
+
+
+def _training_config_to_dict(data):
+    data["training_config"] = json.loads(data["training_config"])
+    return data
+
+
+# Compiled equivalent of each post_dump hook of the schemas, applied to one dumped row
+POST_DUMP_HOOKS = {
+    "replace_null_with_empty_string": _replace_null_with_empty_string,
+    "trainingConfigtoDict": _training_config_to_dict,
+}
+
+# Fields whose value is serialized by calling a builtin on it, the value is never None when called
+FIELD_CONVERTERS = {
+    fields.Integer: int,
+    fields.String: str,
+    fields.Boolean: bool,
+}
+
+
+class CompiledSerializer:
+    """
+    Dumps objects the way schema does. The fields and post_dump hooks of the schema are resolved
+    once, a schema with a field or hook that cannot be compiled is rejected when it is compiled.
+    """
+
+    def __init__(self, schema):
+        self.fields = []
+        for name, field in schema.dump_fields.items():
+            if isinstance(field, fields.Nested):
+                convert = CompiledSerializer(field.schema).dump
+            elif type(field) in FIELD_CONVERTERS:
+                convert = FIELD_CONVERTERS[type(field)]
+            else:
+                raise TypeError(f"{type(schema).__name__}.{name}: {type(field).__name__} fields are not compiled")
+            self.fields.append((field.data_key or name, field.attribute or name, convert))
+        # marshmallow runs the hooks of single rows before the ones of collections
+        hooks = sorted(schema._hooks.get("post_dump", []), key=lambda hook: hook[1])
+        unknown = [name for name, _, _ in hooks if name not in POST_DUMP_HOOKS]
+        if unknown:
+            raise TypeError(f"{type(schema).__name__}: post_dump hooks {unknown} are not compiled")
+        self.hooks = [POST_DUMP_HOOKS[name] for name, _, _ in hooks]
+
+    def dump(self, obj):
+        data = {}
+        for key, attribute, convert in self.fields:
+            value = getattr(obj, attribute)
+            data[key] = None if value is None else convert(value)
+        for hook in self.hooks:
+            data = hook(data)
+        return data
+
+    def dump_many(self, objs):
+        return [self.dump(obj) for obj in objs]
+
+
+TRAININGJOB_SERIALIZER = CompiledSerializer(TrainingJobSchema())
+FEATUREGROUP_SERIALIZER = CompiledSerializer(FeatureGroupSchema())
+
+
+def dumps(data):
+    """
+    Encodes data to the same JSON as jsonify: compact, sorted keys and ASCII only.
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        # orjson does not escape non ASCII characters as jsonify does
+        if encoded.isascii():
+            return encoded.decode()
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+def json_response(data, status=200):
+    """
+    Returns the JSON response of data, as jsonify does.
+    """
+    return current_app.response_class(dumps(data) + "\n", status=status, mimetype="application/json")
@@ -24,3 +24,4 @@ class FeatureGroupSchema(ma.SQLAlchemyAutoSchema):
         model = FeatureGroup
         include_relationships = True
         load_instance = True
+        exclude = ("updation_time",)
@@ -16,11 +16,13 @@
 #
 # ==================================================================================
 
-from trainingmgr.db.featuregroup_db import get_feature_group_by_name_db, get_feature_groups_db, get_feature_groups_from_inputDataType_db
+from trainingmgr.db.featuregroup_db import get_feature_group_by_name_db, get_feature_groups_db, get_feature_groups_from_inputDataType_db, \
+    iter_feature_groups_db, get_feature_groups_version_db
 from trainingmgr.common.exceptions_utls import TMException, DBException
 from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
 
-LOGGER = TrainingMgrConfig().logger
+TRAININGMGR_CONFIG_OBJ = TrainingMgrConfig()
+LOGGER = TRAININGMGR_CONFIG_OBJ.logger
 
 def get_featuregroup_by_name(featuregroup_name:str):
     LOGGER.debug(f'service for get featuregroup by name')
@@ -56,6 +58,18 @@ def get_all_featuregroups():
     except Exception as err:
         LOGGER.error("Error occured during fetching all featuregroups from db")
         raise TMException(f"get all featuregroups service failed with exception : {str(err)}")
+
+def get_featuregroups_version():
+    """
+    Returns the values that change whenever a featuregroup is added, edited or deleted
+    """
+    try:
+        return get_feature_groups_version_db()
+    except DBException as err:
+        raise TMException(f"get featuregroups version service failed with exception : {str(err)}")
+
+def iter_all_featuregroups():
+    return iter_feature_groups_db(TRAININGMGR_CONFIG_OBJ.stream_chunk_size)
             
         
     
\ No newline at end of file
@@ -16,13 +16,33 @@
 #
 # ==================================================================================
 
+import copy
 from trainingmgr.pipeline.mme_mgr import MmeMgr
 from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
+from trainingmgr.common.ttl_cache import TTLCache
 
-LOGGER = TrainingMgrConfig().logger
+TRAININGMGR_CONFIG_OBJ = TrainingMgrConfig()
+LOGGER = TRAININGMGR_CONFIG_OBJ.logger
 mmeMgrObj = MmeMgr()
+# Model information by (model name, model version), None for models which are not registered
+MODELINFO_CACHE = TTLCache(TRAININGMGR_CONFIG_OBJ.mme_cache_size, TRAININGMGR_CONFIG_OBJ.mme_cache_ttl,
+                           TRAININGMGR_CONFIG_OBJ.mme_cache_negative_ttl)
 
-def get_modelinfo_by_modelId_service(model_name, model_version):
+def get_modelinfo_by_modelId_service(model_name, model_version, use_cache=True):
+    """
+    Returns the model information registered at MME, use_cache=False fetches it again from MME
+    and caches the fresh information.
+    """
     LOGGER.debug(f'get_modelinfo_by_modelId_service from MME service where model_name = {model_name}, model_version = {model_version}')
-    return mmeMgrObj.get_modelInfo_by_modelId(model_name, model_version)
-    
\ No newline at end of file
+    key = (model_name, str(model_version))
+    if not use_cache:
+        MODELINFO_CACHE.invalidate(key)
+    modelinfo = MODELINFO_CACHE.get_or_load(key, lambda: mmeMgrObj.get_modelInfo_by_modelId(model_name, model_version))
+    # Callers get their own copy, the cached one is shared
+    return copy.deepcopy(modelinfo)
+
+def invalidate_modelinfo_service(model_name, model_version):
+    MODELINFO_CACHE.invalidate((model_name, str(model_version)))
+
+def get_modelinfo_cache_stats():
+    return MODELINFO_CACHE.stats()
@@ -30,16 +30,14 @@ def get_all_pipelines():
     return allPipelines
 
 def get_single_pipeline(pipeline_name):
-    allPipelines = pipelineMgrObj.get_all_pipelines()
-    for pipeline_info in allPipelines.get('pipelines', []):
-        if pipeline_info['display_name'] == pipeline_name:
-            
-            return PipelineInfo(
-                pipeline_id=pipeline_info['pipeline_id'],
-                display_name=pipeline_info['display_name'],
-                description=pipeline_info['description'],
-                created_at=pipeline_info['created_at']
-            ).to_dict()
+    pipeline_info = pipelineMgrObj.get_pipeline_by_name(pipeline_name)
+    if pipeline_info is not None:
+        return PipelineInfo(
+            pipeline_id=pipeline_info['pipeline_id'],
+            display_name=pipeline_info['display_name'],
+            description=pipeline_info['description'],
+            created_at=pipeline_info['created_at']
+        ).to_dict()
     
     LOGGER.warning(f"Pipeline '{pipeline_name}' not found")
     return None
@@ -15,24 +15,32 @@
 #   limitations under the License.
 #
 # ==================================================================================
+import base64
+import datetime
 import json
+from concurrent.futures import ThreadPoolExecutor
 from threading import Lock
 from flask_api import status
 from flask import jsonify
-from trainingmgr.common.trainingmgr_operations import data_extraction_start, notification_rapp
+from marshmallow import ValidationError
+from trainingmgr.common.trainingmgr_operations import data_extraction_start, notification_rapp, training_start
 from trainingmgr.db.model_db import get_model_by_modelId
-from trainingmgr.db.trainingjob_db import change_state_to_failed, delete_trainingjob_by_id, create_trainingjob, get_trainingjob,\
-change_steps_state, change_field_value, get_field_value, change_steps_state_df, changeartifact, get_trainingjobs_by_model_id_db
-from trainingmgr.common.exceptions_utls import DBException, TMException
-from trainingmgr.common.trainingConfig_parser import getField, setField
-from trainingmgr.handler.async_handler import DATAEXTRACTION_JOBS_CACHE
+from trainingmgr.db.trainingjob_db import change_state_to_failed, delete_trainingjob_by_id, create_trainingjob, create_trainingjobs, get_trainingjob,\
+change_steps_state, change_field_value, get_field_value, change_steps_state_df, changeartifact, get_trainingjobs_by_model_id_db, \
+transition_steps, get_trainingjobs_page, iter_trainingjobs, iter_trainingjobs_by_model_id_db, get_trainingjobs_version, \
+get_trainingjob_events, transition_steps_of_trainingjobs, mark_trainingjobs_for_deletion
+from trainingmgr.db.lifecycle_work_db import remove_work
+from trainingmgr.common.exceptions_utls import APIException, DBException, TMException, DownstreamUnavailableException
+from trainingmgr.common.trainingConfig_parser import getField, setField, validateTrainingConfig
+from trainingmgr.handler.async_handler import add_data_extraction_job, add_data_extraction_jobs, add_deletion_jobs
 from trainingmgr.schemas import TrainingJobSchema
+from trainingmgr.schemas.problemdetail_schema import ProblemDetails
 from trainingmgr.common.trainingmgr_util import check_key_in_dictionary, get_one_word_status, get_step_in_progress_state
-from trainingmgr.constants import Steps, States
 from trainingmgr.service.pipeline_service import terminate_training_service
 from trainingmgr.service.featuregroup_service import  get_featuregroup_by_name, get_featuregroup_from_inputDataType
+from trainingmgr.service.mme_service import get_modelinfo_by_modelId_service, invalidate_modelinfo_service
 from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
-from trainingmgr.constants import Steps, States
+from trainingmgr.constants import Steps, States, WorkActions
 from sqlalchemy.orm.exc import NoResultFound
 
 trainingJobSchema = TrainingJobSchema()
@@ -49,12 +57,164 @@ def get_training_job(training_job_id: int):
     except DBException as err:
         raise TMException(f"get_training_job by id failed with exception : {str(err)}")
 
-def get_trainining_jobs():
+# Query parameters filtering the listed trainingjobs and the filter of get_trainingjobs_page each one sets
+TRAININGJOB_FILTERS = {
+    "modelName": "model_name",
+    "modelVersion": "model_version",
+    "consumerRAppId": "consumer_rapp_id",
+    "producerRAppId": "producer_rapp_id",
+    "state": "state",
+    "step": "step",
+    "stepState": "step_state",
+    "createdAfter": "created_after",
+    "createdBefore": "created_before",
+    "updatedAfter": "updated_after",
+    "updatedBefore": "updated_before",
+}
+TIME_FILTERS = ("created_after", "created_before", "updated_after", "updated_before")
+# Values of the sort query parameter (prefixed with - for descending order) and the column each one sorts by
+TRAININGJOB_SORTS = {"id": "id", "creationTime": "creation_time"}
+
+def _parse_time(name, value):
+    try:
+        # Before Python 3.11 fromisoformat does not accept the Z suffix
+        time = datetime.datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        raise TMException(f"{name} must be an ISO 8601 date and time, got {value}")
+    # Times are stored in UTC without a time zone
+    if time.tzinfo is not None:
+        time = time.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return time
+
+def _encode_cursor(sort, key):
+    value, trainingjob_id = key
+    if isinstance(value, datetime.datetime):
+        value = value.isoformat()
+    return base64.urlsafe_b64encode(json.dumps([sort, value, trainingjob_id]).encode()).decode()
+
+def _decode_cursor(cursor, sort):
+    try:
+        cursor_sort, value, trainingjob_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if cursor_sort == sort and TRAININGJOB_SORTS[sort.lstrip("-")] == "creation_time":
+            value = datetime.datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        raise TMException("cursor is not valid")
+    if cursor_sort != sort:
+        raise TMException("cursor was returned for another sort order")
+    return value, trainingjob_id
+
+def _parse_int(name, value, minimum, maximum=None):
+    try:
+        number = int(value)
+    except ValueError:
+        raise TMException(f"{name} must be an integer")
+    if number < minimum or (maximum is not None and number > maximum):
+        raise TMException(f"{name} must be between {minimum} and {maximum}" if maximum is not None
+                          else f"{name} must be at least {minimum}")
+    return number
+
+def _parse_listing_args(query_args):
+    """
+    Returns the filters of get_trainingjobs_page and the sort of the trainingjob listing query_args,
+    raises TMException if one of them is not valid.
+    """
+    filters = {name: query_args[arg] for arg, name in TRAININGJOB_FILTERS.items() if arg in query_args}
+    for name in ("state", "step_state"):
+        if name in filters and filters[name] not in States.__members__:
+            raise TMException(f"{name} must be one of {', '.join(States.__members__)}")
+    if "step" in filters and filters["step"] not in Steps.__members__:
+        raise TMException(f"step must be one of {', '.join(Steps.__members__)}")
+    if ("step" in filters) != ("step_state" in filters):
+        raise TMException("step and stepState must be given together")
+    for name in TIME_FILTERS:
+        if name in filters:
+            filters[name] = _parse_time(name, filters[name])
+
+    sort = query_args.get("sort", "id")
+    if sort.lstrip("-") not in TRAININGJOB_SORTS:
+        raise TMException(f"sort must be one of {', '.join(TRAININGJOB_SORTS)}, optionally prefixed with -")
+    return filters, sort
+
+def get_trainining_jobs(query_args):
+    """
+    This function returns one page of the trainingjobs matching the filters in query_args and the
+    cursor of the next page, None if it is the last page. Without limit and cursor, every matching
+    trainingjob is returned in one page.
+
+    Args:
+        query_args (dict): query parameters of the listing, the keys of TRAININGJOB_FILTERS and
+                           sort, limit and cursor
+
+    Raises:
+        TMException: If a query parameter is not valid or the trainingjobs could not be fetched.
+    """
+    filters, sort = _parse_listing_args(query_args)
+    # Paginating only the callers that asked for it, the others still get every trainingjob
+    limit = None
+    if "limit" in query_args or "cursor" in query_args:
+        limit = _parse_int("limit", query_args.get("limit", TRAININGMGR_CONFIG_OBJ.trainingjob_page_size), 1,
+                           TRAININGMGR_CONFIG_OBJ.trainingjob_max_page_size)
+    after = _decode_cursor(query_args["cursor"], sort) if "cursor" in query_args else None
+
     try:
-        tjs = get_trainingjob()
-        return tjs
+        trainingjobs, last = get_trainingjobs_page(filters, TRAININGJOB_SORTS[sort.lstrip("-")],
+                                                   sort.startswith("-"), limit, after)
     except DBException as err:
         raise TMException(f"get_training_jobs failed with exception : {str(err)}")
+    return trainingjobs, _encode_cursor(sort, last) if last is not None else None
+
+def get_trainingjobs_version_service(query_args):
+    """
+    This function returns the values that change whenever one of the trainingjobs matching the
+    filters in query_args is created, updated or deleted. Raises TMException if a query parameter
+    is not valid.
+    """
+    filters, _ = _parse_listing_args(query_args)
+    try:
+        return get_trainingjobs_version(filters)
+    except DBException as err:
+        raise TMException(f"get_trainingjobs_version failed with exception : {str(err)}")
+
+def parse_event_args(query_args):
+    """
+    Returns the cursor (id of the last event already received) and the trainingjob id, None for
+    all the trainingjobs, of the trainingjob event feed query_args. Raises TMException if one of
+    them is not valid.
+    """
+    after = _parse_int("after", query_args.get("after", "0"), 0)
+    trainingjob_id = query_args.get("trainingJobId")
+    if trainingjob_id is not None:
+        trainingjob_id = _parse_int("trainingJobId", trainingjob_id, 1)
+    return after, trainingjob_id
+
+def get_trainingjob_events_service(query_args):
+    """
+    This function returns the trainingjob events after the cursor in query_args and the cursor
+    to read the following ones with, which is the id of the last event returned.
+
+    Args:
+        query_args (dict): query parameters of the feed, after (cursor), limit and trainingJobId
+
+    Raises:
+        TMException: If a query parameter is not valid or the events could not be fetched.
+    """
+    after, trainingjob_id = parse_event_args(query_args)
+    limit = _parse_int("limit", query_args.get("limit", TRAININGMGR_CONFIG_OBJ.trainingjob_page_size), 1,
+                       TRAININGMGR_CONFIG_OBJ.trainingjob_max_page_size)
+    try:
+        events = get_trainingjob_events(after, limit, trainingjob_id)
+    except DBException as err:
+        raise TMException(f"get_trainingjob_events failed with exception : {str(err)}")
+    return events, events[-1].id if events else after
+
+def iter_training_jobs(query_args):
+    """
+    This function yields all the trainingjobs matching the filters in query_args in their sort
+    order, limit and cursor are ignored. Raises TMException if a query parameter is not valid.
+    """
+    filters, sort = _parse_listing_args(query_args)
+    return iter_trainingjobs(filters, TRAININGJOB_SORTS[sort.lstrip("-")], sort.startswith("-"),
+                             TRAININGMGR_CONFIG_OBJ.stream_chunk_size)
 
 def create_training_job(trainingjob, registered_model_dict):
     try:
@@ -83,6 +243,204 @@ def create_training_job(trainingjob, registered_model_dict):
         raise TMException(f"create_training_job failed with exception : {str(err)}")
     
 
+def _lookup(cache, key, load):
+    """
+    Returns load(), memoized in cache under key. An exception raised by load is memoized as well
+    and raised again.
+    """
+    if key not in cache:
+        try:
+            cache[key] = load()
+        except Exception as err:
+            cache[key] = err
+    if isinstance(cache[key], Exception):
+        raise cache[key]
+    return cache[key]
+
+def _run_concurrently(function, items):
+    """
+    Returns the result of function, or the exception it raised, for each of the items in order.
+    Up to trainingjob_batch_workers items are processed at once.
+    """
+    def call(item):
+        try:
+            return function(item)
+        except Exception as err:
+            return err
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(items), TRAININGMGR_CONFIG_OBJ.trainingjob_batch_workers),
+                            thread_name_prefix="trainingjob-batch") as executor:
+        return list(executor.map(call, items))
+
+def _load_trainingjob(trainingjob_json):
+    """
+    Returns the trainingjob of a training job spec, raises ValidationError or TMException if the
+    spec is not valid.
+    """
+    if not isinstance(trainingjob_json, dict) or not check_key_in_dictionary(["trainingConfig"], trainingjob_json):
+        raise TMException("The 'trainingConfig' field is missing.")
+    trainingjob_json = dict(trainingjob_json, trainingConfig=json.dumps(trainingjob_json["trainingConfig"]))
+    try:
+        trainingjob = trainingJobSchema.load(trainingjob_json)
+    except (KeyError, TypeError) as err:
+        raise TMException(f"The training job is not valid: {str(err)}")
+    if not validateTrainingConfig(trainingjob.training_config):
+        raise TMException("The provided 'trainingConfig' is not valid.")
+    return trainingjob
+
+def _resolve_trainingjob(trainingjob, registered_models, models, featuregroup_names, featuregroups):
+    """
+    Checks a loaded trainingjob against its model registered at MME and sets its model and
+    feature group name as create_training_job does, returns its featuregroup. The lookups are
+    memoized in the dicts shared by the trainingjobs of a batch.
+    """
+    key = (trainingjob.modelId.modelname, trainingjob.modelId.modelversion)
+    registered_model_list = _lookup(registered_models, key, lambda: get_modelinfo_by_modelId_service(*key))
+    if registered_model_list is None:
+        raise TMException(f"Model '{key[0]}' version '{key[1]}' is not registered at MME. Please register at MME first.")
+    registered_model_dict = registered_model_list[0]
+    if registered_model_dict["modelLocation"] != trainingjob.model_location:
+        raise TMException(f"Model '{key[0]}' version '{key[1]}' does not match the registered model location.")
+    feature_group_name = getField(trainingjob.training_config, "feature_group_name")
+    if feature_group_name == "":
+        input_data_type = registered_model_dict['modelInformation']['inputDataType']
+        feature_group_name = _lookup(featuregroup_names, input_data_type,
+                                     lambda: get_featuregroup_from_inputDataType(input_data_type))
+        trainingjob.training_config = json.dumps(setField(trainingjob.training_config, "feature_group_name",
+                                                          feature_group_name))
+    try:
+        featuregroup = _lookup(featuregroups, feature_group_name, lambda: get_featuregroup_by_name(feature_group_name))
+    except TMException as err:
+        if "No row was found when one was required" in str(err):
+            raise NoResultFound(f"No featuregroup found with featuregroup name {feature_group_name}")
+        raise
+    # The trainingjobs of a model not created yet share the model of the first one
+    trainingjob.modelId = _lookup(models, key, lambda: get_model_by_modelId(*key) or trainingjob.modelId)
+    return featuregroup
+
+def _problem(err):
+    """
+    Returns the problem details of a training job spec which could not be created because of err.
+    """
+    if isinstance(err, ValidationError):
+        return ProblemDetails(400, "Validation Error", str(err.messages)).to_dict()
+    if isinstance(err, NoResultFound):
+        return ProblemDetails(404, "Not Found", str(err)).to_dict()
+    if isinstance(err, DownstreamUnavailableException):
+        return ProblemDetails(503, "Service Unavailable", str(err)).to_dict()
+    if isinstance(err, TMException):
+        return ProblemDetails(400, "Bad Request", str(err)).to_dict()
+    return ProblemDetails(500, "Internal Server Error", str(err)).to_dict()
+
+def _data_extraction_problem(training_job_id, de_response):
+    """
+    Returns the problem details of a trainingjob of a batch whose data extraction was not started,
+    None if data extraction accepted it.
+    """
+    if isinstance(de_response, Exception):
+        LOGGER.error(f"Error starting data extraction of trainingjob {training_job_id}: {str(de_response)}")
+        return _problem(de_response)
+    if de_response.status_code == status.HTTP_200_OK:
+        return None
+    errMsg = "Data extraction responded with error code."
+    if de_response.headers.get('content-type') == MIMETYPE_JSON:
+        json_data = de_response.json()
+        if check_key_in_dictionary(["result"], json_data):
+            errMsg += json_data["result"]
+    LOGGER.error(f"{errMsg} trainingjob {training_job_id}")
+    return ProblemDetails(500, "Internal Server Error", errMsg).to_dict()
+
+def _fail_data_extractions(trainingjob_ids):
+    """
+    Fails the data extraction step of each trainingjob with a transaction of its own, for the
+    trainingjobs of a batch which could not be moved on together.
+    """
+    for training_job_id in trainingjob_ids:
+        try:
+            transition_steps(training_job_id, {Steps.DATA_EXTRACTION.name: States.FAILED.name})
+        except DBException as err:
+            LOGGER.error(f"Trainingjob {training_job_id} of a batch is left without data extraction: {str(err)}")
+
+def create_training_jobs(trainingjobs_json):
+    """
+    This function handles the service to create many training jobs at once. Each model and
+    featuregroup is looked up once for all of them. The valid training jobs are created in one
+    transaction, and then their data extractions are started concurrently.
+
+    Args:
+        trainingjobs_json (list): training job specs, as accepted by POST /training-jobs.
+
+    Returns:
+        list: result of each spec in order, with status 201, the location and the created
+              trainingjob, or the problem details of the spec. A trainingjob whose data extraction
+              could not be started or tracked is created and failed, its result has its
+              trainingJobId.
+
+    Raises:
+        TMException: If the training jobs could not be created.
+    """
+    results = [None] * len(trainingjobs_json)
+    trainingjobs = []
+    for index, trainingjob_json in enumerate(trainingjobs_json):
+        try:
+            trainingjobs.append((index, _load_trainingjob(trainingjob_json)))
+        except Exception as err:
+            results[index] = _problem(err)
+
+    model_keys = list({(trainingjob.modelId.modelname, trainingjob.modelId.modelversion)
+                       for _, trainingjob in trainingjobs})
+    registered_models = dict(zip(model_keys, _run_concurrently(lambda key: get_modelinfo_by_modelId_service(*key),
+                                                               model_keys)))
+    models, featuregroup_names, featuregroups = {}, {}, {}
+    valid = []
+    for index, trainingjob in trainingjobs:
+        try:
+            featuregroup = _resolve_trainingjob(trainingjob, registered_models, models, featuregroup_names,
+                                                featuregroups)
+            valid.append((index, trainingjob, featuregroup))
+        except Exception as err:
+            results[index] = _problem(err)
+
+    try:
+        create_trainingjobs([trainingjob for _, trainingjob, _ in valid])
+    except DBException as err:
+        raise TMException(f"create_training_jobs failed with exception : {str(err)}")
+
+    extractions = []
+    for index, trainingjob, featuregroup in valid:
+        results[index] = {"status": 201, "location": "ai-ml-model-training/v1/training-jobs/" + str(trainingjob.id),
+                          "trainingJob": trainingJobSchema.dump(trainingjob)}
+        extractions.append((index, trainingjob.id, data_extraction_args(trainingjob.id, trainingjob.training_config,
+                                                                        featuregroup)))
+    LOGGER.debug(f"Created {len(valid)} of {len(trainingjobs_json)} trainingjobs, starting their data extractions")
+    de_responses = _run_concurrently(lambda args: data_extraction_start(*args), [args for _, _, args in extractions])
+    started, failed = [], []
+    for (index, training_job_id, _), de_response in zip(extractions, de_responses):
+        problem = _data_extraction_problem(training_job_id, de_response)
+        if problem is None:
+            started.append((index, training_job_id))
+        else:
+            results[index] = dict(problem, trainingJobId=training_job_id)
+            failed.append(training_job_id)
+    # The trainingjobs move on together rather than with a transaction each
+    try:
+        transition_steps_of_trainingjobs(failed, {Steps.DATA_EXTRACTION.name: States.FAILED.name})
+        transition_steps_of_trainingjobs([training_job_id for _, training_job_id in started],
+                                         {Steps.DATA_EXTRACTION.name: States.IN_PROGRESS.name})
+        add_data_extraction_jobs([training_job_id for _, training_job_id in started])
+    except DBException as err:
+        # Each update rolled back on its own, the trainingjobs are failed one by one so that none is
+        # left not started, or in progress without status checks
+        LOGGER.error(f"Error moving the trainingjobs of a batch to data extraction: {str(err)}")
+        for index, training_job_id in started:
+            results[index] = dict(_problem(err), trainingJobId=training_job_id)
+        _fail_data_extractions(failed + [training_job_id for _, training_job_id in started])
+        return results
+    for _, training_job_id in started:
+        notification_rapp(training_job_id)
+    return results
+
 def delete_training_job(training_job_id : int):
     """
     This function handles the service to delete the training job resource by id.
@@ -109,10 +467,9 @@ def delete_training_job(training_job_id : int):
         if overall_status == States.IN_PROGRESS.name:
             step_in_progress_state = get_step_in_progress_state(steps_state)
             if step_in_progress_state == Steps.DATA_EXTRACTION:
-                pass
-                # TODO: Remove the job from DATAEXTRACTION_JOBS_CACHE to signal not to check its status
-                # with LOCK:
-                #     DATAEXTRACTION_JOBS_CACHE.pop(trainingjob_name)
+                # Signal the lifecycle workers not to check its status nor start its training pipeline
+                remove_work(training_job_id, WorkActions.POLL_DATA_EXTRACTION.name)
+                remove_work(training_job_id, WorkActions.START_PIPELINE.name)
             elif (step_in_progress_state == Steps.TRAINING or (step_in_progress_state == Steps.DATA_EXTRACTION_AND_TRAINING and tj.run_id is not None)):
                 # Signal the Kf-Adapter to terminate the 
                 response = terminate_training_service(tj.run_id)
@@ -125,10 +482,30 @@ def delete_training_job(training_job_id : int):
             return False
     except NoResultFound :
         return False
+    except DownstreamUnavailableException:
+        raise
     except Exception as err :
         raise DBException(f"delete_trainining_job failed with exception : {str(err)}")
 
 
+def delete_training_jobs(trainingjob_ids):
+    """
+    This function marks the training jobs as being deleted and queues their deletion, which the
+    lifecycle workers then do as delete_training_job does.
+
+    Args:
+        trainingjob_ids (list): ids of the training jobs.
+
+    Returns:
+        tuple: ids of the training jobs whose deletion is queued and ids of those which do not exist.
+
+    Raises:
+        DBException: If there error during operation.
+    """
+    accepted = mark_trainingjobs_for_deletion(trainingjob_ids)
+    add_deletion_jobs(accepted)
+    return accepted, sorted(set(trainingjob_ids) - set(accepted))
+
 def get_steps_state(trainingjob_id):
     try:    
         trainingjob = get_trainingjob(trainingjob_id)
@@ -148,6 +525,16 @@ def change_status_tj_dif(trainingjob_id, step:str, state:str):
     except DBException as err:
         raise TMException(f"change status of tj dif failed with exception : {str(err)}")
 
+def transition_status_tj(trainingjob_id, changes:dict, expected:dict=None):
+    """
+    Applies several step changes of a trainingjob at once, only if its steps are still in the
+    expected states. Returns False if they are not (another update got in first).
+    """
+    try:
+        return transition_steps(trainingjob_id, changes, expected)
+    except DBException as err:
+        raise TMException(f"transition status of tj failed with exception : {str(err)}")
+
 
 def change_update_field_value(trainingjob_id, field, value):
     try:
@@ -170,10 +557,29 @@ def update_artifact_version(trainingjob_id, artifact_version : str, level : str)
         new_artifact_version = f'{major}.{minor}.{patch}'
         
         changeartifact(trainingjob_id, new_artifact_version)
+        model_id = get_trainingjob(trainingjob_id).modelId
+        invalidate_modelinfo_service(model_id.modelname, model_id.modelversion)
         return f'{major}.{minor}.{patch}'
     except Exception as err:
         raise TMException(f"failed to update_artifact_version with exception : {str(err)}")
     
+def data_extraction_args(training_job_id, training_config, featuregroup):
+    """
+    This function returns the arguments of data_extraction_start which extract the features of
+    featuregroup for the trainingjob.
+    """
+    influxdb_info_dic={}
+    influxdb_info_dic["host"]=featuregroup.host
+    influxdb_info_dic["port"]=featuregroup.port
+    influxdb_info_dic["bucket"]=featuregroup.bucket
+    influxdb_info_dic["token"]=featuregroup.token
+    influxdb_info_dic["db_org"] = featuregroup.db_org
+    influxdb_info_dic["source_name"]= featuregroup.source_name
+    query_filter = getField(training_config, "query_filter")
+    datalake_source = {featuregroup.datalake_source: {}} # Datalake source should be taken from FeatureGroup (not TrainingJob)
+    return (TRAININGMGR_CONFIG_OBJ, training_job_id, featuregroup.feature_list, query_filter, datalake_source,
+            featuregroup.measurement, influxdb_info_dic, featuregroup.featuregroup_name)
+
 def training(trainingjob):
     """
     Rest end point to start training job.
@@ -207,21 +613,9 @@ def training(trainingjob):
         featuregroup_name = getField(trainingjob.training_config, "feature_group_name")
         featuregroup= get_featuregroup_by_name(featuregroup_name)
         LOGGER.debug("featuregroup name is: "+featuregroup.featuregroup_name)
-        feature_list_string = featuregroup.feature_list
-        influxdb_info_dic={}
-        influxdb_info_dic["host"]=featuregroup.host
-        influxdb_info_dic["port"]=featuregroup.port
-        influxdb_info_dic["bucket"]=featuregroup.bucket
-        influxdb_info_dic["token"]=featuregroup.token
-        influxdb_info_dic["db_org"] = featuregroup.db_org
-        influxdb_info_dic["source_name"]= featuregroup.source_name
-        _measurement = featuregroup.measurement
-        query_filter = getField(trainingjob.training_config, "query_filter")
-        datalake_source = {featuregroup.datalake_source: {}} # Datalake source should be taken from FeatureGroup (not TrainingJob)
         LOGGER.debug('Starting Data Extraction...')
-        de_response = data_extraction_start(TRAININGMGR_CONFIG_OBJ, training_job_id,
-                                        feature_list_string, query_filter, datalake_source,
-                                        _measurement, influxdb_info_dic, featuregroup.featuregroup_name)
+        de_response = data_extraction_start(*data_extraction_args(training_job_id, trainingjob.training_config,
+                                                                   featuregroup))
         if (de_response.status_code == status.HTTP_200_OK ):
             LOGGER.debug("Response from data extraction for " + \
                     str(training_job_id) + " : " + json.dumps(de_response.json()))
@@ -229,8 +623,7 @@ def training(trainingjob):
                                 Steps.DATA_EXTRACTION.name,
                                 States.IN_PROGRESS.name)
             notification_rapp(trainingjob.id)
-            with LOCK:
-                DATAEXTRACTION_JOBS_CACHE[trainingjob.id] = "Scheduled"
+            add_data_extraction_job(trainingjob.id)
         elif( de_response.headers['content-type'] == MIMETYPE_JSON ) :
             errMsg = "Data extraction responded with error code."
             LOGGER.error(errMsg)
@@ -249,6 +642,10 @@ def training(trainingjob):
                 return jsonify({
                     "message": "failed data extraction"
                 }), 500
+    except DownstreamUnavailableException as err:
+        LOGGER.error(str(err))
+        change_state_to_failed(training_job_id)
+        return ProblemDetails(503, "Service Unavailable", str(err)).to_json()
     except TMException as err:
         change_state_to_failed(training_job_id)
         if "No row was found when one was required" in str(err):
@@ -266,6 +663,79 @@ def training(trainingjob):
     response.headers['Location'] = "ai-ml-model-training/v1/training-jobs/" + str(training_job_id)
     return response, 201
 
+
+def start_training_pipeline(trainingjob):
+    """
+    Starts the training (or retraining) pipeline of a trainingjob whose data extraction is finished
+    and moves the trainingjob from DATA_EXTRACTION_AND_TRAINING to TRAINING.
+
+    Args in function:
+        trainingjob: TrainingJob
+            trainingjob whose data extraction is finished.
+
+    Returns:
+        run_id: str
+            id of the pipeline run started by kf-adapter.
+
+    Exceptions:
+        APIException when the model is not registered at MME or the retraining pipeline is not provided,
+        TMException when kf-adapter did not schedule the pipeline run.
+    """
+    trainingjob_id = trainingjob.id
+    featuregroup_name = getField(trainingjob.training_config, "feature_group_name")
+    argument_dict = getField(trainingjob.training_config, "arguments")
+
+    argument_dict["trainingjob_id"] = trainingjob_id
+    argument_dict["featuregroup_name"] = featuregroup_name
+    argument_dict["modelName"] = trainingjob.modelId.modelname
+    argument_dict["modelVersion"] = trainingjob.modelId.modelversion
+    argument_dict["modellocation"] = trainingjob.model_location
+
+    # Arguments values must be of type string
+    for key, val in argument_dict.items():
+        if not isinstance(val, str):
+            argument_dict[key] = str(val)
+    LOGGER.debug(argument_dict)
+
+    model_id = trainingjob.modelId
+    registered_model_list = get_modelinfo_by_modelId_service(model_id.modelname, model_id.modelversion)
+    if registered_model_list is None:
+        raise APIException(status.HTTP_400_BAD_REQUEST, f"Model Name = {model_id.modelname} and Model Version = {model_id.modelversion} is not registered at MME, Please first register at MME and then continue")
+
+    registered_model_dict = registered_model_list[0]
+    if registered_model_dict["modelId"]["artifactVersion"] == "0.0.0" and registered_model_dict["modelLocation"] == "":
+        pipeline_name, pipeline_version = fetch_pipelinename_and_version("training", trainingjob.training_config)
+    else:
+        pipeline_name, pipeline_version = fetch_pipelinename_and_version("re-training", trainingjob.training_config)
+        if pipeline_name == "" or pipeline_version == "":
+            raise APIException(status.HTTP_500_INTERNAL_SERVER_ERROR, "Provide retraining pipeline name and version")
+
+    # Experiment name is harded to be Default
+    training_details = {
+        "pipeline_name": pipeline_name, "experiment_name": 'Default',
+        "arguments": argument_dict, "pipeline_version": pipeline_version
+    }
+    LOGGER.debug("training detail for kf adapter is: "+ str(training_details))
+    response = training_start(TRAININGMGR_CONFIG_OBJ, training_details, trainingjob_id)
+    if (response.headers['content-type'] != MIMETYPE_JSON
+            or response.status_code != status.HTTP_200_OK):
+        raise TMException("Kf adapter invalid content-type or status_code for " + str(trainingjob_id))
+
+    json_data = response.json()
+    LOGGER.debug("response from kf_adapter for " + str(trainingjob_id) + " : " + json.dumps(json_data))
+    if not check_key_in_dictionary(["run_status", "run_id"], json_data):
+        err_msg = "Kf adapter invalid response from , key not present ,run_status or  run_id for " + str(trainingjob_id)
+        LOGGER.error(err_msg)
+        raise TMException(err_msg)
+    if json_data["run_status"] != 'scheduled':
+        raise TMException("KF Adapter- run_status in not scheduled")
+
+    transition_status_tj(trainingjob_id, {Steps.DATA_EXTRACTION_AND_TRAINING.name: States.FINISHED.name,
+                                          Steps.TRAINING.name: States.IN_PROGRESS.name})
+    LOGGER.debug("DATA_EXTRACTION_AND_TRAINING step set to FINISHED and TRAINING step set to IN_PROGRESS for training job " + str(trainingjob_id))
+    change_update_field_value(trainingjob_id, "run_id", json_data["run_id"])
+    return json_data["run_id"]
+
     
 def fetch_pipelinename_and_version(type, training_config):
     try:
@@ -283,6 +753,9 @@ def fetch_trainingjob_infos_from_model_id(model_name, model_version):
         return trainingjob_infos
     except Exception as err:
         raise TMException(f"Can't fetch trainingjob_infos from model_name {model_name} and model_version {model_version}| Error: " + str(err))
+
+def iter_trainingjob_infos_from_model_id(model_name, model_version):
+    return iter_trainingjobs_by_model_id_db(model_name, model_version, TRAININGMGR_CONFIG_OBJ.stream_chunk_size)
     
     
 def update_model_metrics_service(trainingjob_id, model_metrics):
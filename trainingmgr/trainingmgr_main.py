@@ -28,24 +28,31 @@ import requests
 from flask_cors import CORS
 from trainingmgr.db.trainingjob_db import change_state_to_failed
 from modelmetricsdk.model_metrics_sdk import ModelMetricsSdk
-from trainingmgr.common.trainingmgr_operations import  notification_rapp, training_start, delete_dme_filtered_data_job
+from trainingmgr.common.trainingmgr_operations import  notification_rapp, delete_dme_filtered_data_job
 from trainingmgr.common.trainingmgr_config import TrainingMgrConfig
 from trainingmgr.common.trainingmgr_util import check_key_in_dictionary, \
     get_feature_group_by_name, edit_feature_group_by_name
-from trainingmgr.common.exceptions_utls import APIException,TMException
+from trainingmgr.common.exceptions_utls import APIException,TMException,DownstreamUnavailableException
 from trainingmgr.constants.steps import Steps
 from trainingmgr.constants.states import States
 from trainingmgr.db.trainingmgr_ps_db import PSDB
+from trainingmgr.db.pool_db import engine_options, monitor_pool, warm_pool
+from trainingmgr.db.schema_db import MIGRATIONS_DIR, database_uri, ensure_schema
 from trainingmgr.models import db
 from trainingmgr.schemas import TrainingJobSchema , FeatureGroupSchema
+from trainingmgr.schemas.problemdetail_schema import ProblemDetails
 from trainingmgr.db.featuregroup_db import get_feature_group_by_name_db, delete_feature_group_by_name
 from trainingmgr.controller import featuregroup_controller, training_job_controller
 from trainingmgr.controller.pipeline_controller import pipeline_controller
 from trainingmgr.controller.agent_controller import agent_controller
+from trainingmgr.controller.admin_controller import admin_controller
 from trainingmgr.common.trainingConfig_parser import getField
-from trainingmgr.handler.async_handler import start_async_handler
-from trainingmgr.service.mme_service import get_modelinfo_by_modelId_service
-from trainingmgr.service.training_job_service import change_status_tj, change_update_field_value, fetch_pipelinename_and_version, get_training_job
+from trainingmgr.handler.async_handler import start_async_handler, handle_data_extraction_task_status, \
+    defer_data_extraction_job, retry_training_pipeline_start, add_model_url_job
+from trainingmgr.handler.notification_handler import start_notification_handler
+from trainingmgr.handler.status_stream_handler import start_status_stream_handler
+from trainingmgr.service.training_job_service import get_training_job, \
+    start_training_pipeline, transition_status_tj
 
 APP = Flask(__name__)
 TRAININGMGR_CONFIG_OBJ = TrainingMgrConfig()
@@ -55,6 +62,7 @@ APP.register_blueprint(featuregroup_controller, url_prefix='/ai-ml-model-trainin
 APP.register_blueprint(training_job_controller, url_prefix='/ai-ml-model-training/v1')
 APP.register_blueprint(agent_controller, url_prefix="/experiment/agent")
 APP.register_blueprint(pipeline_controller)
+APP.register_blueprint(admin_controller)
 
 PS_DB_OBJ = None
 LOGGER = None
@@ -155,81 +163,19 @@ def data_extraction_notification():
             
         trainingjob_id = request.json["trainingjob_id"]
         trainingjob = get_training_job(trainingjob_id)
-        featuregroup_name = getField(trainingjob.training_config, "feature_group_name")
-        argument_dict = getField(trainingjob.training_config, "arguments")
-
-        # argument_dict = ast.literal_eval(arguments)
-
-        argument_dict["trainingjob_id"] = trainingjob_id
-        argument_dict["featuregroup_name"] = featuregroup_name
-        argument_dict["modelName"] = trainingjob.modelId.modelname
-        argument_dict["modelVersion"] = trainingjob.modelId.modelversion
-        argument_dict["modellocation"] = trainingjob.model_location
-
-        # Arguments values must be of type string
-        for key, val in argument_dict.items():
-            if not isinstance(val, str):
-                argument_dict[key] = str(val)
-        LOGGER.debug(argument_dict)
-        # Experiment name is harded to be Default
-
-        model_id = trainingjob.modelId
-        registered_model_list = get_modelinfo_by_modelId_service(model_id.modelname, model_id.modelversion)
-
-        if registered_model_list is None:
-            return jsonify({"Exception":f"Model Name = {model_id.modelname} and Model Version = {model_id.modelversion} is not registered at MME, Please first register at MME and then continue"}), status.HTTP_400_BAD_REQUEST
-
-        registered_model_dict = registered_model_list[0]
-
-        pipeline_name =""
-        pipeline_version =""
-        if registered_model_dict["modelId"]["artifactVersion"] == "0.0.0":
-            if registered_model_dict["modelLocation"] == "":
-                pipeline_name, pipeline_version = fetch_pipelinename_and_version("training", trainingjob.training_config)
-            else:
-                pipeline_name, pipeline_version = fetch_pipelinename_and_version("re-training", trainingjob.training_config)
-                if pipeline_name == "" or  pipeline_version =="":
-                    return jsonify({"Error": "Provide retraining pipeline name and version"}), 500
-        else:
-            pipeline_name, pipeline_version = fetch_pipelinename_and_version("re-training", trainingjob.training_config)
-            if pipeline_name == "" or  pipeline_version =="":
-                return jsonify({"Error": "Provide retraining pipeline name and version"}), 500
-
-        training_details = {
-            "pipeline_name": pipeline_name, "experiment_name": 'Default',
-            "arguments": argument_dict, "pipeline_version": pipeline_version
-        }
-        LOGGER.debug("training detail for kf adapter is: "+ str(training_details))
-        response = training_start(TRAININGMGR_CONFIG_OBJ, training_details, trainingjob_id)
-        if ( response.headers['content-type'] != MIMETYPE_JSON 
-                or response.status_code != status.HTTP_200_OK ):
-            err_msg = "Kf adapter invalid content-type or status_code for " + str(trainingjob_id)
-            raise TMException(err_msg)
-        
-        LOGGER.debug("response from kf_adapter for " + \
-                    str(trainingjob_id) + " : " + json.dumps(response.json()))
-        json_data = response.json()
-        
-        if not check_key_in_dictionary(["run_status", "run_id"], json_data):
-            err_msg = "Kf adapter invalid response from , key not present ,run_status or  run_id for " + str(trainingjob_id)
-            Logger.error(err_msg)
-            raise TMException(err_msg)
-
-        if json_data["run_status"] == 'scheduled':
-            change_status_tj(trainingjob.id,
-                            Steps.DATA_EXTRACTION_AND_TRAINING.name,
-                            States.FINISHED.name)
-            LOGGER.debug("DATA_EXTRACTION_AND_TRAINING step set to FINISHED for training job " + str(trainingjob.id))
-            change_status_tj(trainingjob.id,
-                            Steps.TRAINING.name,
-                            States.IN_PROGRESS.name)
-            LOGGER.debug("TRAINING step set to IN_PROGRESS for training job " + str(trainingjob.id))
-            change_update_field_value(trainingjob.id,
-                                     "run_id", 
-                                     json_data["run_id"])
-            # notification_rapp(trainingjob, TRAININGMGR_CONFIG_OBJ)
-        else:
-            raise TMException("KF Adapter- run_status in not scheduled")
+        start_training_pipeline(trainingjob)
+    except APIException as err:
+        LOGGER.error(f"DataExtraction Notification failed due to {err.message}")
+        key = "Exception" if err.code == status.HTTP_400_BAD_REQUEST else "Error"
+        return jsonify({key: err.message}), err.code
+    except DownstreamUnavailableException as err:
+        # No request was sent, the start is retried in the background as when it is started there
+        LOGGER.error(f"DataExtraction Notification failed due to {str(err)}")
+        try:
+            retry_training_pipeline_start(trainingjob.id)
+        except Exception as e:
+            LOGGER.error(f"failed to queue the training pipeline start of trainingjob {trainingjob.id} due to {str(e)}")
+        return ProblemDetails(503, "Service Unavailable", str(err)).to_json()
     except requests.exceptions.ConnectionError as err:
         LOGGER.error(f"DataExtraction Notification failed due to {str(err)}")
         try:
@@ -254,12 +200,78 @@ def data_extraction_notification():
                                     status=status.HTTP_200_OK,
                                     mimetype=MIMETYPE_JSON)
 
+@APP.route('/trainingjob/dataExtractionStatusNotification', methods=['POST'])
+def data_extraction_status_notification():
+    """
+    This rest endpoint will be invoked by data extraction to report the status of the
+    data extraction task of a trainingjob. A final status (Completed or Error) moves the
+    trainingjob forward right away, any other status only tells the async handler that
+    the task is alive so that it does not need to be polled.
+
+    Args in function:
+        None
+
+    Args in json:
+        trainingjob_id: str
+            id of trainingjob.
+        task_status: str
+            status of the data extraction task (Completed, Error or any in-progress status).
+
+    Returns:
+        json:
+            result: str
+                result message
+        status code:
+            HTTP status code 200
+
+    Exceptions:
+        all exception are provided with exception message and HTTP status code.
+    """
+    request_json = request.get_json(silent=True)
+    LOGGER.debug("Data extraction status notification: %s", json.dumps(request_json))
+    try:
+        if not isinstance(request_json, dict) or \
+                not check_key_in_dictionary(["trainingjob_id", "task_status"], request_json):
+            err_msg = "trainingjob_id or task_status key not available in request"
+            LOGGER.error(err_msg)
+            return {"Exception": err_msg}, status.HTTP_400_BAD_REQUEST
+
+        trainingjob_id = request_json["trainingjob_id"]
+        task_status = request_json["task_status"]
+        # The id is sent as a number or as a string of digits
+        if isinstance(trainingjob_id, bool) or not (isinstance(trainingjob_id, int) or
+                                                    (isinstance(trainingjob_id, str) and trainingjob_id.isdigit())):
+            err_msg = f"trainingjob_id {trainingjob_id} is not a training job id"
+            LOGGER.error(err_msg)
+            return {"Exception": err_msg}, status.HTTP_400_BAD_REQUEST
+        if not isinstance(task_status, str):
+            err_msg = "task_status must be a string"
+            LOGGER.error(err_msg)
+            return {"Exception": err_msg}, status.HTTP_400_BAD_REQUEST
+        trainingjob_id = int(trainingjob_id)
+        trainingjob = get_training_job(trainingjob_id)
+        if trainingjob is None:
+            return {"Exception": f"Training job with ID {trainingjob_id} does not exist."}, status.HTTP_404_NOT_FOUND
+
+        if handle_data_extraction_task_status(APP, trainingjob, task_status):
+            result = f"data extraction status {task_status} is handled"
+        else:
+            defer_data_extraction_job(trainingjob_id)
+            result = f"data extraction status {task_status} is noted"
+    except Exception as err:
+        LOGGER.error("Data extraction status notification failed, " + str(err))
+        return {"Exception": str(err)}, status.HTTP_500_INTERNAL_SERVER_ERROR
+
+    return APP.response_class(response=json.dumps({"result": result}),
+                              status=status.HTTP_200_OK,
+                              mimetype=MIMETYPE_JSON)
+
 # Will be migrated to pipline Mgr in next iteration
 @APP.route('/trainingjob/pipelineNotification', methods=['POST'])
 def pipeline_notification():
     """
-    Function handling rest endpoint to get notification from kf_adapter and set model download
-    url in database(if it presents in model db).
+    Function handling rest endpoint to get notification from kf_adapter and queue setting the
+    model download url in database(once it presents in model db).
 
     Args in function: none
 
@@ -275,7 +287,8 @@ def pipeline_notification():
             result: str
                 result message
         status:
-            HTTP status code 200
+            HTTP status code 200, 409 if the training of the trainingjob is not in progress
+            (the notification was already handled)
 
     Exceptions:
         all exception are provided with exception message and HTTP status code.
@@ -287,58 +300,30 @@ def pipeline_notification():
         trainingjob_id = request.json["trainingjob_id"]
         run_status = request.json["run_status"]
 
-        if run_status == 'SUCCEEDED':
-
-            trainingjob=get_training_job(trainingjob_id)
+        trainingjob=get_training_job(trainingjob_id)
+        # Only the notification which finds the training step still in progress moves the trainingjob on,
+        # all the step changes are applied together
+        in_training = {Steps.TRAINING.name: States.IN_PROGRESS.name}
 
-            change_status_tj(trainingjob_id,
-                            Steps.TRAINING.name,
-                            States.FINISHED.name)
-            
-            change_status_tj(trainingjob_id,
-                            Steps.TRAINING_AND_TRAINED_MODEL.name,
-                            States.IN_PROGRESS.name)
-            
-            notification_rapp(trainingjob.id)
+        if run_status == 'SUCCEEDED':
+            applied = transition_status_tj(trainingjob_id,
+                                           {Steps.TRAINING.name: States.FINISHED.name,
+                                            Steps.TRAINING_AND_TRAINED_MODEL.name: States.FINISHED.name,
+                                            Steps.TRAINED_MODEL.name: States.IN_PROGRESS.name},
+                                           expected=in_training)
+            if not applied:
+                LOGGER.warning("Pipeline notification ignored, training is not in progress for " + str(trainingjob_id))
+                return jsonify({"Error":"Training is not in progress"}), 409
 
-            change_status_tj(trainingjob_id,
-                            Steps.TRAINING_AND_TRAINED_MODEL.name,
-                            States.FINISHED.name)
-            change_status_tj(trainingjob_id,
-                            Steps.TRAINED_MODEL.name,
-                            States.IN_PROGRESS.name)
-            
             notification_rapp(trainingjob.id)
 
-            model_name= trainingjob.modelId.modelname
-            model_version= trainingjob.modelId.modelversion
-
-            modelinfo = get_modelinfo_by_modelId_service(model_name, model_version)[0]
-            artifactversion = modelinfo["modelId"]["artifactVersion"]
-            if MM_SDK.check_object(model_name, model_version, artifactversion, "Model.zip"):
-                model_url = "http://" + str(TRAININGMGR_CONFIG_OBJ.my_ip) + ":" + \
-                            str(TRAININGMGR_CONFIG_OBJ.my_port) + "/model/" + \
-                            model_name + "/" + str(model_version) + "/" + str(artifactversion) + "/Model.zip"
-
-                change_update_field_value(trainingjob_id, "model_url" , model_url)
-                
-                change_status_tj(trainingjob_id,
-                                Steps.TRAINED_MODEL.name,
-                                States.FINISHED.name)
-                notification_rapp(trainingjob.id)
-            else:
-                errMsg = "Trained model is not available  "
-                LOGGER.error(errMsg + str(trainingjob_id))
-                change_status_tj(trainingjob_id,
-                                Steps.TRAINED_MODEL.name,
-                                States.FAILED.name)
-                notification_rapp(trainingjob.id)
-                raise TMException(errMsg + str(trainingjob_id))
+            # The model url is set by the lifecycle work queue once the trained model is available
+            add_model_url_job(trainingjob_id)
         else:
             LOGGER.error("Pipeline notification -Training failed " + str(trainingjob_id)) 
-            change_status_tj(trainingjob_id,
-                            Steps.TRAINING.name,
-                            States.FAILED.name)
+            transition_status_tj(trainingjob_id,
+                                 {Steps.TRAINING.name: States.FAILED.name},
+                                 expected=in_training)
             notification_rapp(trainingjob.id)
             raise TMException("Pipeline not successful for " + \
                                         str(trainingjob_id) + \
@@ -528,26 +513,53 @@ def delete_list_of_feature_group():
         mimetype='application/json')
 
 
+def init_training_manager():
+    """
+    Function for loading the configuration, migrating the database schema and starting the
+    background handlers of the training manager.
+
+    Args:None
+
+    Returns:
+        APP: Flask
+            the training manager application, ready to be served.
+
+    Exceptions:
+        TMException when not all configuration is loaded.
+    """
+    global LOGGER, PS_DB_OBJ, MM_SDK
+    if TRAININGMGR_CONFIG_OBJ.is_config_loaded_properly() is False:
+        raise TMException("Not all configuration loaded.")
+    LOGGER = TRAININGMGR_CONFIG_OBJ.logger
+    PS_DB_OBJ = PSDB(TRAININGMGR_CONFIG_OBJ)
+    APP.config['SQLALCHEMY_DATABASE_URI'] = database_uri(TRAININGMGR_CONFIG_OBJ)
+    APP.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(TRAININGMGR_CONFIG_OBJ)
+    db.init_app(APP)
+    migrate = Migrate(APP, db, directory=MIGRATIONS_DIR)
+    with APP.app_context():
+        monitor_pool(db.engine, TRAININGMGR_CONFIG_OBJ.db_max_overflow)
+        # Only reads the schema revision unless the schema is outdated
+        if ensure_schema(TRAININGMGR_CONFIG_OBJ, TRAININGMGR_CONFIG_OBJ.schema_migration_on_startup):
+            LOGGER.info("Migrated the database schema")
+        # The legacy queries share the pool of the sessions, which is filled before serving
+        PS_DB_OBJ.attach_engine(db.engine)
+        warm_pool(db.engine, TRAININGMGR_CONFIG_OBJ.db_pool_size)
+    # Every process (each worker of the WSGI server) runs its own handlers, the leader tasks
+    # run in only one of them and the lifecycle work is claimed through the database
+    start_async_handler(APP,db)
+    start_notification_handler()
+    start_status_stream_handler(APP)
+    MM_SDK = ModelMetricsSdk()
+    list_allow_control_access_origin = TRAININGMGR_CONFIG_OBJ.allow_control_access_origin.split(',')
+    CORS(APP, resources={r"/*": {"origins": list_allow_control_access_origin}})
+    return APP
+
+
 if __name__ == "__main__":
+    # Development server, use trainingmgr.wsgi with gunicorn in production
     try:
-        if TRAININGMGR_CONFIG_OBJ.is_config_loaded_properly() is False:
-            raise TMException("Not all configuration loaded.")
-        LOGGER = TRAININGMGR_CONFIG_OBJ.logger
-        PS_DB_OBJ = PSDB(TRAININGMGR_CONFIG_OBJ)
-        APP.config['SQLALCHEMY_DATABASE_URI']=f'postgresql+psycopg2://{TRAININGMGR_CONFIG_OBJ.ps_user}:{TRAININGMGR_CONFIG_OBJ.ps_password}@{TRAININGMGR_CONFIG_OBJ.ps_ip}:{TRAININGMGR_CONFIG_OBJ.ps_port}/training_manager_database'
-        db.init_app(APP)
-        # Todo add flask db upgrade in the docker file
-        migrate = Migrate(APP, db) 
-        with APP.app_context():
-            db.create_all()
-        start_async_handler(APP,db)
-        # LOCK = Lock()
-        # DATAEXTRACTION_JOBS_CACHE = get_data_extraction_in_progress_trainingjobs(PS_DB_OBJ)
-        # threading.Thread(target=try2, daemon=True).start()
-        MM_SDK = ModelMetricsSdk()
-        list_allow_control_access_origin = TRAININGMGR_CONFIG_OBJ.allow_control_access_origin.split(',')
-        CORS(APP, resources={r"/*": {"origins": list_allow_control_access_origin}})
+        init_training_manager()
         LOGGER.debug("Starting AIML-WF training manager .....")
-        APP.run(debug=True, port=int(TRAININGMGR_CONFIG_OBJ.my_port), host='0.0.0.0')
+        APP.run(debug=True, use_reloader=False, port=int(TRAININGMGR_CONFIG_OBJ.my_port), host='0.0.0.0')
     except TMException as err:
         print("Startup failure" + str(err))